@@ -11,7 +11,9 @@ from IGitt.GitHub.GitHubIssue import GitHubIssue
 from IGitt.GitHub.GitHubMergeRequest import GitHubMergeRequest
 from IGitt.GitHub.GitHubRepository import GitHubRepository
 from IGitt.GitHub.GitHubUser import GitHubUser
+from IGitt.Interfaces import cache_key
 from IGitt.Interfaces import get
+from IGitt.Interfaces import iter_get
 from IGitt.Interfaces.Actions import IssueActions, MergeRequestActions, \
     PipelineActions, InstallationActions
 from IGitt.Interfaces.Comment import CommentType
@@ -107,7 +109,7 @@ class GitHub(GitHubMixin, Hoster):
         return webhook['repository']['full_name']
 
     @staticmethod
-    def raw_search(token, raw_query):
+    def raw_search(token, raw_query, limit=None):
         """
         Handles a GitHub search.
 
@@ -116,13 +118,14 @@ class GitHub(GitHubMixin, Hoster):
 
         :param token:        A GitHubToken object to use for authentication.
         :param raw_query:    A string with the search query following syntax.
+        :param limit:        The maximum number of results to yield, all of
+                             them if None.
         :yields:             Search results as GitHubIssue(...) and
                              GitHubMergeRequest(...) objects for Issues and
                              Merge Requests respectively.
         """
-        query_params = {'q': raw_query,
-                        'per_page': '100'}
-        resp = get(token, GitHub.absolute_url('/search/issues'), query_params)
+        resp = iter_get(token, GitHub.absolute_url('/search/issues'),
+                        {'q': raw_query}, limit=limit)
 
         issue_url_re = re.compile(
             r'https://(?:.+)/(\S+)/(\S+)/(issues|pull)/(\d+)')
@@ -293,7 +296,7 @@ class GitHub(GitHubMixin, Hoster):
 
         for obj in objects:
             item = obj[1][0]
-            Cache.update(item.url, {
+            Cache.update(cache_key(item._token, item.url), {
                 'fromWebhook': True,
                 'data': item.data.get(),
             })
@@ -1,17 +1,25 @@
 """
 Contains the abstraction for a commit in GitHub.
 """
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import List
 from typing import Optional
 from typing import Set
+from typing import Tuple
 
 from IGitt import ElementDoesntExistError
 from IGitt.GitHub import GitHubMixin, GitHubToken
 from IGitt.GitHub.GitHubComment import GitHubComment
 from IGitt.GitHub.GitHubRepository import GitHubRepository
 from IGitt.GitHub.GitHubIssue import GitHubIssue
-from IGitt.Interfaces import get, post
+from IGitt.Interfaces import aget, get, iter_lines, post
 from IGitt.Interfaces.Comment import CommentType
 from IGitt.Interfaces.Commit import Commit
+from IGitt.Interfaces.Commit import CommentOutcome
+from IGitt.Interfaces.Commit import MAX_COMMENT_WORKERS
+from IGitt.Interfaces.Commit import PatchIndex
 from IGitt.Interfaces.CommitStatus import CommitStatus, Status
 
 GH_STATE_TRANSLATION = {Status.ERROR: 'error', Status.FAILED: 'failure',
@@ -71,32 +79,14 @@ def get_diff_index(patch, line_nr):
     :param line_nr: The line number to identify.
     :return: The position in the Patch or None
     """
-    patch = patch.splitlines(True)
-    current_line_added = 0
-    current_diff_index = 0
-    for line in patch:
-        if line.startswith('---') or line.startswith('+++'):
-            continue
-
-        if line.startswith('@@'):
-            values = line[line.find('-'):line.find(' @@', 3)]
-            _, added = tuple(values.split(' '))
-            current_line_added = int(added.split(',')[0][1:])
-        elif line.startswith('+') or line.startswith(' '):
-            if current_line_added == line_nr:
-                return current_diff_index
-
-            current_line_added += 1
-
-        current_diff_index += 1
-
-    return None
+    return PatchIndex(patch).position(line_nr)
 
 
 class GitHubCommit(GitHubMixin, Commit):
     """
     Represents a commit on GitHub.
     """
+    keyword_regexes = GITHUB_KEYWORD_REGEX
 
     def __init__(self, token: GitHubToken, repository: str, sha: str):
         """
@@ -207,9 +197,23 @@ class GitHubCommit(GitHubMixin, Commit):
         :return: A (frozen)set of CommitStatus objects.
         :raises RuntimeError: If something goes wrong (network, auth...).
         """
-        url = self.url + '/statuses'
-        statuses = get(self._token, url)
+        return self._statuses(get(self._token, self.url + '/statuses'))
+
+    async def aget_statuses(self) -> Set[CommitStatus]:
+        """
+        Retrieves the all commit statuses without blocking the event loop.
+
+        :return: A (frozen)set of CommitStatus objects.
+        :raises RuntimeError: If something goes wrong (network, auth...).
+        """
+        return self._statuses(await aget(self._token,
+                                         self.url + '/statuses'))
 
+    @staticmethod
+    def _statuses(statuses: list) -> Set[CommitStatus]:
+        """
+        Creates the CommitStatus objects from the listed statuses.
+        """
         # Only the first of each context is the one we want
         result = set()
         contexts = set()
@@ -316,15 +320,10 @@ class GitHubCommit(GitHubMixin, Commit):
         """
         data = {'body': message}
 
-        if file is not None and line is not None:
-            try:
-                patch = self.get_patch_for_file(file)
-                index = get_diff_index(patch, line)
-                if index:  # Else, fallback to comment below file
-                    data['position'] = index
-                    data['path'] = file
-            except ElementDoesntExistError:
-                pass  # Fallback to comment below the file
+        position = self._comment_position(file, line)
+        if position is not None:  # Else, fallback to comment below file
+            data['position'] = position
+            data['path'] = file
 
         if 'position' not in data:
             file_str = '' if file is None else ', file ' + file
@@ -358,6 +357,75 @@ class GitHubCommit(GitHubMixin, Commit):
         return GitHubComment.from_data(res, self._token, self._repository,
                                        comment_type, res['id'])
 
+    def comment_many(self,
+                     comments: Iterable[Tuple[str, Optional[str],
+                                              Optional[int]]],
+                     mr_number: Optional[int]=None,
+                     max_workers: int=MAX_COMMENT_WORKERS
+                    ) -> List[CommentOutcome]:
+        """
+        Places many comments at once, see ``Commit.comment_many``. If a pull
+        request is given, the comments on lines are submitted as a single
+        review of it.
+        """
+        outcomes = self._comment_outcomes(comments)
+        review, single = [], []
+        for outcome in outcomes:
+            if outcome.inline and mr_number is not None:
+                review.append(outcome)
+            else:
+                single.append(outcome)
+
+        self._place_comments(
+            single, [lambda outcome=outcome: self.comment(
+                outcome.message, outcome.file, outcome.line, mr_number)
+                     for outcome in single], max_workers)
+        if review:
+            try:
+                self._review(review, mr_number)
+            except RuntimeError as ex:
+                for outcome in review:
+                    outcome.error = ex
+        return outcomes
+
+    def _review(self, outcomes: List[CommentOutcome], mr_number: int):
+        """
+        Submits the comments on lines as a review of the pull request.
+        """
+        pull_url = self.absolute_url(
+            '/repos/' + self._repository + '/pulls/' + str(mr_number))
+        review = post(self._token, pull_url + '/reviews', {
+            'commit_id': self.sha,
+            'event': 'COMMENT',
+            'comments': [{'path': outcome.file,
+                          'position': self._comment_position(outcome.file,
+                                                             outcome.line),
+                          'body': outcome.message}
+                         for outcome in outcomes]})
+
+        # the review doesn't include its comments, they are placed even if
+        # they can't be retrieved
+        try:
+            comments = get(self._token, pull_url + '/reviews/' +
+                           str(review['id']) + '/comments')
+        except RuntimeError:
+            return
+        placed = {}
+        for comment in comments:
+            placed.setdefault(
+                (comment['path'], comment['position'], comment['body']),
+                []).append(comment)
+        for outcome in outcomes:
+            comments = placed.get((outcome.file,
+                                   self._comment_position(outcome.file,
+                                                          outcome.line),
+                                   outcome.message))
+            if comments:
+                res = comments.pop(0)
+                outcome.comment = GitHubComment.from_data(
+                    res, self._token, self._repository, CommentType.REVIEW,
+                    res['id'])
+
     @property
     def unified_diff(self):
         """
@@ -373,6 +441,18 @@ class GitHubCommit(GitHubMixin, Commit):
                           if not diff.startswith('diff --git') and
                           not diff.startswith('index')])
 
+    def iter_unified_diff(
+            self, line_filter: Optional[Callable[[str], bool]]=None
+    ) -> Iterator[str]:
+        """
+        Yields the lines of the unified diff for the commit as they arrive,
+        see ``Commit.iter_unified_diff``.
+        """
+        lines = iter_lines(self._token, self.url, headers={
+            'Accept': 'application/vnd.github.v3.diff'
+        })
+        return lines if line_filter is None else filter(line_filter, lines)
+
     @property
     def closes_issues(self) -> Set[GitHubIssue]:
         """
@@ -397,8 +477,7 @@ class GitHubCommit(GitHubMixin, Commit):
         Returns a set of GitHubIssue objects which would be fixed as stated in
         this commit message.
         """
-        issues =  self.get_keywords_issues(GITHUB_KEYWORD_REGEX['fix'],
-                                           [self.message])
+        issues = self.get_issue_references().keywords['fix']
         return {GitHubIssue(self._token, repo_name, number)
                 for number, repo_name in issues}
 
@@ -408,8 +487,7 @@ class GitHubCommit(GitHubMixin, Commit):
         Returns a set of GitHubIssue objects which would be closed as stated in
         this commit message.
         """
-        issues =  self.get_keywords_issues(GITHUB_KEYWORD_REGEX['close'],
-                                           [self.message])
+        issues = self.get_issue_references().keywords['close']
         return {GitHubIssue(self._token, repo_name, number)
                 for number, repo_name in issues}
 
@@ -419,7 +497,6 @@ class GitHubCommit(GitHubMixin, Commit):
         Returns a set of GitHubIssue objects which would be resolved as stated
         in this commit message.
         """
-        issues =  self.get_keywords_issues(GITHUB_KEYWORD_REGEX['resolve'],
-                                           [self.message])
+        issues = self.get_issue_references().keywords['resolve']
         return {GitHubIssue(self._token, repo_name, number)
                 for number, repo_name in issues}
@@ -16,7 +16,7 @@ from IGitt.GitHub.GitHubReaction import PREVIEW_HEADER
 from IGitt.GitHub.GitHubUser import GitHubUser
 from IGitt.Interfaces.Comment import CommentType
 from IGitt.Interfaces.Issue import Issue
-from IGitt.Interfaces import get, patch, post, delete
+from IGitt.Interfaces import aget, get, patch, post, delete
 from IGitt.Interfaces import IssueStates
 
 
@@ -263,6 +263,17 @@ class GitHubIssue(GitHubMixin, Issue):
                                         CommentType.ISSUE, result['id'])
                 for result in get(self._token, self.url + '/comments')]
 
+    async def acomments(self):
+        """
+        Retrieves comments from the issue without blocking the event loop.
+
+        :return: A list of Comment objects.
+        """
+        comments = await aget(self._token, self.url + '/comments')
+        return [GitHubComment.from_data(result, self._token, self._repository,
+                                        CommentType.ISSUE, result['id'])
+                for result in comments]
+
     @property
     def labels(self):
         """
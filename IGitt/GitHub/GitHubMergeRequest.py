@@ -17,14 +17,15 @@ The methods being used from GitHubIssue are:
 - available_labels
 """
 from functools import lru_cache
-from typing import Set
+from typing import Tuple
+import asyncio
 
 from IGitt.GitHub import GitHubToken
 from IGitt.GitHub.GitHubCommit import GitHubCommit
 from IGitt.GitHub.GitHubIssue import GitHubIssue
 from IGitt.GitHub.GitHubUser import GitHubUser
 from IGitt.Interfaces.MergeRequest import MergeRequest
-from IGitt.Interfaces import get, put, MergeRequestStates, patch
+from IGitt.Interfaces import aget, get, put, MergeRequestStates, patch
 
 
 # Issue is used as a Mixin, super() is never called by design!
@@ -52,7 +53,7 @@ class GitHubMergeRequest(GitHubIssue, MergeRequest):
         self._url = '/repos/'+repository+'/issues/'+str(number)
 
     def _get_data(self):
-        issue_data = get(self._token, self.url)
+        issue_data = get(self._token, self.url, freshness=self.freshness)
 
         def get_full_data():
             """
@@ -60,12 +61,21 @@ class GitHubMergeRequest(GitHubIssue, MergeRequest):
             complete.
             """
             # Ignore PyLintBear (E1101), its type inference is too stupid
-            issue_data.update(get(self._token, self._mr_url))
+            issue_data.update(get(self._token, self._mr_url,
+                                  freshness=self.freshness))
             return issue_data
 
         # If issue data is sufficient, don't even get MR data
         return PossiblyIncompleteDict(issue_data, get_full_data)
 
+    async def _aget_data(self):
+        # all of the data is wanted here, so get both at once
+        issue_data, mr_data = await asyncio.gather(
+            aget(self._token, self.url, freshness=self.freshness),
+            aget(self._token, self._mr_url, freshness=self.freshness))
+        issue_data.update(mr_data)
+        return issue_data
+
     @property
     def base(self):
         """
@@ -151,6 +161,18 @@ class GitHubMergeRequest(GitHubIssue, MergeRequest):
                                             self._repository, commit['sha'])
                      for commit in commits)
 
+    async def acommits(self) -> Tuple[GitHubCommit]:
+        """
+        Retrieves a tuple of commit objects that are included in the PR
+        without blocking the event loop.
+
+        :return: A tuple of commit objects.
+        """
+        commits = await aget(self._token, self._mr_url + '/commits')
+        return tuple(GitHubCommit.from_data(commit, self._token,
+                                            self._repository, commit['sha'])
+                     for commit in commits)
+
     @property
     def repository(self):
         """
@@ -221,54 +243,8 @@ class GitHubMergeRequest(GitHubIssue, MergeRequest):
         """
         raise NotImplementedError
 
-    @property
-    def closes_issues(self) -> Set[GitHubIssue]:
-        """
-        Returns a set of GitHubIssue objects which would be closed upon merging
-        this pull request.
-        """
-        return {issue for commit in self.commits
-                for issue in commit.closes_issues}
-
-    @property
-    def will_fix_issues(self) -> Set[GitHubIssue]:
-        """
-        Returns a set of GitHubIssue objects which would be fixed as stated in
-        this pull request.
-        """
-        return {issue for commit in self.commits
-                for issue in commit.will_fix_issues}
-
-    @property
-    def will_close_issues(self) -> Set[GitHubIssue]:
-        """
-        Returns a set of GitHubIssue objects which would be closed as stated in
-        this pull request.
-        """
-        return {issue for commit in self.commits
-                for issue in commit.will_close_issues}
-    @property
-    def will_resolve_issues(self) -> Set[GitHubIssue]:
-        """
-        Returns a set of GitHubIssue objects which would be resolved as stated
-        in this pull request.
-        """
-        return {issue for commit in self.commits
-                for issue in commit.will_resolve_issues}
-
-    @property
-    def mentioned_issues(self) -> Set[GitHubIssue]:
-        """
-        Returns a set of GitHubIssue objects which are related to the pull
-        request.
-        """
-        commit_bodies = [commit.message for commit in self.commits]
-        comment_bodies = [comment.body for comment in self.comments]
-        commit = next(iter(self.commits))
-        issues = commit.get_keywords_issues(r'',
-                                            commit_bodies + comment_bodies)
-        return {GitHubIssue(self._token, repo_name, number)
-                for number, repo_name in issues}
+    def _referenced_issue(self, repository: str, number: str) -> GitHubIssue:
+        return GitHubIssue(self._token, repository, number)
 
     @property
     def author(self) -> GitHubUser:
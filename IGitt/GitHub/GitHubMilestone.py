@@ -2,6 +2,8 @@
 This contains the Milestone implementation for GitHub
 """
 from datetime import datetime
+from itertools import islice
+from typing import Optional
 
 from IGitt.GitHub import GitHubMixin
 from IGitt.Interfaces.Milestone import Milestone
@@ -11,6 +13,7 @@ from IGitt.Interfaces import post
 from IGitt.Interfaces import patch
 from IGitt.Interfaces import delete
 from IGitt.Interfaces import get
+from IGitt.Interfaces import iter_get
 from IGitt.GitHub.GitHubIssue import GitHubIssue
 from IGitt.GitHub.GitHubMergeRequest import GitHubMergeRequest
 from IGitt.GitHub.GitHubRepository import GitHubRepository
@@ -177,31 +180,41 @@ class GitHubMilestone(GitHubMixin, Milestone):
         """
         delete(self._token, self.url)
 
-    @property
-    def issues(self) -> set:
+    def _milestone_issues(self, pull_requests: bool,
+                          limit: Optional[int]=None):
+        """
+        Yields the raw issues or pull requests of this milestone, at most
+        ``limit`` of them if given. Both are listed as issues by GitHub, so
+        they're told apart here and pages are only streamed if limited.
+        """
+        fetch = get if limit is None else iter_get
+        return islice((res for res in fetch(self._token, self._issues_url,
+                                            {'milestone': self._number})
+                       if ('pull_request' in res) == pull_requests), limit)
+
+    def filter_issues(self, limit: Optional[int]=None) -> set:
         """
         Retrieves a set of issue objects that are assigned to this milestone.
+
+        :param limit: The maximum number of issues to retrieve.
         """
         return {
             GitHubIssue.from_data(res, self._token, self._repository,
                                   res['number'])
-            for res in get(self._token, self._issues_url,
-                           {'milestone': self._number})
-            if 'pull_request' not in res
+            for res in self._milestone_issues(False, limit)
         }
 
-    @property
-    def merge_requests(self) -> set:
+    def filter_merge_requests(self, limit: Optional[int]=None) -> set:
         """
         Retrieves a set of merge_request
         objects that are assigned to this milestone.
+
+        :param limit: The maximum number of merge requests to retrieve.
         """
         return {
             GitHubMergeRequest.from_data(res, self._token, self._repository,
                                          res['number'])
-            for res in get(self._token, self._issues_url,
-                           {'milestone': self._number})
-            if 'pull_request' in res
+            for res in self._milestone_issues(True, limit)
         }
 
     @property
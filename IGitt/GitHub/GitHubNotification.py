@@ -4,6 +4,7 @@ This contains the Notification implementation for GitHub.
 Take note that GitHub Notifications are actually available via Threads API and
 Notifications API is just a wrapper to fetching these threads.
 """
+from typing import Optional
 from typing import Union
 
 from IGitt.GitHub import BASE_URL
@@ -111,9 +112,12 @@ class GitHubNotification(GitHubMixin, Notification):
         self.data.update({'unread': False})
 
     @staticmethod
-    def fetch_all(token: GitHubToken):
+    def fetch_all(token: GitHubToken, limit: Optional[int]=None):
         """
         Returns the list of notifications for the user bearing the token.
+
+        :param limit: The maximum number of notifications to retrieve.
         """
         return [GitHubNotification.from_data(notif, token, notif['id'])
-                for notif in get(token, BASE_URL + '/notifications')]
+                for notif in get(token, BASE_URL + '/notifications',
+                                 limit=limit)]
@@ -2,6 +2,7 @@
 Here you go: GitHub organizations can be used in IGitt.
 """
 from functools import lru_cache
+from typing import Iterator
 from typing import Set
 from typing import Optional
 from urllib.parse import quote_plus
@@ -11,7 +12,9 @@ from IGitt.GitHub import GH_INSTANCE_URL
 from IGitt.GitHub import GitHubMixin
 from IGitt.GitHub.GitHubIssue import GitHubIssue
 from IGitt.GitHub.GitHubUser import GitHubUser
+from IGitt.Interfaces import count
 from IGitt.Interfaces import get
+from IGitt.Interfaces import iter_get
 from IGitt.Interfaces.Organization import Organization
 from IGitt.Interfaces.Repository import Repository
 
@@ -60,7 +63,7 @@ class GitHubOrganization(GitHubMixin, Organization):
         Number of paying/registered users on the organization.
         """
         try:
-            return len(get(self._token, self.url + '/members'))
+            return count(self._token, self.url + '/members')
         except RuntimeError:
             return 1
 
@@ -112,16 +115,29 @@ class GitHubOrganization(GitHubMixin, Organization):
         return {GitHubRepository.from_data(repo, self._token, repo['id'])
                 for repo in get(self._token, self.url + '/repos')}
 
+    def iter_repositories(self,
+                          limit: Optional[int]=None) -> Iterator[Repository]:
+        """
+        Yields the repositories contained in this organization one by one as
+        they are fetched, at most ``limit`` of them if given.
+        """
+        from IGitt.GitHub.GitHubRepository import GitHubRepository
+
+        for repo in iter_get(self._token, self.url + '/repos', limit=limit):
+            yield GitHubRepository.from_data(repo, self._token, repo['id'])
+
     def filter_issues(self,
                       state: Optional[str]=None,
                       label: Optional[str]=None,
-                      assignee: Optional[str]=None) -> Set[GitHubIssue]:
+                      assignee: Optional[str]=None,
+                      limit: Optional[int]=None) -> Set[GitHubIssue]:
         """
         Filters the issues in the organization based on properties
 
         :param state: 'opened' or 'closed' or 'all'.
         :param label: Label of the issue
         :param assignee: username of issue assignee
+        :param limit: The maximum number of issues to retrieve
         :return: Set of GitHubIssue objects
         """
         from IGitt.GitHub.GitHub import GitHub
@@ -132,7 +148,7 @@ class GitHubOrganization(GitHubMixin, Organization):
             query += ' label:' + label
         if assignee:
             query += ' assignee:' + assignee
-        return set(GitHub.raw_search(self._token, query))
+        return set(GitHub.raw_search(self._token, query, limit))
 
     @property
     def issues(self) -> Set[GitHubIssue]:
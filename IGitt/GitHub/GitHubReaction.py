@@ -12,6 +12,7 @@ from IGitt.Interfaces.Comment import Comment
 from IGitt.Interfaces.Issue import Issue
 from IGitt.Interfaces.MergeRequest import MergeRequest
 from IGitt.Interfaces.Reaction import Reaction
+from IGitt.Utils import CachedDataMixin
 
 
 PREVIEW_HEADER = {'Accept': 'application/vnd.github.squirrel-girl-preview'}
@@ -36,6 +37,10 @@ class GitHubReaction(GitHubMixin, Reaction):
                 'message': 'Not Found',
                 'documentation_url': 'https://developer.github.com/v3'}, 404)
 
+    async def _aget_data(self):
+        # the reaction is looked up in a list, don't fetch self.url directly
+        return await CachedDataMixin._aget_data(self)
+
     def __init__(self,
                  token: GitHubToken,
                  related: Union[Issue, MergeRequest, Comment],
@@ -3,6 +3,10 @@ Contains the GitHub Repository implementation.
 """
 from base64 import b64encode
 from datetime import datetime
+from itertools import islice
+from typing import AsyncIterator
+from typing import Callable
+from typing import Iterator
 from typing import Optional
 from typing import Set
 from typing import Union
@@ -13,13 +17,15 @@ from IGitt.GitHub import GitHubToken
 from IGitt.GitHub import GitHubInstallationToken
 from IGitt.GitHub.GitHubIssue import GitHubIssue
 from IGitt.GitHub.GitHubOrganization import GitHubOrganization
-from IGitt.Interfaces import get, post, put, delete
+from IGitt.Interfaces import count, get, iter_get, post, put, delete
+from IGitt.Interfaces import aiter_get
 from IGitt.Interfaces import BasicAuthorizationToken
 from IGitt.Interfaces import AccessLevel
 from IGitt.Interfaces import IssueStates
 from IGitt.Interfaces import MergeRequestStates
 from IGitt.Interfaces.Repository import Repository
 from IGitt.Interfaces.Repository import WebhookEvents
+from IGitt.Utils import aislice
 from IGitt.Utils import eliminate_none
 
 
@@ -38,6 +44,13 @@ GH_ISSUE_STATE_TRANSLATION = {
     'all': 'all'
 }
 
+# GitHub doesn't differentiate between closed and merged PRs, they're told
+# apart by these on the client side
+GH_MR_STATE_FILTER = {
+    'merged': lambda mr: mr['merged_at'] is not None,
+    'closed': lambda mr: mr['merged_at'] is None
+}
+
 GH_MR_STATE_TRANSLATION = {MergeRequestStates.MERGED: 'merged',
                            MergeRequestStates.OPEN: 'opened',
                            MergeRequestStates.CLOSED: 'closed'}
@@ -98,27 +111,71 @@ class GitHubRepository(GitHubMixin, Repository):
         """
         return self._repository or self.data['full_name']
 
-    def filter_commits(self, author: Optional[str]=None):
+    def _commits(self, fetch: Callable, author: Optional[str]=None,
+                 limit: Optional[int]=None):
+        """
+        Yields the commits retrieved with the given function, i.e. ``get`` or
+        ``iter_get``, at most ``limit`` of them if given.
+        """
+        # Don't move to module, leads to circular imports
+        from IGitt.GitHub.GitHubCommit import GitHubCommit
+
+        data = {'author': author}
+        try:
+            for commit in fetch(self._token, self.url + '/commits', data,
+                                limit=limit):
+                yield GitHubCommit.from_data(commit, self._token,
+                                             self.full_name, commit['sha'])
+        except RuntimeError as ex:
+            # Repository is empty. GitHub returns 409.
+            if ex.args[1] == 409:
+                return
+            raise ex  # dont cover, this is the real exception
+
+    def filter_commits(self, author: Optional[str]=None,
+                       limit: Optional[int]=None):
         """
         Filter commits based on properties.
 
         :author: Author username of the commit.
+        :limit: The maximum number of commits to retrieve, newest first.
         :return: A set of GitHubCommit objects.
         """
+        return set(self._commits(get, author, limit))
+
+    def iter_commits(self, author: Optional[str]=None,
+                     limit: Optional[int]=None) -> Iterator:
+        """
+        Yields the commits one by one as they are fetched.
+
+        :author: Author username of the commit.
+        :limit: The maximum number of commits to yield, newest first.
+        :yields: GitHubCommit objects.
+        """
+        return self._commits(iter_get, author, limit)
+
+    async def aiter_commits(self, author: Optional[str]=None,
+                            limit: Optional[int]=None) -> AsyncIterator:
+        """
+        Yields the commits one by one as they are fetched without blocking
+        the event loop.
+
+        :author: Author username of the commit.
+        :limit: The maximum number of commits to yield, newest first.
+        :yields: GitHubCommit objects.
+        """
         # Don't move to module, leads to circular imports
         from IGitt.GitHub.GitHubCommit import GitHubCommit
 
-        data = {'author': author}
         try:
-            return {GitHubCommit.from_data(commit,
-                                           self._token,
-                                           self.full_name,
-                                           commit['sha'])
-                    for commit in get(self._token, self.url + '/commits', data)}
+            async for commit in aiter_get(self._token, self.url + '/commits',
+                                          {'author': author}, limit=limit):
+                yield GitHubCommit.from_data(commit, self._token,
+                                             self.full_name, commit['sha'])
         except RuntimeError as ex:
             # Repository is empty. GitHub returns 409.
             if ex.args[1] == 409:
-                return set()
+                return
             raise ex  # dont cover, this is the real exception
 
     @property
@@ -146,13 +203,14 @@ class GitHubRepository(GitHubMixin, Repository):
         :return: A URL that can be used to clone the repository with Git.
         """
         url = 'github.com'
-        if isinstance(self._token, GitHubInstallationToken):
+        # the URL holds a single token, i.e. the preferred one of a pool
+        token = self._token.members(self.url)[0]
+        if isinstance(token, GitHubInstallationToken):
             # Reference: https://developer.github.com/apps/building-integrations/setting-up-and-registering-github-apps/about-authentication-options-for-github-apps/#http-based-git-access-by-an-installation
             return self.data['clone_url'].replace(
-                url, 'x-access-token:%s@github.com' % self._token.value, 1)
+                url, 'x-access-token:%s@github.com' % token.value, 1)
 
-        return self.data['clone_url'].replace(
-            url, self._token.value + '@' + url, 1)
+        return self.data['clone_url'].replace(url, token.value + '@' + url, 1)
 
     def get_labels(self):
         """
@@ -360,31 +418,88 @@ class GitHubRepository(GitHubMixin, Repository):
             if hook['config'].get('url', None) == url:
                 delete(self._token, hook_url + '/' + str(hook['id']))
 
-    def filter_merge_requests(self, state: str='opened') -> set:
+    def _merge_requests(self, fetch: Callable, state: str='opened',
+                        limit: Optional[int]=None):
+        """
+        Yields the merge requests with the given state retrieved with the given
+        function, i.e. ``get`` or ``iter_get``, at most ``limit`` of them if
+        given.
+        """
+        from IGitt.GitHub.GitHubMergeRequest import GitHubMergeRequest
+        accept = GH_MR_STATE_FILTER.get(state)
+        params = {'state': 'closed' if accept else state}
+        # closed and merged PRs are told apart here, so the API can't apply
+        # the limit for us
+        mrs = fetch(self._token, self.url + '/pulls', params,
+                    limit=None if accept else limit)
+        if accept:
+            mrs = filter(accept, mrs)
+        for mr in islice(mrs, limit):
+            yield GitHubMergeRequest.from_data(mr, self._token,
+                                               self.full_name, mr['number'])
+
+    def filter_merge_requests(self, state: str='opened',
+                              limit: Optional[int]=None) -> set:
         """
         Filters the merge requests from the repository based on the state
         of the merge requests.
 
         :param state: 'opened' or 'closed', 'merged', or 'all'.
+        :param limit: The maximum number of merge requests to retrieve,
+                      newest first.
+        """
+        fetch = get if limit is None else iter_get
+        return set(self._merge_requests(fetch, state, limit))
+
+    def iter_merge_requests(self, state: str='opened',
+                            limit: Optional[int]=None) -> Iterator:
+        """
+        Yields the merge requests with the given state one by one as they are
+        fetched.
+
+        :param state: 'opened' or 'closed', 'merged', or 'all'.
+        :param limit: The maximum number of merge requests to yield, newest
+                      first.
+        """
+        return self._merge_requests(iter_get, state, limit)
+
+    async def aiter_merge_requests(self, state: str='opened',
+                                   limit: Optional[int]=None
+                                  ) -> AsyncIterator:
+        """
+        Yields the merge requests with the given state one by one as they are
+        fetched without blocking the event loop.
+
+        :param state: 'opened' or 'closed', 'merged', or 'all'.
+        :param limit: The maximum number of merge requests to yield, newest
+                      first.
         """
         from IGitt.GitHub.GitHubMergeRequest import GitHubMergeRequest
-        if state == 'merged':
-            return {GitHubMergeRequest.from_data(mr, self._token,
-                                                 self.full_name, mr['number'])
-                    for mr in get(self._token, self.url + '/pulls',
-                                  {'state': 'closed'})
-                    if mr['merged_at'] is not None}
-        elif state == 'closed':
-            return {GitHubMergeRequest.from_data(mr, self._token,
-                                                 self.full_name, mr['number'])
-                    for mr in get(self._token, self.url + '/pulls',
-                                  {'state': 'closed'})
-                    if mr['merged_at'] is None}
-        else:
-            return {GitHubMergeRequest.from_data(mr, self._token,
-                                                 self.full_name, mr['number'])
-                    for mr in get(self._token, self.url + '/pulls',
-                                  {'state': state})}
+        accept = GH_MR_STATE_FILTER.get(state)
+        params = {'state': 'closed' if accept else state}
+        mrs = aiter_get(self._token, self.url + '/pulls', params,
+                        limit=None if accept else limit)
+        if accept:
+            mrs = (mr async for mr in mrs if accept(mr))
+        async for mr in aislice(mrs, limit):
+            yield GitHubMergeRequest.from_data(mr, self._token,
+                                               self.full_name, mr['number'])
+
+    def count_merge_requests(self, state: str='opened') -> int:
+        """
+        Counts the merge requests with the given state with a single search
+        request.
+
+        :param state: 'opened' or 'closed', 'merged', or 'all'.
+        """
+        query = 'repo:{} type:pr'.format(self.full_name) + {
+            'opened': ' is:open',
+            'closed': ' is:closed is:unmerged',
+            'merged': ' is:merged',
+            'all': ''
+        }[state]
+        return count(self._token, self.absolute_url('/search/issues'),
+                     {'q': query})
 
     @property
     def merge_requests(self) -> set:
@@ -399,9 +514,45 @@ class GitHubRepository(GitHubMixin, Repository):
         """
         return self.filter_merge_requests(state='opened')
 
+    @staticmethod
+    def _issue_params(state: str, label: Optional[str],
+                      assignee: Optional[str]) -> dict:
+        """
+        Returns the query parameters for listing the issues matching the given
+        properties.
+        """
+        params = {'state': GH_ISSUE_STATE_TRANSLATION[state]}
+        if label:
+            params['labels'] = label
+        if assignee:
+            params['assignee'] = assignee
+        return params
+
+    def _issues(self,
+                fetch: Callable,
+                state: str='opened',
+                label: Optional[str]=None,
+                assignee: Optional[str]=None,
+                limit: Optional[int]=None):
+        """
+        Yields the issues matching the given properties retrieved with the
+        given function, i.e. ``get`` or ``iter_get``, at most ``limit`` of them
+        if given.
+        """
+        # pull requests are listed as issues too and filtered out here, so the
+        # API can't apply the limit for us
+        issues = (res for res in fetch(self._token, self.url + '/issues',
+                                       self._issue_params(state, label,
+                                                          assignee))
+                  if 'pull_request' not in res)
+        for res in islice(issues, limit):
+            yield GitHubIssue.from_data(res, self._token,
+                                        self.full_name, res['number'])
+
     def filter_issues(self, state: str='opened',
                       label: Optional[str]=None,
-                      assignee: Optional[str]=None
+                      assignee: Optional[str]=None,
+                      limit: Optional[int]=None
                      ) -> set:
         """
         Filters the issues from the repository based on properties.
@@ -409,16 +560,58 @@ class GitHubRepository(GitHubMixin, Repository):
         :param state: 'opened' or 'closed' or 'all'.
         :param label: Label of the issue
         :param assignee: username of issue assignee
+        :param limit: The maximum number of issues to retrieve, newest first.
         """
-        params = {'state': GH_ISSUE_STATE_TRANSLATION[state]}
-        if label:
-            params['labels'] = label
-        if assignee:
-            params['assignee'] = assignee
-        return {GitHubIssue.from_data(res, self._token,
-                                      self.full_name, res['number'])
-                for res in get(self._token, self.url + '/issues', params)
-                if 'pull_request' not in res}
+        fetch = get if limit is None else iter_get
+        return set(self._issues(fetch, state, label, assignee, limit))
+
+    def iter_issues(self, state: str='opened',
+                    label: Optional[str]=None,
+                    assignee: Optional[str]=None,
+                    limit: Optional[int]=None) -> Iterator:
+        """
+        Yields the issues matching the given properties one by one as they are
+        fetched.
+
+        :param state: 'opened' or 'closed' or 'all'.
+        :param label: Label of the issue
+        :param assignee: username of issue assignee
+        :param limit: The maximum number of issues to yield, newest first.
+        """
+        return self._issues(iter_get, state, label, assignee, limit)
+
+    async def aiter_issues(self, state: str='opened',
+                           label: Optional[str]=None,
+                           assignee: Optional[str]=None,
+                           limit: Optional[int]=None) -> AsyncIterator:
+        """
+        Yields the issues matching the given properties one by one as they are
+        fetched without blocking the event loop.
+
+        :param state: 'opened' or 'closed' or 'all'.
+        :param label: Label of the issue
+        :param assignee: username of issue assignee
+        :param limit: The maximum number of issues to yield, newest first.
+        """
+        results = aiter_get(self._token, self.url + '/issues',
+                            self._issue_params(state, label, assignee))
+        issues = (res async for res in results if 'pull_request' not in res)
+        async for res in aislice(issues, limit):
+            yield GitHubIssue.from_data(res, self._token,
+                                        self.full_name, res['number'])
+
+    def count_issues(self, state: str='opened') -> int:
+        """
+        Counts the issues with the given state with a single search request,
+        as the issues listing contains the pull requests too.
+
+        :param state: 'opened' or 'closed' or 'all'.
+        """
+        query = 'repo:{} type:issue'.format(self.full_name)
+        if state != 'all':
+            query += ' state:' + GH_ISSUE_STATE_TRANSLATION[state]
+        return count(self._token, self.absolute_url('/search/issues'),
+                     {'q': query})
 
     @property
     def issues(self) -> set:
@@ -512,7 +705,8 @@ class GitHubRepository(GitHubMixin, Repository):
             created_before: Optional[datetime]=None,
             updated_after: Optional[datetime]=None,
             updated_before: Optional[datetime]=None,
-            state: Union[MergeRequestStates, IssueStates, None]=None
+            state: Union[MergeRequestStates, IssueStates, None]=None,
+            limit: Optional[int]=None
     ):
         """
         Search for issue based on type 'issue' or 'pr' and return a
@@ -541,38 +735,43 @@ class GitHubRepository(GitHubMixin, Repository):
         elif updated_before:
             query += (' updated:<' +
                       str(updated_before.strftime('%Y-%m-%dT%H:%M:%SZ')))
-        return list(GitHub.raw_search(self._token, query))
+        return list(GitHub.raw_search(self._token, query, limit))
 
     def search_mrs(self,
                    created_after: Optional[datetime]=None,
                    created_before: Optional[datetime]=None,
                    updated_after: Optional[datetime]=None,
                    updated_before: Optional[datetime]=None,
-                   state: Optional[MergeRequestStates]=None):
+                   state: Optional[MergeRequestStates]=None,
+                   limit: Optional[int]=None):
         """
-        List open pull request in the repository.
+        List open pull request in the repository, at most ``limit`` of them if
+        given.
         """
         return self._search_in_range('pr',
                                      created_after,
                                      created_before,
                                      updated_after,
                                      updated_before,
-                                     state)
+                                     state,
+                                     limit)
     def search_issues(self,
                       created_after: Optional[datetime]=None,
                       created_before: Optional[datetime]=None,
                       updated_after: Optional[datetime]=None,
                       updated_before: Optional[datetime]=None,
-                      state: Optional[IssueStates] = None):
+                      state: Optional[IssueStates] = None,
+                      limit: Optional[int]=None):
         """
-        List open issues in the repository.
+        List open issues in the repository, at most ``limit`` of them if given.
         """
         return self._search_in_range('issue',
                                      created_after,
                                      created_before,
                                      updated_after,
                                      updated_before,
-                                     state)
+                                     state,
+                                     limit)
 
     def get_permission_level(self, user) -> AccessLevel:
         """
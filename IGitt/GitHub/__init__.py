@@ -10,7 +10,7 @@ import logging
 from requests_oauthlib import OAuth2
 import jwt
 
-from IGitt.Interfaces import Token, get, post
+from IGitt.Interfaces import Token, aget, get, post
 from IGitt.Utils import CachedDataMixin
 
 
@@ -28,7 +28,10 @@ class GitHubMixin(CachedDataMixin):
     """
 
     def _get_data(self):
-        return get(self._token, self.url)
+        return get(self._token, self.url, freshness=self.freshness)
+
+    async def _aget_data(self):
+        return await aget(self._token, self.url, freshness=self.freshness)
 
     @staticmethod
     def absolute_url(url):
@@ -123,6 +126,13 @@ class GitHubJsonWebToken(Token):
             }
         return self._payload
 
+    @property
+    def identity(self):
+        """
+        The identity doesn't change when the JWT is renewed.
+        """
+        return type(self).__name__, self._app_id
+
     # testing over recorded requests is unadvisable as it is dependent on the
     # time of execution of tests
     @property
@@ -183,6 +193,14 @@ class GitHubInstallationToken(Token):
         """
         return self._jwt
 
+    @property
+    def identity(self):
+        """
+        The identity doesn't change when the installation token is renewed, so
+        retrieving it never requests a new one.
+        """
+        return type(self).__name__, self._id
+
     @property
     def headers(self):
         return {'Authorization': 'token {}'.format(self.value),
@@ -1,19 +1,21 @@
 """
 Contains the abstraction for a commit in GitLab.
 """
+from typing import Callable
+from typing import Iterator
+from typing import List
 from typing import Optional
 from typing import Set
 from typing import Union
 from urllib.parse import quote_plus
 
 from IGitt import ElementDoesntExistError
-from IGitt.GitHub.GitHubCommit import get_diff_index
 from IGitt.GitLab import GitLabMixin
 from IGitt.GitLab import GitLabOAuthToken, GitLabPrivateToken
 from IGitt.GitLab.GitLabComment import GitLabComment
 from IGitt.GitLab.GitLabRepository import GitLabRepository
 from IGitt.GitLab.GitLabIssue import GitLabIssue
-from IGitt.Interfaces import get, post
+from IGitt.Interfaces import aget, get, iter_get, post
 from IGitt.Interfaces.Comment import CommentType
 from IGitt.Interfaces.Commit import Commit
 from IGitt.Interfaces.CommitStatus import Status, CommitStatus
@@ -41,6 +43,7 @@ class GitLabCommit(GitLabMixin, Commit):
     """
     Represents a commit on GitLab.
     """
+    keyword_regexes = GITLAB_KEYWORD_REGEX
 
     def __init__(self,
                  token: Union[GitLabOAuthToken, GitLabPrivateToken],
@@ -133,11 +136,29 @@ class GitLabCommit(GitLabMixin, Commit):
         :return: A (frozen)set of CommitStatus objects.
         :raises RuntimeError: If something goes wrong (network, auth...).
         """
+        return self._statuses(get(self._token, self._statuses_url))
+
+    async def aget_statuses(self) -> Set[CommitStatus]:
+        """
+        Retrieves the all commit statuses without blocking the event loop.
+
+        :return: A (frozen)set of CommitStatus objects.
+        :raises RuntimeError: If something goes wrong (network, auth...).
+        """
+        return self._statuses(await aget(self._token, self._statuses_url))
+
+    @property
+    def _statuses_url(self) -> str:
         # rebuild the url with full sha because gitlab doesn't work that way
-        url = '/projects/{repo}/repository/commits/{sha}/statuses'.format(
-            repo=quote_plus(self._repository), sha=self.sha)
-        statuses = get(self._token, self.absolute_url(url))
+        return self.absolute_url(
+            '/projects/{repo}/repository/commits/{sha}/statuses'.format(
+                repo=quote_plus(self._repository), sha=self.sha))
 
+    @staticmethod
+    def _statuses(statuses: list) -> Set[CommitStatus]:
+        """
+        Creates the CommitStatus objects from the listed statuses.
+        """
         # Only the first of each context is the one we want
         result = set()
         contexts = set()
@@ -218,6 +239,18 @@ class GitLabCommit(GitLabMixin, Commit):
             repo=quote_plus(self._repository), sha=self.sha)
         post(self._token, self.absolute_url(status_url), data)
 
+    def _get_diff(self) -> List[dict]:
+        """
+        Retrieves the diffs of all files of the commit, only once if the
+        commit is given by its SHA, as they can't change then.
+        """
+        diff = getattr(self, '_diff', None)
+        if diff is None:
+            diff = get(self._token, self.url + '/diff')
+            if self._sha:
+                self._diff = diff
+        return diff
+
     def get_patch_for_file(self, filename: str):
         r"""
         Retrieves the unified diff for the commit.
@@ -242,9 +275,7 @@ class GitLabCommit(GitLabMixin, Commit):
         :return: A string containing the patch.
         :raises ElementDoesntExistError: If the given filename does not exist.
         """
-        diff = get(self._token, self.url + '/diff')
-
-        for patch in diff:
+        for patch in self._get_diff():
             if filename in (patch['new_path'], patch['old_path']):
                 return patch['diff']
 
@@ -303,15 +334,10 @@ class GitLabCommit(GitLabMixin, Commit):
         """
         data = {'note': message, 'line_type': 'new'}
 
-        if file is not None and line is not None:
-            try:
-                patch = self.get_patch_for_file(file)
-                index = get_diff_index(patch, line)
-                if index:  # Else, fallback to comment below file
-                    data['line'] = index
-                    data['path'] = file
-            except ElementDoesntExistError:
-                pass  # Fallback to comment below the file
+        position = self._comment_position(file, line)
+        if position is not None:  # Else, fallback to comment below file
+            data['line'] = position
+            data['path'] = file
 
         if 'line' not in data:
             file_str = '' if file is None else ', file ' + file
@@ -345,6 +371,43 @@ class GitLabCommit(GitLabMixin, Commit):
                          for patch in get(self._token, self.url + '/diff')
                         )
 
+    def iter_unified_diff(
+            self, line_filter: Optional[Callable[[str], bool]]=None
+    ) -> Iterator[str]:
+        """
+        Yields the lines of the unified diff for the commit, see
+        ``Commit.iter_unified_diff``. GitLab provides the patches of the files
+        in pages of JSON, only a single page is held in memory at any time.
+        """
+        lines = (line for patch in iter_get(self._token, self.url + '/diff')
+                 for line in self._patch_lines(patch))
+        return lines if line_filter is None else filter(line_filter, lines)
+
+    @staticmethod
+    def _patch_lines(patch: dict) -> Iterator[str]:
+        """
+        Yields the lines of the patch of a file from the GitLab API, with the
+        headers of a git diff.
+        """
+        old_path, new_path = patch['old_path'], patch['new_path']
+        yield 'diff --git a/{} b/{}'.format(old_path, new_path)
+        if patch.get('new_file'):
+            yield 'new file mode ' + patch.get('b_mode', '100644')
+        elif patch.get('deleted_file'):
+            yield 'deleted file mode ' + patch.get('a_mode', '100644')
+        elif patch.get('renamed_file'):
+            yield 'rename from ' + old_path
+            yield 'rename to ' + new_path
+        lines = patch['diff'].split('\n')
+        if lines[-1] == '':
+            lines.pop()
+        if lines and lines[0].startswith('@@'):
+            yield '--- ' + ('/dev/null' if patch.get('new_file')
+                            else 'a/' + old_path)
+            yield '+++ ' + ('/dev/null' if patch.get('deleted_file')
+                            else 'b/' + new_path)
+        yield from lines
+
     @property
     def closes_issues(self) -> Set[GitLabIssue]:
         """
@@ -371,8 +434,7 @@ class GitLabCommit(GitLabMixin, Commit):
         Returns a set of GitLabIssue objects which would be fixed as stated in
         this commit message.
         """
-        issues =  self.get_keywords_issues(GITLAB_KEYWORD_REGEX['fix'],
-                                           [self.message])
+        issues = self.get_issue_references().keywords['fix']
         return {GitLabIssue(self._token, repo_name, number)
                 for number, repo_name in issues}
 
@@ -382,8 +444,7 @@ class GitLabCommit(GitLabMixin, Commit):
         Returns a set of GitLabIssue objects which would be closed as stated in
         this commit message.
         """
-        issues =  self.get_keywords_issues(GITLAB_KEYWORD_REGEX['close'],
-                                           [self.message])
+        issues = self.get_issue_references().keywords['close']
         return {GitLabIssue(self._token, repo_name, number)
                 for number, repo_name in issues}
 
@@ -393,7 +454,6 @@ class GitLabCommit(GitLabMixin, Commit):
         Returns a set of GitLabIssue objects which would be resolved as stated
         in this commit message.
         """
-        issues =  self.get_keywords_issues(GITLAB_KEYWORD_REGEX['resolve'],
-                                           [self.message])
+        issues = self.get_issue_references().keywords['resolve']
         return {GitLabIssue(self._token, repo_name, number)
                 for number, repo_name in issues}
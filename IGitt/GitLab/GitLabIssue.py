@@ -16,7 +16,7 @@ from IGitt.GitLab.GitLabReaction import GitLabReaction
 from IGitt.GitLab.GitLabUser import GitLabUser
 from IGitt.Interfaces.Comment import CommentType
 from IGitt.Interfaces.Issue import Issue
-from IGitt.Interfaces import get, put, post, delete
+from IGitt.Interfaces import aget, get, put, post, delete
 from IGitt.Interfaces import IssueStates
 from IGitt.Interfaces import MergeRequestStates
 
@@ -259,6 +259,20 @@ class GitLabIssue(GitLabMixin, Issue):
             for result in get(self._token, self.url + '/notes')
         ]
 
+    async def acomments(self) -> List[GitLabComment]:
+        """
+        Retrieves comments from the issue without blocking the event loop.
+
+        :return: A list of Comment objects.
+        """
+        return [
+            GitLabComment.from_data(
+                result, self._token, self._repository, self.number,
+                CommentType.ISSUE, result['id']
+            )
+            for result in await aget(self._token, self.url + '/notes')
+        ]
+
     @property
     def labels(self) -> Set[str]:
         """
@@ -3,6 +3,7 @@ Contains a class representing the GitLab merge request.
 """
 from functools import lru_cache
 from typing import Set
+from typing import Tuple
 from typing import Union
 from urllib.parse import quote_plus
 import re
@@ -12,7 +13,7 @@ from IGitt.GitLab.GitLabCommit import GitLabCommit
 from IGitt.GitLab.GitLabIssue import GitLabIssue
 from IGitt.GitLab.GitLabUser import GitLabUser
 from IGitt.Interfaces.MergeRequest import MergeRequest
-from IGitt.Interfaces import get, put, MergeRequestStates
+from IGitt.Interfaces import aget, get, put, MergeRequestStates
 
 
 # Issue is used as a Mixin, super() is never called by design!
@@ -110,7 +111,20 @@ class GitLabMergeRequest(GitLabIssue, MergeRequest):
         :return: A tuple of commit objects.
         """
         commits = get(self._token, self.url + '/commits')
-        return tuple(GitLabCommit(self._token, self._repository, commit['id'])
+        return tuple(GitLabCommit.from_data(commit, self._token,
+                                            self._repository, commit['id'])
+                     for commit in commits)
+
+    async def acommits(self) -> Tuple[GitLabCommit]:
+        """
+        Retrieves a tuple of commit objects that are included in the PR
+        without blocking the event loop.
+
+        :return: A tuple of commit objects.
+        """
+        commits = await aget(self._token, self.url + '/commits')
+        return tuple(GitLabCommit.from_data(commit, self._token,
+                                            self._repository, commit['id'])
                      for commit in commits)
 
     @property
@@ -200,52 +214,8 @@ class GitLabMergeRequest(GitLabIssue, MergeRequest):
 
         return additions, deletions
 
-    @property
-    def closes_issues(self) -> Set[GitLabIssue]:
-        """
-        Returns a set of GitLabIssue objects which would be closed upon merging
-        this pull request.
-        """
-        return {issue for commit in self.commits
-                for issue in commit.closes_issues}
-    @property
-    def mentioned_issues(self) -> Set[GitLabIssue]:
-        """
-        Returns a set of GitLabIssue objects which are related to the merge
-        request.
-        """
-        body = [commit.message for commit in self.commits] + [
-            comment.body for comment in self.comments]
-        commit = next(iter(self.commits))
-        issues = commit.get_keywords_issues(r'', body)
-        return {GitLabIssue(self._token, repo_name, number)
-                for number, repo_name in issues}
-
-    @property
-    def will_fix_issues(self) -> Set[GitLabIssue]:
-        """
-        Returns a set of GitLabIssue objects which would be fixed as stated in
-        this pull request.
-        """
-        return {issue for commit in self.commits
-                for issue in commit.will_fix_issues}
-
-    @property
-    def will_close_issues(self) -> Set[GitLabIssue]:
-        """
-        Returns a set of GitLabIssue objects which would be closed as stated in
-        this pull request.
-        """
-        return {issue for commit in self.commits
-                for issue in commit.will_close_issues}
-    @property
-    def will_resolve_issues(self) -> Set[GitLabIssue]:
-        """
-        Returns a set of GitLabIssue objects which would be resolved as stated
-        in this pull request.
-        """
-        return {issue for commit in self.commits
-                for issue in commit.will_resolve_issues}
+    def _referenced_issue(self, repository: str, number: str) -> GitLabIssue:
+        return GitLabIssue(self._token, repository, number)
 
     @property
     def author(self) -> GitLabUser:
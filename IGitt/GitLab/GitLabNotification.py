@@ -4,6 +4,7 @@ This contains the Notification implementation for GitHub.
 Take note that GitHub Notifications are actually available via Todos API.
 """
 from functools import lru_cache
+from typing import Optional
 from typing import Union
 
 from IGitt.GitLab import BASE_URL
@@ -17,6 +18,7 @@ from IGitt.Interfaces import get
 from IGitt.Interfaces import post
 from IGitt.Interfaces.Notification import Notification
 from IGitt.Interfaces.Notification import Reason
+from IGitt.Utils import CachedDataMixin
 
 
 class GitLabNotification(GitLabMixin, Notification):
@@ -112,15 +114,25 @@ class GitLabNotification(GitLabMixin, Notification):
             # Couldn't find the matching notification
             raise RuntimeError({'error':'404 Not Found'}, 404)
 
+    async def _aget_data(self):
+        # the todo is looked up in a list, don't fetch self.url directly
+        return await CachedDataMixin._aget_data(self)
+
     @staticmethod
     @lru_cache(None)
     def _fetch_all(token):
         return get(token, GitLabNotification.absolute_url('/todos'))
 
     @staticmethod
-    def fetch_all(token: Union[GitLabPrivateToken, GitLabOAuthToken]):
+    def fetch_all(token: Union[GitLabPrivateToken, GitLabOAuthToken],
+                  limit: Optional[int]=None):
         """
         Returns the list of notifications for the user bearing the token.
+
+        :param limit: The maximum number of notifications to retrieve.
         """
+        todos = (GitLabNotification._fetch_all(token) if limit is None else
+                 get(token, GitLabNotification.absolute_url('/todos'),
+                     limit=limit))
         return [GitLabNotification.from_data(data, token, data['id'])
-                for data in GitLabNotification._fetch_all(token)]
+                for data in todos]
@@ -3,7 +3,9 @@ This module contains the Issue abstraction class which provides properties and
 actions related to issues and bug reports.
 """
 import re
+from itertools import islice
 from functools import lru_cache
+from typing import Iterator
 from typing import Set
 from typing import Optional
 from typing import Union
@@ -16,6 +18,7 @@ from IGitt.GitLab import GitLabMixin
 from IGitt.GitLab.GitLabUser import GitLabUser
 from IGitt.GitLab.GitLabIssue import GitLabIssue
 from IGitt.Interfaces import get
+from IGitt.Interfaces import iter_get
 from IGitt.Interfaces import post
 from IGitt.Interfaces import AccessLevel
 from IGitt.Interfaces.Organization import Organization
@@ -155,10 +158,31 @@ class GitLabOrganization(GitLabMixin, Organization):
                    repo for org in self.suborgs for repo in org.repositories
                })
 
+    def iter_repositories(self,
+                          limit: Optional[int]=None) -> Iterator[Repository]:
+        """
+        Yields the repositories contained in this organization one by one as
+        they are fetched, followed by the ones of its subgroups, recursively.
+
+        :param limit: The maximum number of repositories to yield.
+        """
+        return islice(self._iter_repositories(limit), limit)
+
+    def _iter_repositories(self, limit: Optional[int]=None):
+        from IGitt.GitLab.GitLabRepository import GitLabRepository
+
+        for repo in iter_get(self._token, self.url + '/projects', limit=limit):
+            yield GitLabRepository.from_data(repo, self._token, repo['id'])
+        for suborg_data in iter_get(self._token, self.url + '/subgroups'):
+            suborg = GitLabOrganization.from_data(
+                suborg_data, self._token, suborg_data['full_path'])
+            yield from suborg._iter_repositories(limit)
+
     def filter_issues(self,
                       state: Optional[str]=None,
                       label: Optional[str]=None,
-                      assignee: Optional[str]=None
+                      assignee: Optional[str]=None,
+                      limit: Optional[int]=None
                      ) -> Set[GitLabIssue]:
         """
         Filters the issues in the organization based on properties
@@ -166,6 +190,7 @@ class GitLabOrganization(GitLabMixin, Organization):
         :param state: 'opened' or 'closed' or 'all'
         :param label: Label of the issue
         :param assignee: username of issue assignee
+        :param limit: The maximum number of issues to retrieve
         :return: Set of GitLabIssue objects
         """
         params = dict()
@@ -180,7 +205,8 @@ class GitLabOrganization(GitLabMixin, Organization):
         return {GitLabIssue.from_data(issue, self._token,
                                       url.match(issue['web_url']).group(0),
                                       issue['iid'])
-                for issue in get(self._token, self.url + '/issues', params)}
+                for issue in get(self._token, self.url + '/issues', params,
+                                 limit=limit)}
 
     @property
     def issues(self) -> Set[GitLabIssue]:
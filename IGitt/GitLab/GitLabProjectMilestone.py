@@ -3,6 +3,7 @@ This contains the Milestone implementation for GitLab
 """
 import re
 from datetime import datetime
+from typing import Optional
 from urllib.parse import quote_plus
 
 from IGitt.GitLab import GitLabMixin
@@ -226,29 +227,32 @@ class GitLabProjectMilestone(GitLabMixin, Milestone):
         """
         return re.sub(r'https?://gitlab\.com/|/issues/\d', '', web_url)
 
-    @property
-    def issues(self) -> set:
+    def filter_issues(self, limit: Optional[int]=None) -> set:
         """
         Retrieves a set of issue objects that are assigned to this milestone.
+
+        :param limit: The maximum number of issues to retrieve.
         """
         return {
             GitLabIssue.from_data(res, self._token,
                                   self.extract_repo_full_name(res['web_url']),
                                   res['iid'])
-            for res in get(self._token, self.url + '/issues')
+            for res in get(self._token, self.url + '/issues', limit=limit)
         }
 
-    @property
-    def merge_requests(self) -> set:
+    def filter_merge_requests(self, limit: Optional[int]=None) -> set:
         """
         Retrieves a set of merge request objects that are assigned to this
         milestone.
+
+        :param limit: The maximum number of merge requests to retrieve.
         """
         return {
             GitLabMergeRequest.from_data(res, self._token,
                                          self.extract_repo_full_name(
                                              res['web_url']), res['iid'])
-            for res in get(self._token, self.url + '/merge_requests')
+            for res in get(self._token, self.url + '/merge_requests',
+                           limit=limit)
         }
 
     @property
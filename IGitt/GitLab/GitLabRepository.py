@@ -2,12 +2,17 @@
 Contains the GitLab Repository implementation.
 """
 from datetime import datetime
+from itertools import islice
+from typing import AsyncIterator
+from typing import Callable
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Set
 from typing import Union
 from urllib.parse import quote_plus
 from functools import lru_cache
+import asyncio
 
 from IGitt import ElementAlreadyExistsError, ElementDoesntExistError
 from IGitt.GitLab import GitLabMixin
@@ -15,13 +20,15 @@ from IGitt.GitLab import GitLabOAuthToken, GitLabPrivateToken
 from IGitt.GitLab.GitLabIssue import GitLabIssue
 from IGitt.GitLab.GitLabOrganization import GitLabOrganization
 from IGitt.GitLab.GitLabUser import GitLabUser
-from IGitt.Interfaces import delete, get, post
+from IGitt.Interfaces import count, delete, get, iter_get, post
+from IGitt.Interfaces import aiter_get
 from IGitt.Interfaces import BasicAuthorizationToken
 from IGitt.Interfaces import AccessLevel
 from IGitt.Interfaces import IssueStates
 from IGitt.Interfaces import MergeRequestStates
 from IGitt.Interfaces.Repository import Repository
 from IGitt.Interfaces.Repository import WebhookEvents
+from IGitt.Utils import aislice
 from IGitt.Utils import eliminate_none
 
 
@@ -126,32 +133,99 @@ class GitLabRepository(GitLabMixin, Repository):
         """
         return self._repository or self.data['path_with_namespace']
 
+    def _author_name(self, username: str) -> Optional[str]:
+        """
+        Retrieves the name GitLab records as commit author for the given
+        username or None if there is no such user.
+        """
+        user = get(self._token, self.absolute_url('/users'),
+                   {'username': username})
+        return user[0]['name'] if user else None
+
+    def _commits(self, fetch: Callable, author_name: Optional[str]=None,
+                 limit: Optional[int]=None):
+        """
+        Yields the commits retrieved with the given function, i.e. ``get`` or
+        ``iter_get``, optionally only those with the given author name and at
+        most ``limit`` of them if given.
+        """
+        # Don't move to module, leads to circular imports
+        from IGitt.GitLab.GitLabCommit import GitLabCommit
+
+        # the author is matched here, so the API can only apply the limit for
+        # us if all authors are wanted
+        commits = fetch(self._token, self.url + '/repository/commits',
+                        limit=limit if author_name is None else None)
+        if author_name is not None:
+            commits = (commit for commit in commits
+                       if commit['author_name'] == author_name)
+        for commit in islice(commits, limit):
+            yield GitLabCommit.from_data(commit, self._token,
+                                         self.full_name, commit['id'])
+
     @lru_cache(None)
-    def filter_commits(self, author: Optional[str]=None):
+    def filter_commits(self, author: Optional[str]=None,
+                       limit: Optional[int]=None):
         """
         Filter commits based on properties.
 
         :author: Author username of the commit.
-        :return: A set of GitLabCommit objects.
+        :limit: The maximum number of commits to retrieve, newest first.
+        :return: A set of GitLabCommit objects or None if the author doesn't
+                 exist.
+        """
+        author_name = None
+        if author is not None:
+            author_name = self._author_name(author)
+            if author_name is None:
+                return None
+        fetch = get if author is None or limit is None else iter_get
+        return set(self._commits(fetch, author_name, limit))
+
+    def iter_commits(self, author: Optional[str]=None,
+                     limit: Optional[int]=None) -> Iterator:
+        """
+        Yields the commits one by one as they are fetched. Nothing is yielded
+        if the author doesn't exist.
+
+        :author: Author username of the commit.
+        :limit: The maximum number of commits to yield, newest first.
+        :yields: GitLabCommit objects.
+        """
+        author_name = None
+        if author is not None:
+            author_name = self._author_name(author)
+            if author_name is None:
+                return iter(())
+        return self._commits(iter_get, author_name, limit)
+
+    async def aiter_commits(self, author: Optional[str]=None,
+                            limit: Optional[int]=None) -> AsyncIterator:
+        """
+        Yields the commits one by one as they are fetched without blocking
+        the event loop. Nothing is yielded if the author doesn't exist.
+
+        :author: Author username of the commit.
+        :limit: The maximum number of commits to yield, newest first.
+        :yields: GitLabCommit objects.
         """
         # Don't move to module, leads to circular imports
         from IGitt.GitLab.GitLabCommit import GitLabCommit
 
-        commits = get(self._token, self.url + '/repository/commits')
+        author_name = None
         if author is not None:
-            data =  {'username': author}
-            user = get(self._token, self.absolute_url('/users'), data)
-            if user:
-                author_name = user[0]['name']
-            else:
-                return None
-            commits = [commit for commit in commits
-                       if commit['author_name'] == author_name]
-        return {GitLabCommit.from_data(commit,
-                                       self._token,
-                                       self.full_name,
-                                       commit['id'])
-                for commit in commits}
+            author_name = await asyncio.get_event_loop().run_in_executor(
+                None, self._author_name, author)
+            if author_name is None:
+                return
+        commits = aiter_get(self._token, self.url + '/repository/commits',
+                            limit=limit if author_name is None else None)
+        if author_name is not None:
+            commits = (commit async for commit in commits
+                       if commit['author_name'] == author_name)
+        async for commit in aislice(commits, limit):
+            yield GitLabCommit.from_data(commit, self._token,
+                                         self.full_name, commit['id'])
 
     @property
     def commits(self):
@@ -390,19 +464,68 @@ class GitLabRepository(GitLabMixin, Repository):
         """
         return GitLabIssue.create(self._token, self.full_name, title, body)
 
-    def filter_merge_requests(self, state: str='opened') -> set:
+    def _merge_requests(self, fetch: Callable, state: str='opened',
+                        limit: Optional[int]=None):
+        """
+        Yields the merge requests with the given state retrieved with the given
+        function, i.e. ``get`` or ``iter_get``, at most ``limit`` of them if
+        given.
+        """
+        from IGitt.GitLab.GitLabMergeRequest import GitLabMergeRequest
+        for mr in fetch(self._token, self.url + '/merge_requests',
+                        {'state': state}, limit=limit):
+            yield GitLabMergeRequest.from_data(mr, self._token,
+                                               self.full_name, mr['iid'])
+
+    def filter_merge_requests(self, state: str='opened',
+                              limit: Optional[int]=None) -> set:
         """
         Filters the merge requests from the repository based on the state
         of the merge requests.
 
         :param state: 'opened' or 'closed', or 'merged', or 'all'.
+        :param limit: The maximum number of merge requests to retrieve,
+                      newest first.
+        """
+        return set(self._merge_requests(get, state, limit))
+
+    def iter_merge_requests(self, state: str='opened',
+                            limit: Optional[int]=None) -> Iterator:
+        """
+        Yields the merge requests with the given state one by one as they are
+        fetched.
+
+        :param state: 'opened' or 'closed', or 'merged', or 'all'.
+        :param limit: The maximum number of merge requests to yield, newest
+                      first.
+        """
+        return self._merge_requests(iter_get, state, limit)
+
+    async def aiter_merge_requests(self, state: str='opened',
+                                   limit: Optional[int]=None
+                                  ) -> AsyncIterator:
+        """
+        Yields the merge requests with the given state one by one as they are
+        fetched without blocking the event loop.
+
+        :param state: 'opened' or 'closed', or 'merged', or 'all'.
+        :param limit: The maximum number of merge requests to yield, newest
+                      first.
         """
         from IGitt.GitLab.GitLabMergeRequest import GitLabMergeRequest
-        return {GitLabMergeRequest.from_data(mr, self._token,
-                                             self.full_name, mr['iid'])
-                for mr in get(self._token,
-                              self.url + '/merge_requests',
-                              {'state': state})}
+        async for mr in aiter_get(self._token, self.url + '/merge_requests',
+                                  {'state': state}, limit=limit):
+            yield GitLabMergeRequest.from_data(mr, self._token,
+                                               self.full_name, mr['iid'])
+
+    def count_merge_requests(self, state: str='opened') -> int:
+        """
+        Counts the merge requests with the given state with a single request.
+
+        :param state: 'opened' or 'closed', or 'merged', or 'all'.
+        """
+        return count(self._token, self.url + '/merge_requests',
+                     {'state': state})
 
     @property
     def merge_requests(self) -> set:
@@ -419,9 +542,44 @@ class GitLabRepository(GitLabMixin, Repository):
         """
         return self.filter_merge_requests(state='opened')
 
+    @staticmethod
+    def _issue_params(state: str, label: Optional[str],
+                      assignee_id: Optional[int]) -> dict:
+        """
+        Returns the query parameters for listing the issues matching the given
+        properties.
+        """
+        params = {'state': state}
+        if label:
+            params['labels'] = label
+        if assignee_id:
+            params['assignee_id'] = assignee_id
+        return params
+
+    def _issues(self,
+                fetch: Callable,
+                state: str='opened',
+                label: Optional[str]=None,
+                assignee: Optional[str]=None,
+                limit: Optional[int]=None):
+        """
+        Yields the issues matching the given properties retrieved with the
+        given function, i.e. ``get`` or ``iter_get``, at most ``limit`` of them
+        if given.
+        """
+        assignee_id = None
+        if assignee:
+            assignee_id = GitLabUser(self._token, assignee).identifier
+        for res in fetch(self._token, self.url + '/issues',
+                         self._issue_params(state, label, assignee_id),
+                         limit=limit):
+            yield GitLabIssue.from_data(res, self._token,
+                                        self.full_name, res['iid'])
+
     def filter_issues(self, state: str='opened',
                       label: Optional[str]=None,
-                      assignee: Optional[str]=None
+                      assignee: Optional[str]=None,
+                      limit: Optional[int]=None
                      ) -> set:
         """
         Filters the issues from the repository based on properties.
@@ -429,18 +587,58 @@ class GitLabRepository(GitLabMixin, Repository):
         :param state: 'opened' or 'closed' or 'all'.
         :param label: Label of the issue.
         :param assignee: username of issue assignee.
+        :param limit: The maximum number of issues to retrieve, newest first.
         """
-        params = {'state': state}
-        if label:
-            params['labels'] = label
+        return set(self._issues(get, state, label, assignee, limit))
+
+    def iter_issues(self, state: str='opened',
+                    label: Optional[str]=None,
+                    assignee: Optional[str]=None,
+                    limit: Optional[int]=None) -> Iterator:
+        """
+        Yields the issues matching the given properties one by one as they are
+        fetched.
+
+        :param state: 'opened' or 'closed' or 'all'.
+        :param label: Label of the issue.
+        :param assignee: username of issue assignee.
+        :param limit: The maximum number of issues to yield, newest first.
+        """
+        return self._issues(iter_get, state, label, assignee, limit)
+
+    async def aiter_issues(self, state: str='opened',
+                           label: Optional[str]=None,
+                           assignee: Optional[str]=None,
+                           limit: Optional[int]=None) -> AsyncIterator:
+        """
+        Yields the issues matching the given properties one by one as they are
+        fetched without blocking the event loop.
+
+        :param state: 'opened' or 'closed' or 'all'.
+        :param label: Label of the issue.
+        :param assignee: username of issue assignee.
+        :param limit: The maximum number of issues to yield, newest first.
+        """
+        assignee_id = None
         if assignee:
-            params['assignee_id'] = GitLabUser(self._token,
-                                               assignee).identifier
-        return {GitLabIssue.from_data(res, self._token,
-                                      self.full_name, res['iid'])
-                for res in get(self._token,
-                               self.url + '/issues',
-                               params)}
+            # GitLabUser looks the username up, let it do so in the executor
+            user = await asyncio.get_event_loop().run_in_executor(
+                None, GitLabUser, self._token, assignee)
+            assignee_id = user.identifier
+        async for res in aiter_get(self._token, self.url + '/issues',
+                                   self._issue_params(state, label,
+                                                      assignee_id),
+                                   limit=limit):
+            yield GitLabIssue.from_data(res, self._token,
+                                        self.full_name, res['iid'])
+
+    def count_issues(self, state: str='opened') -> int:
+        """
+        Counts the issues with the given state with a single request.
+
+        :param state: 'opened' or 'closed' or 'all'.
+        """
+        return count(self._token, self.url + '/issues', {'state': state})
 
     @property
     def issues(self) -> set:
@@ -524,38 +722,46 @@ class GitLabRepository(GitLabMixin, Repository):
 
     def _search(self,
                 search_type,
-                state: Union[MergeRequestStates, IssueStates, None]):
+                state: Union[MergeRequestStates, IssueStates, None],
+                fetch: Callable=get):
         """
         Retrives a list of all issues or merge requests.
         :param search_type: A string for type of object i.e. issues for issue
                             and merge_requests for merge requests.
         :param state: A string for MR/issue state (opened or closed)
+        :param fetch: The function used to retrieve them, i.e. ``get`` or
+                      ``iter_get`` to stream them.
         :return: List of issues/merge requests.
         """
         url = self.url + '/{}'.format(search_type)
         if state is None:
-            return get(self._token, url)
+            return fetch(self._token, url)
         elif isinstance(state, IssueStates):
             state = GL_ISSUE_STATE_TRANSLATION[state]
         elif isinstance(state, MergeRequestStates):
             state = GL_MR_STATE_TRANSLATION[state]
-        return get(self._token, url, {'state': state})
+        return fetch(self._token, url, {'state': state})
 
     def search_issues(self,
                       created_after: Optional[datetime]=None,
                       created_before: Optional[datetime]=None,
                       updated_after: Optional[datetime]=None,
                       updated_before: Optional[datetime]=None,
-                      state: Optional[IssueStates] = None):
-        """
-        Searches for issues based on created and updated date.
-        """
-        for issue_data in filter(lambda data: date_in_range(data,
-                                                            created_after,
-                                                            created_before,
-                                                            updated_after,
-                                                            updated_before),
-                                 self._search('issues', state)):
+                      state: Optional[IssueStates] = None,
+                      limit: Optional[int]=None):
+        """
+        Searches for issues based on created and updated date, yielding at
+        most ``limit`` of them if given.
+        """
+        fetch = get if limit is None else iter_get
+        for issue_data in islice(
+                filter(lambda data: date_in_range(data,
+                                                  created_after,
+                                                  created_before,
+                                                  updated_after,
+                                                  updated_before),
+                       self._search('issues', state, fetch)),
+                limit):
             issue = self.get_issue(issue_data['iid'])
             issue.data = issue_data
             yield issue
@@ -565,16 +771,21 @@ class GitLabRepository(GitLabMixin, Repository):
                    created_before: Optional[datetime]=None,
                    updated_after: Optional[datetime]=None,
                    updated_before: Optional[datetime]=None,
-                   state: Optional[MergeRequestStates]=None):
-        """
-        Searches for merge request based on created and updated date.
-        """
-        for mr_data in filter(lambda data: date_in_range(data,
-                                                         created_after,
-                                                         created_before,
-                                                         updated_after,
-                                                         updated_before),
-                              self._search('merge_requests', state)):
+                   state: Optional[MergeRequestStates]=None,
+                   limit: Optional[int]=None):
+        """
+        Searches for merge request based on created and updated date, yielding
+        at most ``limit`` of them if given.
+        """
+        fetch = get if limit is None else iter_get
+        for mr_data in islice(
+                filter(lambda data: date_in_range(data,
+                                                  created_after,
+                                                  created_before,
+                                                  updated_after,
+                                                  updated_before),
+                       self._search('merge_requests', state, fetch)),
+                limit):
             merge_request = self.get_mr(mr_data['iid'])
             merge_request.data = mr_data
             yield merge_request
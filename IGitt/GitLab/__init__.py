@@ -8,7 +8,7 @@ import logging
 
 from requests_oauthlib import OAuth2
 
-from IGitt.Interfaces import Token, get
+from IGitt.Interfaces import Token, aget, get
 from IGitt.Utils import CachedDataMixin
 
 
@@ -27,7 +27,10 @@ class GitLabMixin(CachedDataMixin):
     """
 
     def _get_data(self):
-        return get(self._token, self.url)
+        return get(self._token, self.url, freshness=self.freshness)
+
+    async def _aget_data(self):
+        return await aget(self._token, self.url, freshness=self.freshness)
 
     @staticmethod
     def absolute_url(url):
@@ -1,12 +1,21 @@
 """
 This module contains the actual commit object.
 """
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import Optional
 from typing import Set
 from typing import List
-from itertools import chain
+from typing import Tuple
 import re
 
+from IGitt import ElementDoesntExistError
 from IGitt.Interfaces import IGittObject
 from IGitt.Interfaces import Comment
 from IGitt.Interfaces.CommitStatus import CommitStatus, Status
@@ -23,6 +32,414 @@ SUPPORTED_HOST_KEYWORD_REGEX = {
                r'|[Ff]ix(?:e[sd]|ing)?')
     }
 CONCATENATION_KEYWORDS = [r',', r'\sand\s']
+# the maximum number of comments placed concurrently by ``comment_many``
+MAX_COMMENT_WORKERS = 4
+HUNK_HEADER_REGEX = re.compile(
+    r'@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+
+
+class IssueReferences:
+    """
+    The issues referenced in some texts, e.g. commit messages, as sets of
+    tuples(issue number, name of the repository the issue is contained in).
+
+    - ``keywords`` maps the name of every keyword to the issues referenced
+      with it, e.g. ``references.keywords['fix']``
+    - ``closes`` holds the issues referenced with any of the keywords
+    - ``mentions`` holds all referenced issues
+    """
+
+    def __init__(self, keywords: Dict[str, Set[Tuple[str, str]]],
+                 closes: Set[Tuple[str, str]],
+                 mentions: Set[Tuple[str, str]]):
+        self.keywords = keywords
+        self.closes = closes
+        self.mentions = mentions
+
+
+class IssueReferenceScanner:
+    """
+    Finds the issues referenced in texts with any of the given keywords and
+    without any. The patterns are compiled once, get the scanner for a hoster
+    and keywords with ``IssueReferenceScanner.get``. Every text is scanned
+    once for all references and once for those with any keyword.
+
+    >>> scanner = IssueReferenceScanner.get('github', (('fix', 'fix(?:es)?'),))
+    >>> references = scanner.scan(['fixes #1, #2 and relates to a/b#3'],
+    ...                           'coala/coala')
+    >>> sorted(references.keywords['fix'])
+    [('1', 'coala/coala'), ('2', 'coala/coala')]
+    >>> sorted(references.mentions)
+    [('1', 'coala/coala'), ('2', 'coala/coala'), ('3', 'a/b')]
+    """
+
+    def __init__(self, hoster: str, keywords: Tuple[Tuple[str, str], ...]):
+        """
+        :param hoster:   The host name of the hoster, e.g. 'github'.
+        :param keywords: The names of the keywords and the regular expressions
+                         matching them.
+        """
+        self.names = [name for name, _ in keywords]
+        identifier_regex = r'[\w\.-]+'
+        namespace_regex = r'(?:{0})/(?:{0})(?:/(?:{0}))?'.format(
+            identifier_regex)
+        concat_regex = '|'.join(kw for kw in CONCATENATION_KEYWORDS)
+        issue_no_regex = r'[1-9][0-9]*'
+        issue_url_regex = r'https?://{}\S+/issues/{}'.format(
+            hoster, issue_no_regex)
+        references_regex = (
+            r'(?:(?:{2})?\s*'   # match conjunctions
+                                # eg: ',', 'and' etc.
+
+            r'(?:(?:\S*)#{1}|'  # match short references
+                                # eg: #123, coala/example#23
+
+            r'(?:{0})))+'       # match full length issue URLs
+                                # eg: https://github.com/coala/coala/issues/23
+
+            r''.format(issue_url_regex, issue_no_regex, concat_regex))
+        self.mention_regex = re.compile(references_regex)
+        # every keyword gets its own group, telling which one matched
+        self.keyword_regex = re.compile('(?:{}){}'.format(
+            '|'.join('(?P<k{}>{})'.format(index, regex)
+                     for index, (_, regex) in enumerate(keywords)) or '(?!)',
+            references_regex))
+        self.issue_capture_regex = re.compile(
+            r'(?:(?:\s+|^)({2})?#({0}))'
+            r'|(?:https?://{1}\S+?/({2})/issues/({0}))'.format(
+                issue_no_regex, hoster, namespace_regex))
+
+    @staticmethod
+    @lru_cache(None)
+    def get(hoster: str,
+            keywords: Tuple[Tuple[str, str], ...]) -> 'IssueReferenceScanner':
+        """
+        Retrieves the scanner for the hoster and keywords, compiling it only
+        the first time.
+        """
+        return IssueReferenceScanner(hoster, keywords)
+
+    def _add_references(self, results: Set[Tuple[str, str]], match,
+                        repo_names: dict, name) -> None:
+        """
+        Adds the issues referenced in the match to the results. Short
+        references refer to the repository referenced last by name for the
+        same kind of references, which is kept in ``repo_names``.
+        """
+        for ref in self.issue_capture_regex.findall(match.group(0)):
+            if ref[0] != '':
+                repo_names[name] = ref[0]
+            if ref[1] != '':
+                results.add((ref[1], repo_names[name]))
+            if ref[2] != '' and ref[3] != '':
+                results.add((ref[3], ref[2]))
+
+    def scan(self, body_list: Iterable[str],
+             repo_name: str) -> IssueReferences:
+        """
+        Finds the referenced issues in the given texts. Short references
+        without a repository name refer to the given repository, or to the
+        one last referenced with a repository name before.
+        """
+        keywords = {name: set() for name in self.names}
+        closes, mentions = set(), set()
+        repo_names = dict.fromkeys(self.names + [None, ''], repo_name)
+
+        for body in body_list:
+            body = body.replace('\r', '')
+            referenced = False
+            for match in self.mention_regex.finditer(body):
+                referenced = True
+                self._add_references(mentions, match, repo_names, '')
+            # texts without any reference can't have any with a keyword
+            if not referenced or not self.names:
+                continue
+            for match in self.keyword_regex.finditer(body):
+                self._add_references(closes, match, repo_names, None)
+                for index, name in enumerate(self.names):
+                    if match.group('k{}'.format(index)) is not None:
+                        self._add_references(keywords[name], match,
+                                             repo_names, name)
+
+        return IssueReferences(keywords, closes, mentions)
+
+
+class PatchIndex:
+    r"""
+    The lines of a file that can be commented on in the patch of a commit,
+    with their positions in the patch, i.e. the number of lines after the
+    first hunk header. The patch is parsed only once, the lines are looked up
+    with a binary search.
+
+    >>> index = PatchIndex('--- a/file\n'
+    ...                    '+++ b/file\n'
+    ...                    '@@ -1,2 +1,3 @@\n'
+    ...                    ' # test\n'       # line 1
+    ...                    '-a test repo\n'
+    ...                    '+++a\n'          # line 2
+    ...                    '+something new\n'  # line 3
+    ...                    '@@ -10 +11 @@\n'
+    ...                    ' line 11\n')     # line 11
+    >>> index.lines
+    (1, 2, 3, 11)
+    >>> index.position(3), index.position(11)
+    (4, 6)
+    >>> 11 in index, 4 in index
+    (True, False)
+    >>> index.position(4)
+    """
+
+    def __init__(self, patch: str):
+        """
+        :param patch: The unified diff of a single file, with or without the
+                      ``---`` and ``+++`` header lines.
+        """
+        self._lines = array('q')
+        self._positions = array('q')
+        position, line = 0, 0
+        # the lines of the current hunk still to come, in the old and the new
+        # file, header lines only occur outside of hunks
+        old_left, new_left = 0, 0
+        for diff_line in patch.splitlines():
+            if not (old_left or new_left) and not diff_line.startswith('@@'):
+                if (diff_line.startswith('---') or
+                        diff_line.startswith('+++')):
+                    continue
+            if diff_line.startswith('@@'):
+                match = HUNK_HEADER_REGEX.match(diff_line)
+                if match:
+                    _, old_count, start, new_count = match.groups()
+                    line = int(start)
+                    old_left = int(old_count or 1)
+                    new_left = int(new_count or 1)
+            elif diff_line.startswith('+') or diff_line.startswith(' '):
+                self._lines.append(line)
+                self._positions.append(position)
+                line += 1
+                new_left = max(new_left - 1, 0)
+                if diff_line.startswith(' '):
+                    old_left = max(old_left - 1, 0)
+            elif diff_line.startswith('-'):
+                old_left = max(old_left - 1, 0)
+            position += 1
+
+    @property
+    def lines(self) -> Tuple[int, ...]:
+        """
+        The numbers of the lines in the new version of the file that can be
+        commented on, in ascending order.
+        """
+        return tuple(self._lines)
+
+    def _find(self, line: int) -> int:
+        index = bisect_left(self._lines, line)
+        if index < len(self._lines) and self._lines[index] == line:
+            return index
+        return -1
+
+    def position(self, line: int) -> Optional[int]:
+        """
+        Retrieves the position of the line of the new version of the file in
+        the patch, or None if the patch doesn't contain it.
+        """
+        index = self._find(line)
+        return self._positions[index] if index >= 0 else None
+
+    def __contains__(self, line: int) -> bool:
+        return self._find(line) >= 0
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+
+class Hunk:
+    """
+    A hunk of the patch of a file: its header, e.g.
+    ``@@ -1,2 +1,3 @@ def main():``, the ranges of lines it covers in the old
+    and the new version of the file and its lines, starting with ``-``,
+    ``+``, `` `` or ``\``.
+    """
+
+    def __init__(self, header: str, old_start: int, old_count: int,
+                 new_start: int, new_count: int):
+        self.header = header
+        self.old_start = old_start
+        self.old_count = old_count
+        self.new_start = new_start
+        self.new_count = new_count
+        self.lines = []  # type: List[str]
+
+
+class FilePatch:
+    """
+    The patch of a single file in a unified diff, see ``read_patches``:
+
+    - ``headers`` holds the lines before the first hunk, e.g.
+      ``diff --git a/setup.py b/setup.py``
+    - ``old_path`` and ``new_path`` are None for added and deleted files
+      respectively, and for patches without headers
+    - ``hunks`` is an iterator over the Hunk objects, read from the diff only
+      while iterating it, it can't be iterated anymore once the next patch is
+      retrieved
+    """
+
+    def __init__(self, headers: List[str], hunks: Iterator[Hunk]):
+        self.headers = headers
+        self.hunks = hunks
+        self.old_path, self.new_path = None, None
+        paths = {}
+        for header in headers:
+            for prefix in ('--- ', '+++ ', 'rename from ', 'rename to '):
+                if header.startswith(prefix):
+                    paths[prefix] = header[len(prefix):].split('\t')[0]
+        if '--- ' in paths or '+++ ' in paths:
+            self.old_path, self.new_path = (
+                _patch_path(paths.get('--- ')), _patch_path(paths.get('+++ ')))
+        elif 'rename from ' in paths:
+            self.old_path = paths['rename from ']
+            self.new_path = paths.get('rename to ')
+        elif headers and headers[0].startswith('diff --git a/'):
+            # only the file mode changed or the file is binary
+            old_path, _, new_path = headers[0][13:].rpartition(' b/')
+            if not any(header.startswith('new file') for header in headers):
+                self.old_path = old_path
+            if not any(header.startswith('deleted file')
+                       for header in headers):
+                self.new_path = new_path
+
+
+def _patch_path(path: Optional[str]) -> Optional[str]:
+    """
+    Strips the ``a/`` or ``b/`` prefix from a path in a patch header.
+    """
+    if path is None or path == '/dev/null':
+        return None
+    return path[2:] if path[:2] in ('a/', 'b/') else path
+
+
+class _Lines:
+    """
+    An iterator over lines allowing to look at the next line ahead.
+    """
+
+    def __init__(self, lines: Iterable[str]):
+        self._lines = iter(lines)
+        self._next = next(self._lines, None)
+
+    def peek(self) -> Optional[str]:
+        return self._next
+
+    def pop(self) -> str:
+        line, self._next = self._next, next(self._lines, None)
+        return line
+
+
+def _read_headers(lines: _Lines) -> Optional[List[str]]:
+    """
+    Reads the header lines of the next patch, skipping anything before it.
+    Returns None at the end of the diff.
+    """
+    while lines.peek() is not None and not lines.peek().startswith(
+            ('diff ', '--- ', '@@')):
+        lines.pop()
+    if lines.peek() is None:
+        return None
+    headers = []  # type: List[str]
+    while lines.peek() is not None and not lines.peek().startswith('@@'):
+        line = lines.peek()
+        # another patch starts
+        if headers and (line.startswith('diff ') or line.startswith('--- ')
+                        and headers[-1].startswith('+++ ')):
+            break
+        headers.append(lines.pop())
+    return headers
+
+
+def _read_hunks(lines: _Lines) -> Iterator[Hunk]:
+    """
+    Reads the hunks of a patch, knowing where every hunk ends by the number
+    of lines stated in its header.
+    """
+    while lines.peek() is not None and lines.peek().startswith('@@'):
+        header = lines.pop()
+        match = HUNK_HEADER_REGEX.match(header)
+        if match is None:
+            continue
+        old_start, old_count, new_start, new_count = match.groups()
+        hunk = Hunk(header, int(old_start), int(old_count or 1),
+                    int(new_start), int(new_count or 1))
+        old_left, new_left = hunk.old_count, hunk.new_count
+        while lines.peek() is not None and (
+                old_left or new_left or lines.peek().startswith('\\')):
+            line = lines.pop()
+            hunk.lines.append(line)
+            if line.startswith('-'):
+                old_left = max(old_left - 1, 0)
+            elif line.startswith('+'):
+                new_left = max(new_left - 1, 0)
+            elif not line.startswith('\\'):
+                old_left, new_left = max(old_left - 1, 0), max(new_left - 1, 0)
+        yield hunk
+
+
+def read_patches(lines: Iterable[str]) -> Iterator[FilePatch]:
+    r"""
+    Reads the patches of the files in a unified diff from its lines as they
+    are needed, e.g. from ``Commit.iter_unified_diff``. Only a single hunk is
+    held in memory at any time.
+
+    >>> patches = read_patches(['diff --git a/setup.py b/setup.py',
+    ...                         'index 1da2df..2dacdf 100644',
+    ...                         '--- a/setup.py',
+    ...                         '+++ b/setup.py',
+    ...                         '@@ -1 +1,2 @@',
+    ...                         ' import os',
+    ...                         '+import re',
+    ...                         'diff --git a/README b/README',
+    ...                         'deleted file mode 100644',
+    ...                         '--- a/README',
+    ...                         '+++ /dev/null',
+    ...                         '@@ -1 +0,0 @@',
+    ...                         '-Hi!'])
+    >>> for patch in patches:
+    ...     print(patch.old_path, patch.new_path,
+    ...           [hunk.lines for hunk in patch.hunks])
+    setup.py setup.py [[' import os', '+import re']]
+    README None [['-Hi!']]
+    """
+    lines = _Lines(lines)
+    hunks = iter(())  # type: Iterator[Hunk]
+    while True:
+        # the rest of the previous patch comes first
+        for _ in hunks:
+            pass
+        headers = _read_headers(lines)
+        if headers is None:
+            return
+        hunks = _read_hunks(lines)
+        yield FilePatch(headers, hunks)
+
+
+class CommentOutcome:
+    """
+    The outcome of placing one of the comments given to
+    ``Commit.comment_many``:
+
+    - ``inline`` tells whether the comment is placed on its line, rather than
+      below the commit or on the merge request
+    - ``comment`` holds the placed Comment object, if the hoster tells about
+      it
+    - ``error`` holds the RuntimeError if placing the comment failed
+    """
+
+    def __init__(self, message: str, file: Optional[str],
+                 line: Optional[int], inline: bool):
+        self.message = message
+        self.file = file
+        self.line = line
+        self.inline = inline
+        self.comment = None
+        self.error = None  # type: Optional[RuntimeError]
 
 
 class Commit(IGittObject):
@@ -30,6 +447,9 @@ class Commit(IGittObject):
     An abstraction representing a commit. This especially exposes functions to
     place comments and manipulate the status.
     """
+    # the regular expressions matching the keywords closing issues on the
+    # hoster, by the name of the keyword
+    keyword_regexes = {}  # type: Dict[str, str]
 
     def ack(self):
         """
@@ -126,6 +546,143 @@ class Commit(IGittObject):
         """
         raise NotImplementedError
 
+    def get_patch_for_file(self, filename: str) -> str:
+        """
+        Retrieves the unified diff of the given file in this commit.
+
+        :param filename: The file to retrieve the patch for.
+        :return: A string containing the patch.
+        :raises ElementDoesntExistError: If the given filename doesn't exist.
+        """
+        raise NotImplementedError
+
+    def get_patch_index(self, filename: str) -> PatchIndex:
+        """
+        Retrieves the lines of the given file that can be commented on in this
+        commit, with their positions in the patch. The patch of every file is
+        retrieved and parsed only once for every commit object.
+
+        :param filename: The file to retrieve the index for.
+        :return: A PatchIndex object.
+        :raises ElementDoesntExistError: If the given filename doesn't exist.
+        """
+        indices = self.__dict__.setdefault('_patch_indices', {})
+        if filename not in indices:
+            try:
+                indices[filename] = PatchIndex(
+                    self.get_patch_for_file(filename))
+            except ElementDoesntExistError:
+                indices[filename] = None
+        if indices[filename] is None:
+            raise ElementDoesntExistError('The file does not exist.')
+        return indices[filename]
+
+    def comment_many(self,
+                     comments: Iterable[Tuple[str, Optional[str],
+                                              Optional[int]]],
+                     mr_number: Optional[int]=None,
+                     max_workers: int=MAX_COMMENT_WORKERS
+                    ) -> List[CommentOutcome]:
+        """
+        Places many comments at once, like ``comment`` does for a single one.
+        The patch of every file is retrieved only once and the comments are
+        placed concurrently, with at most ``max_workers`` requests in flight.
+
+        >>> outcomes = commit.comment_many([
+        ...     ('Unused import.', 'setup.py', 3),
+        ...     ('Missing docstring.', 'setup.py', 10),
+        ...     ('Looks good!', None, None)], mr_number=6)
+        >>> [outcome.inline for outcome in outcomes]
+        [True, True, False]
+
+        Placing a comment may fail without affecting the others, see the
+        ``error`` of its outcome.
+
+        :param comments:    Tuples(message, file, line), the file and line
+                            being None for comments below the commit.
+        :param mr_number:   The number of a merge request if the comments
+                            should end up in its review UI.
+        :param max_workers: The maximum number of concurrent requests.
+        :return:            A CommentOutcome object for every comment, in the
+                            same order.
+        """
+        outcomes = self._comment_outcomes(comments)
+        self._place_comments(
+            outcomes, [lambda outcome=outcome: self.comment(
+                outcome.message, outcome.file, outcome.line, mr_number)
+                       for outcome in outcomes], max_workers)
+        return outcomes
+
+    def _comment_position(self, file: Optional[str],
+                          line: Optional[int]) -> Optional[int]:
+        """
+        Retrieves the position of the line in the patch of the file, or None
+        if a comment can't be placed on it.
+        """
+        if file is None or line is None:
+            return None
+        try:
+            # the first line of the patch is the hunk header
+            return self.get_patch_index(file).position(line) or None
+        except ElementDoesntExistError:
+            return None
+
+    def _comment_outcomes(
+            self, comments: Iterable[Tuple[str, Optional[str],
+                                           Optional[int]]]
+    ) -> List[CommentOutcome]:
+        """
+        Creates the outcomes of the comments, knowing already which ones can
+        be placed on their lines. Every patch is retrieved here, once.
+        """
+        return [CommentOutcome(message, file, line,
+                               self._comment_position(file, line) is not None)
+                for message, file, line in comments]
+
+    @staticmethod
+    def _place_comments(outcomes: List[CommentOutcome],
+                        place: List[Callable[[], 'Comment.Comment']],
+                        max_workers: int):
+        """
+        Places the comments concurrently and records the outcomes.
+        """
+        def run(outcome, place_comment):
+            try:
+                outcome.comment = place_comment()
+            except RuntimeError as ex:
+                outcome.error = ex
+
+        if not outcomes:
+            return
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers,
+                                                       len(outcomes)))) as ex:
+            for future in [ex.submit(run, *args)
+                           for args in zip(outcomes, place)]:
+                future.result()
+
+    def iter_unified_diff(
+            self, line_filter: Optional[Callable[[str], bool]]=None
+    ) -> Iterator[str]:
+        """
+        Yields the lines of the unified diff for the commit, including the
+        diff index, as they arrive without ever holding the whole diff, e.g.
+        for very large commits. Only the lines passing the given filter are
+        yielded, if any.
+
+        :param line_filter: A function telling whether to yield a line.
+        :return: An iterator over the lines.
+        """
+        raise NotImplementedError
+
+    def iter_patches(self) -> Iterator[FilePatch]:
+        """
+        Yields the patches of the files changed by the commit, reading them
+        from the unified diff as they are needed, see ``read_patches``.
+
+        :return: An iterator over FilePatch objects.
+        """
+        return read_patches(self.iter_unified_diff())
+
     def set_status(self, status: CommitStatus):
         """
         Adds the given status to the commit. If a status with the same context
@@ -146,6 +703,15 @@ class Commit(IGittObject):
         """
         raise NotImplementedError
 
+    async def aget_statuses(self) -> Set[CommitStatus]:
+        """
+        Retrieves the all commit statuses without blocking the event loop.
+
+        :return: A (frozen)set of CommitStatus objects.
+        :raises RuntimeError: If something goes wrong (network, auth...).
+        """
+        raise NotImplementedError
+
     @property
     def combined_status(self) -> Status:
         """
@@ -208,49 +774,27 @@ class Commit(IGittObject):
         Returns a set of tuples(issue number, name of the repository the issue
         is contained in), which are mentioned with given ``keyword``.
         """
-        results = set()
-        hoster = self.repository.hoster
-        repo_name = self.repository.full_name
+        keywords = ((keyword, keyword), ) if keyword else ()
+        references = IssueReferenceScanner.get(
+            self.repository.hoster, keywords).scan(
+                body_list, self.repository.full_name)
+        return references.keywords[keyword] if keyword else references.mentions
 
-        identifier_regex = r'[\w\.-]+'
-        namespace_regex = r'(?:{0})/(?:{0})(?:/(?:{0}))?'.format(
-            identifier_regex)
-        concat_regex = '|'.join(kw for kw in CONCATENATION_KEYWORDS)
-        issue_no_regex = r'[1-9][0-9]*'
-        issue_url_regex = r'https?://{}\S+/issues/{}'.format(
-            hoster, issue_no_regex)
-        c_joint_regex = re.compile(
-            r'((?:{0})'         # match keywords expressed via ``keyword``
-
-            r'(?:(?:{3})?\s*'   # match conjunctions
-                                # eg: ',', 'and' etc.
-
-            r'(?:(?:\S*)#{2}|'  # match short references
-                                # eg: #123, coala/example#23
-
-            r'(?:{1})))+)'      # match full length issue URLs
-                                # eg: https://github.com/coala/coala/issues/23
-
-            r''.format(keyword,
-                       issue_url_regex, issue_no_regex, concat_regex))
-        c_issue_capture_regex = re.compile(
-            r'(?:(?:\s+|^)({2})?#({0}))|(?:https?://{1}\S+?/({2})/issues/({0}))'
-            ''.format(
-                issue_no_regex, hoster, namespace_regex))
-
-        for body in body_list:
-            matches = c_joint_regex.findall(body.replace('\r', ''))
-            refs = list(chain(*[c_issue_capture_regex.findall(match)
-                                for match in matches]))
-            for ref in refs:
-                if ref[0] != '':
-                    repo_name = ref[0]
-                if ref[1] != '':
-                    results.add((ref[1], repo_name))
-                if ref[2] != '' and ref[3] != '':
-                    results.add((ref[3], ref[2]))
-
-        return results
+    def get_issue_references(self) -> IssueReferences:
+        """
+        Finds the issues referenced in the commit message with the keywords of
+        the hoster, see ``keyword_regexes``, in a single pass. The result is
+        kept as long as the message stays the same.
+        """
+        message = self.message
+        cached = getattr(self, '_issue_references', None)
+        if cached is None or cached[0] != message:
+            scanner = IssueReferenceScanner.get(
+                self.repository.hoster,
+                tuple(sorted(self.keyword_regexes.items())))
+            cached = self._issue_references = (
+                message, scanner.scan([message], self.repository.full_name))
+        return cached[1]
 
     def _get_closes_issues(self) -> Set[int]:
         """
@@ -265,17 +809,14 @@ class Commit(IGittObject):
         # issues with matching keywords.
         if hoster not in SUPPORTED_HOST_KEYWORD_REGEX: # dont cover
             return set()
-        return self.get_keywords_issues(
-            SUPPORTED_HOST_KEYWORD_REGEX[self.repository.hoster],
-            [self.message]
-        )
+        return self.get_issue_references().closes
 
     def _get_mentioned_issues(self):
         """
         Returns a set of tuples(issue number, name of the repository the issue
         is contained in), which are related to this commit.
         """
-        return self.get_keywords_issues(r'', [self.message])
+        return self.get_issue_references().mentions
 
     @property
     def closes_issues(self) -> Set[Issue]:
@@ -147,6 +147,15 @@ class Issue(IGittObject):
         """
         raise NotImplementedError
 
+    async def acomments(self) -> List[Comment]:
+        """
+        Retrieves a list of comments which are on the issue excluding the
+        description without blocking the event loop.
+
+        :return: A list of Comment objects.
+        """
+        raise NotImplementedError
+
     def add_comment(self, body) -> Comment:
         """
         Adds a comment to the issue.
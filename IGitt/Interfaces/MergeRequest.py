@@ -2,17 +2,50 @@
 Contains a class that represents a request to merge something into some git
 branch.
 """
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from typing import Iterable
 from typing import List
+from typing import Optional
 from typing import Set
+import asyncio
 
+from IGitt.Interfaces.Comment import Comment
 from IGitt.Interfaces import MergeRequestStates
 from IGitt.Interfaces.Commit import Commit
+from IGitt.Interfaces.Commit import IssueReferenceScanner
 from IGitt.Interfaces.CommitStatus import Status
 from IGitt.Interfaces.Issue import Issue
 from IGitt.Interfaces.User import User
 from IGitt.Interfaces.Milestone import Milestone
 
+# how many of the commits and the comments of a merge request are fetched at
+# once to collect the issues referenced in them, one after another if 1
+MAX_REFERENCE_WORKERS = 2
+
+
+class MergeRequestIssueReferences:
+    """
+    The issues referenced in a merge request, as sets of Issue objects:
+
+    - ``closes_issues``, ``will_fix_issues``, ``will_close_issues`` and
+      ``will_resolve_issues`` hold the issues referenced with the keywords of
+      the hoster in the commit messages
+    - ``mentioned_issues`` holds the issues referenced anywhere in the commit
+      messages and the comments
+    """
+
+    def __init__(self, closes_issues: Set[Issue], will_fix_issues: Set[Issue],
+                 will_close_issues: Set[Issue],
+                 will_resolve_issues: Set[Issue],
+                 mentioned_issues: Set[Issue]):
+        self.closes_issues = closes_issues
+        self.will_fix_issues = will_fix_issues
+        self.will_close_issues = will_close_issues
+        self.will_resolve_issues = will_resolve_issues
+        self.mentioned_issues = mentioned_issues
+
 
 class MergeRequest(Issue):
     """
@@ -94,6 +127,15 @@ class MergeRequest(Issue):
         """
         raise NotImplementedError
 
+    async def acommits(self) -> List[Commit]:
+        """
+        Retrieves all commits that are contained in this request without
+        blocking the event loop.
+
+        :return: A list of Commits.
+        """
+        raise NotImplementedError
+
     @property
     def repository(self):
         """
@@ -162,13 +204,140 @@ class MergeRequest(Issue):
         """
         raise NotImplementedError
 
+    def _referenced_issue(self, repository: str, number: str) -> Issue:
+        """
+        Creates the Issue object for an issue referenced in this request.
+        """
+        raise NotImplementedError
+
+    def _collect_issue_references(
+            self, commits: Iterable[Commit],
+            comments: Iterable[Comment]) -> MergeRequestIssueReferences:
+        """
+        Collects the issues referenced in the given commits and comments
+        without making any request, the commits scan their messages only
+        once.
+        """
+        commits = tuple(commits)
+        bodies = ([commit.message for commit in commits] +
+                  [comment.body for comment in comments])
+        # short references carry the repository of the last reference with a
+        # repository name over to the following texts
+        mentions = IssueReferenceScanner.get(self.repository.hoster, ()).scan(
+            bodies, self.repository.full_name).mentions
+        return MergeRequestIssueReferences(
+            *({issue for commit in commits
+               for issue in getattr(commit, name)}
+              for name in ('closes_issues', 'will_fix_issues',
+                           'will_close_issues', 'will_resolve_issues')),
+            {self._referenced_issue(repository, number)
+             for number, repository in mentions})
+
+    @lru_cache(None)
+    def _issue_reference_memo(self) -> dict:
+        """
+        Holds the issue references of this request along with the commits
+        they were collected from, shared by all objects for this request like
+        the memoized commits.
+        """
+        return {}
+
+    def _memoized_issue_references(
+            self) -> Optional[MergeRequestIssueReferences]:
+        """
+        Returns the memoized issue references, unless there are none or the
+        commits they were collected from aren't the memoized commits anymore.
+        """
+        memo = self._issue_reference_memo()
+        if memo and self.commits is memo['commits']:
+            return memo['references']
+        return None
+
+    def issue_references(self) -> MergeRequestIssueReferences:
+        """
+        Retrieves all the issues referenced in the commits and comments of
+        this request at once. The first time, the commits and the comments are
+        fetched concurrently unless ``MAX_REFERENCE_WORKERS`` is 1, later on
+        the references are memoized as long as the commits are. Prefer this
+        to the single properties like ``closes_issues`` when more than one of
+        them is needed.
+
+        :return: A MergeRequestIssueReferences object.
+        """
+        memo = self._issue_reference_memo()
+        if memo:
+            references = self._memoized_issue_references()
+            if references is not None:
+                return references
+            commits, comments = self.commits, self.comments
+        elif MAX_REFERENCE_WORKERS <= 1:
+            commits, comments = self.commits, self.comments
+        else:
+            with ThreadPoolExecutor(
+                    max_workers=MAX_REFERENCE_WORKERS - 1) as executor:
+                pending_comments = executor.submit(lambda: self.comments)
+                commits = self.commits
+                comments = pending_comments.result()
+        references = self._collect_issue_references(commits, comments)
+        memo.update(commits=commits, references=references)
+        return references
+
+    async def aissue_references(self) -> MergeRequestIssueReferences:
+        """
+        Retrieves all the issues referenced in the commits and comments of
+        this request at once without blocking the event loop, see
+        ``issue_references``. The commits and the comments are always fetched,
+        as ``acommits`` isn't memoized.
+
+        :return: A MergeRequestIssueReferences object.
+        """
+        commits, comments = await asyncio.gather(self.acommits(),
+                                                 self.acomments())
+        return self._collect_issue_references(commits, comments)
+
+    def _commit_issues(self, name: str) -> Set[Issue]:
+        """
+        Retrieves the issues referenced with keywords in the commits, from the
+        memoized issue references if there are any. The comments aren't needed
+        for them.
+        """
+        references = self._memoized_issue_references()
+        if references is not None:
+            return getattr(references, name)
+        return {issue for commit in self.commits
+                for issue in getattr(commit, name)}
+
     @property
     def closes_issues(self) -> Set[Issue]:
         """
         Returns a set of Issue objects which would be closed upon merging this
         pull request.
         """
-        raise NotImplementedError
+        return self._commit_issues('closes_issues')
+
+    @property
+    def will_fix_issues(self) -> Set[Issue]:
+        """
+        Returns a set of Issue objects which would be fixed as stated in this
+        pull request.
+        """
+        return self._commit_issues('will_fix_issues')
+
+    @property
+    def will_close_issues(self) -> Set[Issue]:
+        """
+        Returns a set of Issue objects which would be closed as stated in this
+        pull request.
+        """
+        return self._commit_issues('will_close_issues')
+
+    @property
+    def will_resolve_issues(self) -> Set[Issue]:
+        """
+        Returns a set of Issue objects which would be resolved as stated in
+        this pull request.
+        """
+        return self._commit_issues('will_resolve_issues')
 
     @property
     def tests_passed(self) -> bool:
@@ -187,7 +356,7 @@ class MergeRequest(Issue):
         """
         Returns a set of Issue objects which are related to the pull request.
         """
-        raise NotImplementedError
+        return self.issue_references().mentioned_issues
 
     @property
     def author(self) -> User:
@@ -3,6 +3,7 @@ This module contains the milestone abstraction class which provides properties
 and actions related to milestones.
 """
 from datetime import datetime
+from typing import Optional
 from IGitt.Interfaces.Repository import Repository
 from IGitt.Interfaces import IGittObject
 from IGitt.Interfaces import MilestoneStates
@@ -146,11 +147,28 @@ class Milestone(IGittObject):
         """
         raise NotImplementedError
 
+    def filter_issues(self, limit: Optional[int]=None) -> set:
+        """
+        Retrieves a set of issue objects that are assigned to this milestone.
+
+        :param limit: The maximum number of issues to retrieve.
+        """
+        raise NotImplementedError
+
     @property
     def issues(self) -> set:
         """
         Retrieves a set of issue objects that are assigned to this milestone.
         """
+        return self.filter_issues()
+
+    def filter_merge_requests(self, limit: Optional[int]=None) -> set:
+        """
+        Retrieves a set of merge request objects that are assigned to this
+        milestone.
+
+        :param limit: The maximum number of merge requests to retrieve.
+        """
         raise NotImplementedError
 
     @property
@@ -159,4 +177,4 @@ class Milestone(IGittObject):
         Retrieves a set of merge request objects that are assigned to this
         milestone.
         """
-        raise NotImplementedError
+        return self.filter_merge_requests()
@@ -2,6 +2,7 @@
 Contains the Notification base class.
 """
 from enum import Enum
+from typing import Optional
 from typing import Union
 
 from IGitt.Interfaces import IGittObject
@@ -34,9 +35,11 @@ class Notification(IGittObject):
     Represents a notification/todo on GitHub or GitLab.
     """
     @staticmethod
-    def fetch_all(token: Token):
+    def fetch_all(token: Token, limit: Optional[int]=None):
         """
         Returns the list of notifications for the user bearing the token.
+
+        :param limit: The maximum number of notifications to retrieve.
         """
         raise NotImplementedError
 
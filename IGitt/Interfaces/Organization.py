@@ -2,6 +2,7 @@
 This module contains the Issue abstraction class which provides properties and
 actions related to issues and bug reports.
 """
+from typing import Iterator
 from typing import Set
 from typing import Optional
 
@@ -73,16 +74,28 @@ class Organization(IGittObject):
         """
         raise NotImplementedError
 
+    def iter_repositories(self,
+                          limit: Optional[int]=None) -> Iterator[Repository]:
+        """
+        Yields the repositories contained in this organization one by one as
+        they are fetched, without retrieving all of them first.
+
+        :param limit: The maximum number of repositories to yield.
+        """
+        raise NotImplementedError
+
     def filter_issues(self,
                       state: Optional[str]='opened',
                       label: Optional[str]=None,
-                      assignee: Optional[str]=None) -> Set[Issue]:
+                      assignee: Optional[str]=None,
+                      limit: Optional[int]=None) -> Set[Issue]:
         """
         Filters the issues in the organization based on properties
 
         :param state: 'opened' or 'closed' or 'all'
         :param label: Label of the issue
         :param assignee: username of issue assignee
+        :param limit: The maximum number of issues to retrieve
         :return: Set of Issue objects
         """
         raise NotImplementedError
@@ -6,6 +6,8 @@ from datetime import datetime
 from enum import Enum
 from os import chdir, getcwd
 from tempfile import mkdtemp
+from typing import AsyncIterator
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Set
@@ -207,15 +209,41 @@ class Repository(IGittObject):
         raise NotImplementedError
 
     @property
-    def filter_commits(self, author: Optional[str]=None):
+    def filter_commits(self, author: Optional[str]=None,
+                       limit: Optional[int]=None):
         """
         Filter commits based on properties.
 
         :author: Author of the commit.
+        :limit: The maximum number of commits to retrieve, newest first.
         :return: Set of Commit objects.
         """
         raise NotImplementedError
 
+    def iter_commits(self, author: Optional[str]=None,
+                     limit: Optional[int]=None) -> Iterator:
+        """
+        Yields the commits of this repository one by one as they are fetched,
+        without retrieving all of them first.
+
+        :author: Author of the commit.
+        :limit: The maximum number of commits to yield, newest first.
+        :yields: Commit objects.
+        """
+        raise NotImplementedError
+
+    def aiter_commits(self, author: Optional[str]=None,
+                      limit: Optional[int]=None) -> AsyncIterator:
+        """
+        Yields the commits of this repository one by one as they are fetched
+        without blocking the event loop, use it with ``async for``.
+
+        :author: Author of the commit.
+        :limit: The maximum number of commits to yield, newest first.
+        :yields: Commit objects.
+        """
+        raise NotImplementedError
+
     @property
     def commits(self):
         """
@@ -234,11 +262,50 @@ class Repository(IGittObject):
         """
         raise NotImplementedError
 
-    def filter_merge_requests(self, state: str='opened') -> set:
+    def filter_merge_requests(self, state: str='opened',
+                              limit: Optional[int]=None) -> set:
         """
         Filters the merge requests from the repository based on the state
         of the merge requests.
 
+        :param state: 'merged' or 'opened' or 'closed' or 'all'
+        :param limit: The maximum number of merge requests to retrieve,
+                      newest first.
+        """
+        raise NotImplementedError
+
+    def iter_merge_requests(self, state: str='opened',
+                            limit: Optional[int]=None) -> Iterator:
+        """
+        Yields the merge requests of the repository with the given state one
+        by one as they are fetched, without retrieving all of them first.
+
+        :param state: 'merged' or 'opened' or 'closed' or 'all'
+        :param limit: The maximum number of merge requests to yield, newest
+                      first.
+        :yields: MergeRequest objects.
+        """
+        raise NotImplementedError
+
+    def aiter_merge_requests(self, state: str='opened',
+                             limit: Optional[int]=None) -> AsyncIterator:
+        """
+        Yields the merge requests of the repository with the given state one
+        by one as they are fetched without blocking the event loop, use it
+        with ``async for``.
+
+        :param state: 'merged' or 'opened' or 'closed' or 'all'
+        :param limit: The maximum number of merge requests to yield, newest
+                      first.
+        :yields: MergeRequest objects.
+        """
+        raise NotImplementedError
+
+    def count_merge_requests(self, state: str='opened') -> int:
+        """
+        Counts the merge requests of the repository with the given state
+        without retrieving them.
+
         :param state: 'merged' or 'opened' or 'closed' or 'all'
         """
         raise NotImplementedError
@@ -253,7 +320,8 @@ class Repository(IGittObject):
     def filter_issues(self,
                       state: str='opened',
                       label: Optional[str]=None,
-                      assignee: Optional[str]=None
+                      assignee: Optional[str]=None,
+                      limit: Optional[int]=None
                      ) -> set:
         """
         Filters the issues from the repository based on properties.
@@ -261,6 +329,51 @@ class Repository(IGittObject):
         :param state: 'opened' or 'closed' or 'all'.
         :param label: Label of the issue
         :param assignee: username of issue assignee
+        :param limit: The maximum number of issues to retrieve, newest first.
+        """
+        raise NotImplementedError
+
+    def iter_issues(self,
+                    state: str='opened',
+                    label: Optional[str]=None,
+                    assignee: Optional[str]=None,
+                    limit: Optional[int]=None) -> Iterator:
+        """
+        Yields the issues of the repository matching the given properties one
+        by one as they are fetched, without retrieving all of them first.
+
+        :param state: 'opened' or 'closed' or 'all'.
+        :param label: Label of the issue
+        :param assignee: username of issue assignee
+        :param limit: The maximum number of issues to yield, newest first.
+        :yields: Issue objects.
+        """
+        raise NotImplementedError
+
+    def aiter_issues(self,
+                     state: str='opened',
+                     label: Optional[str]=None,
+                     assignee: Optional[str]=None,
+                     limit: Optional[int]=None) -> AsyncIterator:
+        """
+        Yields the issues of the repository matching the given properties one
+        by one as they are fetched without blocking the event loop, use it
+        with ``async for``.
+
+        :param state: 'opened' or 'closed' or 'all'.
+        :param label: Label of the issue
+        :param assignee: username of issue assignee
+        :param limit: The maximum number of issues to yield, newest first.
+        :yields: Issue objects.
+        """
+        raise NotImplementedError
+
+    def count_issues(self, state: str='opened') -> int:
+        """
+        Counts the issues of the repository with the given state without
+        retrieving them.
+
+        :param state: 'opened' or 'closed' or 'all'.
         """
         raise NotImplementedError
 
@@ -312,9 +425,10 @@ class Repository(IGittObject):
                    created_before: Optional[datetime]=None,
                    updated_after: Optional[datetime]=None,
                    updated_before: Optional[datetime]=None,
-                   state: Optional[MergeRequestStates]=None):
+                   state: Optional[MergeRequestStates]=None,
+                   limit: Optional[int]=None):
         """
-        Retrieves a list of prs
+        Retrieves a list of prs, at most ``limit`` of them if given.
         """
         raise NotImplementedError
 
@@ -323,9 +437,10 @@ class Repository(IGittObject):
                       created_before: Optional[datetime]=None,
                       updated_after: Optional[datetime]=None,
                       updated_before: Optional[datetime]=None,
-                      state: Optional[IssueStates]=None):
+                      state: Optional[IssueStates]=None,
+                      limit: Optional[int]=None):
         """
-        Retrieves a list of issues
+        Retrieves a list of issues, at most ``limit`` of them if given.
         """
         raise NotImplementedError
 
@@ -2,23 +2,67 @@
 This package contains an abstraction for a git repository.
 """
 from base64 import b64encode
+from json import loads
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from datetime import timedelta
+from email.utils import parsedate_to_datetime
 from enum import Enum
+from hashlib import sha1
+from itertools import islice
 from json.decoder import JSONDecodeError
+from threading import Event
+from threading import Lock
+from urllib.parse import parse_qs
+from urllib.parse import urlsplit
+from weakref import WeakKeyDictionary
+import asyncio
+import re
 import time
 from typing import Callable
 from typing import Dict
+from typing import Hashable
+from typing import Iterator
+from typing import List
 from typing import Optional
+from typing import Tuple
 
 from backoff import on_exception, expo
+from requests.utils import parse_header_links
+from requests.adapters import HTTPAdapter
 from requests.auth import AuthBase
 from requests.auth import HTTPBasicAuth
+import aiohttp
 import requests
 
 from IGitt.Utils import Cache
+from IGitt.Utils import CacheStats
+from IGitt.Utils import ImmutableCache
+from IGitt.Utils import NegativeCache
+from IGitt.Utils import aislice
+from IGitt.Utils import copy_json
+from IGitt.Utils import eliminate_none
 
 
 HEADERS = {'User-Agent': 'IGitt'}
+# the maximum number of pages of a paginated response fetched concurrently
+MAX_PAGE_WORKERS = 8
+# the largest page size GitHub and GitLab accept
+MAX_PER_PAGE = 100
+# the number of bytes of a streamed response body read at once
+STREAM_CHUNK_SIZE = 64 * 2 ** 10
+PAGE_PARAM_REGEX = re.compile(r'([?&]page=)[^&#]*')
+# the paths of resources a mutation at a path matching the pattern changes
+# besides its ancestors, e.g. setting a commit status changes the statuses of
+# the commit
+DEPENDENT_PATHS = [
+    (re.compile(r'/statuses/([0-9a-f]+)$'),
+     ('/commits/{0}/statuses', '/commits/{0}/status',
+      '/repository/commits/{0}/statuses')),
+]
+# how many ancestors of the mutated path are invalidated, e.g. the issue and
+# the issues collection after commenting on an issue
+MUTATED_ANCESTORS = 2
 
 
 class IGittObject:
@@ -95,6 +139,30 @@ class Token:
         """
         raise NotImplementedError
 
+    @property
+    def identity(self):
+        """
+        A hashable identity of the credentials held by this token, which is the
+        same for all token objects holding the same credentials. Only a digest
+        of the credentials is used so the identity can be kept around safely.
+        """
+        try:
+            value = self.value
+        except NotImplementedError:
+            return type(self).__name__, id(self)
+        if isinstance(value, bytes):
+            value = value.decode('utf-8')
+        return (type(self).__name__,
+                sha1(str(value).encode('utf-8')).hexdigest())
+
+    def members(self, url: str='') -> List['Token']:
+        """
+        The tokens to send a request to the given URL with, in the order in
+        which they are to be tried. That's just this token, unless it is a
+        ``TokenPool``.
+        """
+        return [self]
+
 
 class BasicAuthorizationToken(Token):
     """
@@ -131,6 +199,645 @@ class BasicAuthorizationToken(Token):
         return HTTPBasicAuth(self.username, self.password)
 
 
+class TokenPool(Token):
+    """
+    A token made up of several tokens with access to the same resources, e.g.
+    GitHub App installation tokens and personal tokens, which spreads the
+    requests over the quotas of all of them.
+
+    Every request is sent with the member having the most quota left on the
+    host, as tracked by its ``RateLimiter``, exhausted members are only used
+    when there is no other choice. If a member is rejected as unauthorized
+    (401) or because of a rate limit (403 or 429 while the ``RateLimiter`` of
+    the member is limited) the request is retried with the next one right
+    away and the member is passed over for the ``cooldown``. Only the last
+    member waits for its rate limit to be lifted. Other 403 responses, e.g.
+    for missing permissions, are raised.
+
+    >>> from IGitt.GitHub import GitHubToken
+    >>> pool = TokenPool([GitHubToken('first'), GitHubToken('second')])
+    >>> [member.value for member in pool.members('https://api.github.com')]
+    ['first', 'second']
+
+    A pool can be used wherever a single token can.
+    """
+    # how long a member rejected as unauthorized is passed over
+    cooldown = timedelta(minutes=10)
+
+    def __init__(self, tokens: List[Token]):
+        if not tokens:
+            raise ValueError('A token pool needs at least one token.')
+        self.tokens = list(tokens)
+        self._rejected = {}  # type: Dict[tuple, float]
+
+    def members(self, url: str='') -> List[Token]:
+        """
+        The member tokens in the order in which they are to be tried for a
+        request to the given URL, the one with the most quota left first.
+        """
+        now, uptime = time.time(), time.monotonic()
+
+        def preference(member):
+            """
+            Sorts out the rejected members, then the exhausted ones.
+            """
+            limiter = RateLimiter.get(member, url)
+            if limiter.retry_at > now:
+                quota = 0
+            elif limiter.remaining is None or limiter.reset_at <= now:
+                # the quota is unknown or has been reset since
+                quota = float('inf')
+            else:
+                quota = max(limiter.remaining, 0)
+            rejected = self._rejected.get(member.identity, 0) > uptime
+            return rejected, -quota
+
+        return sorted(self.tokens, key=preference)
+
+    def reject(self, member: Token):
+        """
+        Passes the given member over for the cooldown, as it has been rejected
+        as unauthorized or because of a rate limit.
+        """
+        self._rejected[member.identity] = (time.monotonic()
+                                           + self.cooldown.total_seconds())
+
+    @property
+    def identity(self):
+        return (type(self).__name__,) + tuple(member.identity
+                                              for member in self.tokens)
+
+    @property
+    def headers(self):
+        """
+        The headers of the preferred member.
+        """
+        return self.members()[0].headers
+
+    @property
+    def value(self):
+        """
+        The value of the preferred member.
+        """
+        return self.members()[0].value
+
+    @property
+    def parameter(self):
+        """
+        The parameter of the preferred member.
+        """
+        return self.members()[0].parameter
+
+    @property
+    def auth(self):
+        """
+        The authentication of the preferred member.
+        """
+        return self.members()[0].auth
+
+
+class SessionPool:
+    """
+    Keeps long-lived ``requests.Session`` objects around, one for every token
+    and host, so that the underlying connections are kept alive and reused
+    instead of paying a new TCP and TLS handshake on every request.
+
+    The sessions never carry any request state themselves, headers and query
+    parameters are passed along with every request, which makes it safe to
+    share them across threads.
+
+    To change the size of the connection pools or the time after which unused
+    sessions are closed, simply configure the pool before using IGitt.
+
+    >>> from datetime import timedelta
+    >>> SessionPool.configure(pool_maxsize=32,
+    ...                       idle_timeout=timedelta(minutes=10))
+
+    Use ``SessionPool.close()`` to close all the sessions, e.g. on shutdown.
+    """
+    pool_connections = 10
+    pool_maxsize = 10
+    idle_timeout = timedelta(minutes=5)
+    _sessions = {}  # type: Dict[tuple, list]
+    _lock = Lock()
+
+    @classmethod
+    def configure(cls,
+                  pool_connections: Optional[int]=None,
+                  pool_maxsize: Optional[int]=None,
+                  idle_timeout: Optional[timedelta]=None):
+        """
+        Configures the sessions to be created. Any existing sessions are closed
+        so the new configuration applies to all further requests.
+
+        :param pool_connections:
+            The number of connection pools to cache per session.
+        :param pool_maxsize:
+            The maximum number of connections to keep per connection pool,
+            i.e. the number of concurrent requests to a host that can be sent
+            without opening new connections.
+        :param idle_timeout:
+            The time after which an unused session gets closed.
+        """
+        if pool_connections is not None:
+            cls.pool_connections = pool_connections
+        if pool_maxsize is not None:
+            cls.pool_maxsize = pool_maxsize
+        if idle_timeout is not None:
+            cls.idle_timeout = idle_timeout
+        cls.close()
+
+    @classmethod
+    def get(cls, token: Token, url: str) -> requests.Session:
+        """
+        Retrieves the session to be used for the given token and URL, creating
+        it if needed. Sessions which haven't been used for longer than the
+        configured idle timeout are closed along the way.
+        """
+        key = (token.identity, urlsplit(url).netloc)
+        now = time.monotonic()
+        with cls._lock:
+            cls._evict_idle(now)
+            entry = cls._sessions.get(key)
+            if entry is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=cls.pool_connections,
+                                      pool_maxsize=cls.pool_maxsize)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                entry = cls._sessions[key] = [session, now]
+            entry[1] = now
+            return entry[0]
+
+    @classmethod
+    def _evict_idle(cls, now: float):
+        """
+        Closes and drops the sessions idle for longer than the idle timeout.
+        The lock has to be held by the caller.
+        """
+        timeout = cls.idle_timeout.total_seconds()
+        for key, (session, last_used) in list(cls._sessions.items()):
+            if now - last_used > timeout:
+                del cls._sessions[key]
+                session.close()
+
+    @classmethod
+    def close(cls):
+        """
+        Closes all sessions and their connections.
+        """
+        with cls._lock:
+            sessions, cls._sessions = cls._sessions, {}
+        for session, _ in sessions.values():
+            session.close()
+
+
+class AsyncSessionPool:
+    """
+    The asynchronous counterpart of ``SessionPool``, keeping one
+    ``aiohttp.ClientSession`` per token and host for every event loop, as
+    sessions cannot be shared between event loops.
+
+    Use ``await AsyncSessionPool.close()`` to close the sessions of the running
+    event loop, e.g. on shutdown.
+    """
+    # the maximum number of simultaneous connections per session
+    limit = 100
+    _sessions = WeakKeyDictionary()
+
+    @classmethod
+    def get(cls, token: Optional[Token], url: str) -> aiohttp.ClientSession:
+        """
+        Retrieves the session to be used for the given token and URL on the
+        running event loop, creating it if needed.
+        """
+        sessions = cls._sessions.setdefault(asyncio.get_event_loop(), {})
+        key = (token.identity if token else None, urlsplit(url).netloc)
+        session = sessions.get(key)
+        if session is None or session.closed:
+            session = sessions[key] = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=cls.limit))
+        return session
+
+    @classmethod
+    async def close(cls):
+        """
+        Closes all sessions of the running event loop and their connections.
+        """
+        sessions = cls._sessions.pop(asyncio.get_event_loop(), {})
+        for session in sessions.values():
+            await session.close()
+
+
+class RateLimiter:
+    """
+    Keeps track of the request quota of a token on a host, as told by the
+    ``X-RateLimit-*`` headers of GitHub or the ``RateLimit-*`` headers of
+    GitLab, so that the quota is never exhausted by accident.
+
+    Once less than the ``reserve`` share of the quota is left, the remaining
+    requests are spread evenly over the time until the quota is reset. When
+    the quota is exhausted nonetheless, or a secondary rate limit is hit
+    (403 or 429 responses with a ``Retry-After`` header), requests sleep until
+    the limit is lifted and are retried instead of failing.
+
+    Waiting for a reset may take up to an hour, to fail with a RuntimeError
+    instead of waiting that long set the longest acceptable wait before using
+    IGitt, None waits as long as needed.
+
+    >>> from datetime import timedelta
+    >>> RateLimiter.max_wait = timedelta(minutes=1)
+    >>> RateLimiter.max_wait = None
+
+    The limiter of a token is shared by all requests using it, e.g.
+    ``RateLimiter.get(token, url).remaining`` tells the quota left.
+    """
+    # the share of the quota below which the requests are paced
+    reserve = 0.1
+    # the longest time to wait for a limit to be lifted, forever if None
+    max_wait = None  # type: Optional[timedelta]
+    # how often a rate limited request is retried before failing
+    max_retries = 3
+    _limiters = {}  # type: Dict[tuple, RateLimiter]
+    _registry_lock = Lock()
+
+    def __init__(self):
+        self.limit = None  # type: Optional[int]
+        self.remaining = None  # type: Optional[int]
+        # the epoch times at which the quota is reset and the secondary rate
+        # limit is lifted
+        self.reset_at = 0.0
+        self.retry_at = 0.0
+        self._last_sent = 0.0
+        self._lock = Lock()
+
+    @classmethod
+    def get(cls, token: Token, url: str) -> 'RateLimiter':
+        """
+        Retrieves the limiter of the given token on the host of the given URL.
+        """
+        key = (token.identity, urlsplit(url).netloc)
+        with cls._registry_lock:
+            limiter = cls._limiters.get(key)
+            if limiter is None:
+                limiter = cls._limiters[key] = cls()
+            return limiter
+
+    @classmethod
+    def clear(cls):
+        """
+        Forgets everything known about the quotas of all tokens.
+        """
+        with cls._registry_lock:
+            cls._limiters = {}
+
+    @staticmethod
+    def _header(headers, name: str) -> Optional[int]:
+        """
+        Reads the given rate limit header in either of the GitHub and GitLab
+        flavours.
+        """
+        value = headers.get('X-RateLimit-' + name,
+                            headers.get('RateLimit-' + name))
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _retry_after(value: str, now: float) -> Optional[float]:
+        """
+        Converts the value of a ``Retry-After`` header, which is either a
+        number of seconds or a HTTP date, into an epoch time.
+
+        >>> RateLimiter._retry_after('30', 1000.0)
+        1030.0
+        >>> RateLimiter._retry_after('Thu, 01 Jan 1970 00:20:00 GMT', 0.0)
+        1200.0
+        >>> RateLimiter._retry_after('soon', 0.0) is None
+        True
+        """
+        try:
+            return now + float(value)
+        except ValueError:
+            pass
+        try:
+            return parsedate_to_datetime(value).timestamp()
+        except (TypeError, ValueError):
+            return None
+
+    def _delay(self, now: float) -> float:
+        """
+        Returns the number of seconds to wait before sending the next request.
+        The lock has to be held by the caller.
+        """
+        if self.retry_at > now:
+            return self.retry_at - now
+        if self.remaining is None or self.reset_at <= now:
+            return 0.0
+        if self.remaining <= 0:
+            return self.reset_at - now
+        if self.limit and self.remaining > self.limit * self.reserve:
+            return 0.0
+        # spread the remaining requests evenly until the reset
+        interval = (self.reset_at - now) / self.remaining
+        return max(0.0, self._last_sent + interval - now)
+
+    def _reserve(self) -> float:
+        """
+        Claims a request from the quota and returns the number of seconds to
+        wait before sending it.
+
+        :raises RuntimeError: If the wait would exceed ``max_wait``.
+        """
+        with self._lock:
+            now = time.time()
+            delay = self._delay(now)
+            if (self.max_wait is not None
+                    and delay > self.max_wait.total_seconds()):
+                raise RuntimeError('Rate limit exceeded, it is lifted in '
+                                   '{:.0f} seconds.'.format(delay), 429)
+            self._last_sent = now + delay
+            if self.remaining is not None and self.reset_at > now:
+                # waiting for the reset doesn't make the quota negative
+                self.remaining = max(self.remaining - 1, 0)
+            return delay
+
+    @property
+    def limited(self) -> bool:
+        """
+        Tells whether the quota is exhausted or a secondary rate limit is in
+        effect, as told by the last response.
+        """
+        now = time.time()
+        with self._lock:
+            return self.retry_at > now or (self.remaining is not None and
+                                           self.remaining <= 0 and
+                                           self.reset_at > now)
+
+    def acquire(self):
+        """
+        Blocks until the next request may be sent.
+        """
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def aacquire(self):
+        """
+        Waits without blocking the event loop until the next request may be
+        sent.
+        """
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def update(self, status: int, headers) -> bool:
+        """
+        Takes the quota from the headers of a response.
+
+        :return: True if the request was rejected because of a rate limit and
+                 should be retried once it is lifted.
+        """
+        limit = self._header(headers, 'Limit')
+        remaining = self._header(headers, 'Remaining')
+        reset = self._header(headers, 'Reset')
+        now = time.time()
+        with self._lock:
+            if remaining is not None and reset is not None:
+                # GitHub and GitLab send an epoch time, the IETF draft the
+                # number of seconds until the reset
+                reset_at = float(reset if reset > 10 ** 9 else now + reset)
+                if reset_at == self.reset_at and self.remaining is not None:
+                    # responses can arrive out of order, the quota only drops
+                    remaining = min(remaining, self.remaining)
+                self.limit = limit or self.limit
+                self.remaining, self.reset_at = remaining, reset_at
+            if status not in (403, 429):
+                return False
+            retry_at = self._retry_after(headers.get('Retry-After', ''), now)
+            if retry_at is not None:
+                self.retry_at = retry_at
+                return True
+            return (self.remaining is not None and self.remaining <= 0
+                    and self.reset_at > now)
+
+
+class _FailoverLimiter:
+    """
+    Stands in for the ``RateLimiter`` of a token pool member that isn't the
+    last one to try: instead of waiting for a rate limit to be lifted and
+    retrying, the request is rejected right away so that the pool fails over
+    to the next member.
+    """
+    max_retries = 0
+
+    def __init__(self, limiter: RateLimiter):
+        self.limiter = limiter
+
+    def _check(self):
+        """
+        Rejects the request if the member is rate limited already.
+        """
+        if self.limiter.limited:
+            raise RuntimeError('Rate limit exceeded.', 429)
+
+    def acquire(self):
+        """
+        Blocks until the next request may be sent, unless that means waiting
+        for a rate limit to be lifted.
+        """
+        self._check()
+        self.limiter.acquire()
+
+    async def aacquire(self):
+        """
+        Like ``acquire`` without blocking the event loop.
+        """
+        self._check()
+        await self.limiter.aacquire()
+
+    def update(self, status: int, headers) -> bool:
+        """
+        Takes the quota from the headers of a response, see
+        ``RateLimiter.update``.
+        """
+        return self.limiter.update(status, headers)
+
+
+class SingleFlight:
+    """
+    Lets concurrent identical calls share a single execution: the first
+    caller of a key runs the function, the ones arriving while it runs wait
+    for it and get its result or exception as well. A mutable result can be
+    passed through ``share`` to give each caller a copy of its own, the result
+    itself is handed to none of them.
+
+    >>> flight = SingleFlight()
+    >>> flight.do('key', lambda: 42)
+    42
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._calls = {}  # type: Dict[Hashable, dict]
+        self._tasks = {}  # type: Dict[Hashable, asyncio.Future]
+
+    def do(self, key: Hashable, func: Callable,
+           share: Optional[Callable]=None):
+        """
+        Returns what ``func`` returns, calling it unless a call for the same
+        key is in flight already in another thread. The result is passed
+        through ``share`` for every caller, if given.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = {'done': Event()}
+        if not leader:
+            call['done'].wait()
+            if 'error' in call:
+                raise call['error']
+            return share(call['result']) if share else call['result']
+
+        try:
+            call['result'] = func()
+        except BaseException as ex:
+            call['error'] = ex
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call['done'].set()
+        return share(call['result']) if share else call['result']
+
+    async def ado(self, key: Hashable, func: Callable,
+                  share: Optional[Callable]=None):
+        """
+        Returns what the coroutine returned by ``func`` returns, awaiting it
+        unless one for the same key is in flight already on the event loop.
+        The key has to be specific to the event loop. The result is passed
+        through ``share`` for every caller, if given.
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = self._tasks[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        # a cancelled caller must not cancel the others
+        result = await asyncio.shield(task)
+        return share(result) if share else result
+
+
+def _flight_key(*args, params: Optional[Dict]=None,
+                headers: Optional[Dict]=None) -> tuple:
+    """
+    Builds a hashable key out of the given arguments and request parameters
+    and headers.
+
+    >>> _flight_key('url', params={'b': 1, 'a': [2]}, headers=None)
+    ('url', (('a', '[2]'), ('b', '1')), ())
+    """
+    return args + tuple(tuple(sorted((key, str(value))
+                                     for key, value in (items or {}).items()))
+                        for items in (params, headers))
+
+
+# concurrent identical GET requests are sent only once
+_GET_FLIGHTS = SingleFlight()
+
+
+def _copy_response(response: Tuple[object, dict]) -> Tuple[object, dict]:
+    """
+    Copies the data and links of a response, so that the callers sharing a
+    request in flight can't modify each other's.
+    """
+    data, links = response
+    return copy_json(data), copy_json(links)
+
+
+class Freshness:
+    """
+    A policy for serving cached responses to GET requests without any request
+    while they are fresh, i.e. fetched at most ``max_age`` ago. Responses
+    stale for at most ``stale_while_revalidate`` more are served as well,
+    while being revalidated in the background.
+
+    Cached responses changed according to a webhook are never fresh.
+
+    >>> policy = Freshness(timedelta(seconds=30), timedelta(minutes=5))
+    >>> policy.state({'fetchedAt': 100, 'fromWebhook': False}, now=110)
+    'fresh'
+    >>> policy.state({'fetchedAt': 100, 'fromWebhook': False}, now=200)
+    'stale'
+    >>> policy.state({'fetchedAt': 100, 'fromWebhook': False}, now=500)
+    >>> policy.state({'fetchedAt': 100, 'fromWebhook': True}, now=110)
+    """
+    FRESH = 'fresh'
+    STALE = 'stale'
+
+    def __init__(self, max_age: timedelta,
+                 stale_while_revalidate: Optional[timedelta]=None):
+        self.max_age = max_age
+        self.stale_while_revalidate = stale_while_revalidate
+
+    def state(self, entry: dict, now: float) -> Optional[str]:
+        """
+        Tells whether the cached entry can be served as it is, ``FRESH``,
+        while revalidating it, ``STALE``, or not at all, None.
+        """
+        if entry['fromWebhook'] or entry.get('fetchedAt') is None:
+            return None
+        age = now - entry['fetchedAt']
+        if age <= self.max_age.total_seconds():
+            return self.FRESH
+        if (self.stale_while_revalidate is not None and
+                age <= (self.max_age +
+                        self.stale_while_revalidate).total_seconds()):
+            return self.STALE
+        return None
+
+    @property
+    def revalidation(self) -> 'Freshness':
+        """
+        The policy for revalidating stale entries, which serves entries
+        revalidated in the meantime as they are.
+        """
+        return Freshness(self.max_age)
+
+
+# stale cached responses are revalidated in the background with these
+_REVALIDATOR = ThreadPoolExecutor(max_workers=MAX_PAGE_WORKERS)
+_BACKGROUND_TASKS = set()  # type: set
+
+
+def _serve_fresh(key: str, freshness: Optional[Freshness],
+                 revalidate: Callable) -> Optional[dict]:
+    """
+    Returns the cached entry under the key if the freshness policy allows
+    serving it without a request, having it revalidated by the given function
+    in the background if it is stale.
+    """
+    if freshness is None:
+        return None
+    entry = Cache.get(key)
+    state = entry and freshness.state(entry, time.time())
+    if state == Freshness.STALE:
+        revalidate()
+    return entry if state else None
+
+
+def _in_background(coroutine):
+    """
+    Runs the coroutine in the background on the event loop.
+    """
+    task = asyncio.ensure_future(coroutine)
+    # keep a reference until it's done, its errors are of no interest
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_BACKGROUND_TASKS.discard)
+    task.add_done_callback(lambda done: done.cancelled() or done.exception())
+
+
 def is_client_error_or_unmodified(exception):
     """
     Returns true if the request responded with a client error.
@@ -138,15 +845,135 @@ def is_client_error_or_unmodified(exception):
     return (400 <= exception.args[1] < 500) or (exception.args[1] == 304)
 
 
+def page_number(url: str) -> Optional[int]:
+    """
+    Retrieves the page a paginated URL points to.
+
+    >>> page_number('https://api.github.com/user/repos?per_page=100&page=3')
+    3
+    >>> page_number('https://api.github.com/user/repos') is None
+    True
+    """
+    try:
+        return int(parse_qs(urlsplit(url).query)['page'][-1])
+    except (KeyError, ValueError):
+        return None
+
+
+def page_url(url: str, page: int) -> str:
+    """
+    Points the given paginated URL to the given page.
+
+    >>> page_url('https://gitlab.com/api/v4/projects?page=2&per_page=100', 5)
+    'https://gitlab.com/api/v4/projects?page=5&per_page=100'
+    """
+    return PAGE_PARAM_REGEX.sub(r'\g<1>{}'.format(page), url)
+
+
+def _complete_links(links: dict, headers) -> dict:
+    """
+    GitLab states the number of pages in a header, so provide the link to the
+    last page like GitHub does, if it's missing.
+    """
+    total_pages = headers.get('X-Total-Pages')
+    if ('next' in links and 'last' not in links and total_pages and
+            page_number(links['next']['url']) is not None):
+        links['last'] = {'url': page_url(links['next']['url'], total_pages),
+                         'rel': 'last'}
+    return links
+
+
 def parse_response(response: requests.Response):
     """
     Parses the response object into JSON and link headers and returns them.
     """
+    links = _complete_links(dict(response.links), response.headers)
     try:
-        return response.json(), response.links
+        return response.json(), links
     except JSONDecodeError:
         # if the response body is pure text, for e.g. a git diff.
-        return response.text, response.links
+        return response.text, links
+
+
+def parse_async_response(body: str, headers) -> Tuple:
+    """
+    Parses the body and headers of an ``aiohttp`` response into JSON and link
+    headers like ``parse_response`` and returns them.
+    """
+    links = {}
+    for link in parse_header_links(headers.get('Link', '')):
+        links[link.get('rel') or link.get('url')] = link
+    links = _complete_links(links, headers)
+    try:
+        return loads(body), links
+    except ValueError:
+        # if the response body is pure text, for e.g. a git diff.
+        return body, links
+
+
+def _rejected(limiter: RateLimiter, error: RuntimeError) -> bool:
+    """
+    Tells whether a request failed with the given error because the member
+    with the given limiter was rejected as unauthorized or rate limited,
+    rather than e.g. for missing permissions.
+    """
+    status = error.args[1] if len(error.args) > 1 else None
+    return status == 401 or (status in (403, 429) and limiter.limited)
+
+
+def _with_failover(token: Token, url: str, send: Callable):
+    """
+    Returns what ``send`` returns for the given token and the rate limiter to
+    send the requests with. With a token pool its members are passed one
+    after another, as long as they are rejected as unauthorized or rate
+    limited. Only the last member waits for a rate limit to be lifted.
+    """
+    members = token.members(url)
+    for member in members[:-1]:
+        limiter = RateLimiter.get(member, url)
+        try:
+            return send(member, _FailoverLimiter(limiter))
+        except RuntimeError as ex:
+            if not _rejected(limiter, ex):
+                raise
+            token.reject(member)
+    return send(members[-1], RateLimiter.get(members[-1], url))
+
+
+async def _awith_failover(token: Token, url: str, send: Callable):
+    """
+    Like ``_with_failover`` for ``send`` returning a coroutine.
+    """
+    members = token.members(url)
+    for member in members[:-1]:
+        limiter = RateLimiter.get(member, url)
+        try:
+            return await send(member, _FailoverLimiter(limiter))
+        except RuntimeError as ex:
+            if not _rejected(limiter, ex):
+                raise
+            token.reject(member)
+    return await send(members[-1], RateLimiter.get(members[-1], url))
+
+
+def _send(rate_limiter: Optional[RateLimiter], method: Callable, url: str,
+          **kwargs) -> requests.Response:
+    """
+    Sends a request, paced by the given rate limiter if any, which also has it
+    retried once the rate limit that rejected it is lifted.
+    """
+    if rate_limiter is None:
+        return method(url, **kwargs)
+    attempts = 0
+    while True:
+        rate_limiter.acquire()
+        resp = method(url, **kwargs)
+        limited = rate_limiter.update(resp.status_code, resp.headers)
+        if not limited or attempts == rate_limiter.max_retries:
+            return resp
+        # hand the connection of a streamed response back to the pool
+        resp.close()
+        attempts += 1
 
 
 @on_exception(expo, ConnectionError, max_tries=8)
@@ -157,42 +984,389 @@ def parse_response(response: requests.Response):
 def get_response(method: Callable,
                  url: str,
                  auth: AuthBase,
-                 json: Optional[Dict]=frozenset()):
+                 json: Optional[Dict]=frozenset(),
+                 headers: Optional[Dict]=None,
+                 params: Optional[Dict]=None,
+                 rate_limiter: Optional[RateLimiter]=None,
+                 freshness: Optional[Freshness]=None,
+                 scope: Optional[Hashable]=None):
     """
     Sends a request and returns the response. Also checks the response for
-    errors, and keeps retrying unless it's a HTTP Client Error.
+    errors, and keeps retrying unless it's a HTTP Client Error. Requests are
+    paced by the given rate limiter, if any. Cached responses to GET requests
+    are served without a request as long as the given freshness policy, if
+    any, allows it, and always for immutable resources.
+
+    Responses are cached per URL, query parameters and scope, i.e. the
+    identity of the token the request is sent on behalf of, see
+    ``Cache.key``. Mutations update the cache, see ``_write_through``.
+    Responses telling the resource doesn't exist are raised again without a
+    request for a short time, see ``NegativeCache``.
     """
+    headers = dict(headers or {})
     if method.__name__.lower() != 'get':
-        resp = method(url, auth=auth, json=dict(json or {}))
+        resp = _send(rate_limiter, method, url, auth=auth,
+                     json=dict(json or {}), headers=headers, params=params)
         if resp.status_code >= 300 and resp.status_code != 304:
             raise RuntimeError(resp.text, resp.status_code)
-        return parse_response(resp)
+        data, links = parse_response(resp)
+        if resp.status_code < 300:
+            _write_through(method.__name__.lower(), url, data,
+                           resp.headers.get('ETag'), scope)
+        return data, links
+
+    key = Cache.key(url, params, scope)
+    missing = NegativeCache.get(key)
+    if missing:
+        CacheStats.record('hits', key)
+        raise RuntimeError(*missing)
+    immutable = ImmutableCache.key(url, params, headers, scope)
+    fresh = (ImmutableCache.get(immutable) if immutable else
+             _serve_fresh(key, freshness, lambda: _REVALIDATOR.submit(
+                 get_response, method, url, auth, json, headers, params,
+                 rate_limiter, freshness.revalidation, scope)))
+    if fresh:
+        CacheStats.record('hits', key)
+        return fresh['data'], fresh['links']
 
+    # the session method is specific to the token, so is the key
+    return _GET_FLIGHTS.do(
+        _flight_key(method, url, params=params, headers=headers),
+        lambda: _get_cached(method, url, auth, json, headers, params,
+                            rate_limiter, freshness, key, immutable),
+        _copy_response)
+
+
+def _revalidated(key: str, cached_resp: dict, freshness: Optional[Freshness],
+                 immutable: Optional[str]):
+    """
+    Updates the cache once the cached response has been revalidated. A
+    response for an immutable resource, e.g. cached by a persistent store
+    before a restart, is copied to the ``ImmutableCache``.
+    """
+    CacheStats.record('revalidations', key)
+    if immutable is not None:
+        ImmutableCache.set(immutable, {'data': cached_resp['data'],
+                                       'links': cached_resp['links']})
+    elif freshness is not None:
+        # the entry is fresh again
+        Cache.update(key, {'fetchedAt': time.time()})
+
+
+def _get_cached(method: Callable, url: str, auth: AuthBase,
+                json: Optional[Dict], headers: Dict, params: Optional[Dict],
+                rate_limiter: Optional[RateLimiter],
+                freshness: Optional[Freshness], key: str,
+                immutable: Optional[str]):
+    """
+    Sends a GET request going through the cache under the given key, see
+    ``get_response``. Responses for immutable resources go to the
+    ``ImmutableCache`` with the given immutable key as well.
+    """
     # cache only GET requests
-    cached_resp, headers = Cache.get(url), {}
+    cached_resp = Cache.get(key)
     if cached_resp:
         if cached_resp['fromWebhook']:
             headers['If-Modified-Since'] = cached_resp.get('lastFetched')
         else:
             headers['If-None-Match'] = cached_resp.get('entityTag')
-    resp = method(url, auth=auth, json=dict(json or {}), headers=headers)
+    resp = _send(rate_limiter, method, url, auth=auth, json=dict(json or {}),
+                 headers=headers, params=params)
     if resp.status_code == 304 and cached_resp:
+        _revalidated(key, cached_resp, freshness, immutable)
         return cached_resp.get('data'), cached_resp.get('links')
     elif resp.status_code >= 300:
+        NegativeCache.set(key, resp.text, resp.status_code)
         raise RuntimeError(resp.text, resp.status_code)
 
     data, links = parse_response(resp)
+    CacheStats.record('misses', key)
+    if immutable is not None:
+        ImmutableCache.set(immutable, {'data': data, 'links': links})
     # update entry in cache
-    Cache.set(url, {
+    Cache.set(key, {
         'entityTag': resp.headers.get('ETag'),
         'data': data,
-        'links': links
+        'links': links,
+        'fetchedAt': time.time()
     })
     return data, links
 
 
+def _mutated_urls(url: str) -> List[str]:
+    """
+    Lists the URLs of the resources a mutation at the given URL changes, i.e.
+    the URL itself, its ancestors and its dependents.
+
+    >>> _mutated_urls('https://api.github.com/repos/a/b/issues/1/comments')
+    ... # doctest: +NORMALIZE_WHITESPACE
+    ['https://api.github.com/repos/a/b/issues/1/comments',
+     'https://api.github.com/repos/a/b/issues/1',
+     'https://api.github.com/repos/a/b/issues']
+    """
+    parts = urlsplit(url)
+    base = '{}://{}'.format(parts.scheme, parts.netloc)
+    path = parts.path.rstrip('/')
+    paths = [path]
+    for _ in range(MUTATED_ANCESTORS):
+        path = path.rsplit('/', 1)[0]
+        if not path:
+            break
+        paths.append(path)
+    for pattern, dependents in DEPENDENT_PATHS:
+        match = pattern.search(parts.path)
+        if match:
+            paths += [parts.path[:match.start()] + dependent.format(
+                *match.groups()) for dependent in dependents]
+    return [base + path for path in paths]
+
+
+def _invalidate(key: str):
+    """
+    Makes sure the cached response under the key, if any, is neither fresh
+    nor revalidated but fetched again, even if the resource was missing.
+    """
+    NegativeCache.discard(key)
+    entry = Cache.get(key)
+    if entry:
+        Cache.set(key, {**entry, 'entityTag': None, 'fetchedAt': None,
+                        'fromWebhook': False})
+    else:
+        Cache.unindex(key)
+
+
+def _write_through(method: str, url: str, data, entity_tag: Optional[str],
+                   scope: Optional[Hashable]):
+    """
+    Updates the cache after a successful mutation at the given URL, within the
+    given scope, so that reading the mutated resources afterwards doesn't
+    serve stale data.
+
+    The resource in the response is cached as if it was just fetched with
+    ``get`` if it is a single resource, i.e. the one patched or put at the URL
+    or the one created by a post to the URL stating another URL as its own.
+    Other responses, e.g. a created resource stating the collection it was
+    posted to as its URL, aren't cached. The cached responses for the other
+    resources changed, see ``_mutated_urls``, are invalidated along with the
+    responses for the same URLs with any other query parameters, e.g. the
+    open issues of a repository.
+    """
+    written = written_key = None
+    if isinstance(data, dict):
+        own_url = data.get('url')
+        if not (isinstance(own_url, str) and
+                urlsplit(own_url).netloc == urlsplit(url).netloc):
+            own_url = None
+        if method in ('patch', 'put'):
+            if own_url == url or (own_url is None and 'id' in data):
+                written = url
+        elif own_url is not None and own_url.rstrip('/') != url.rstrip('/'):
+            written = own_url
+    if written is not None:
+        written_key = Cache.key(written, {'per_page': MAX_PER_PAGE}, scope)
+        NegativeCache.discard(written_key)
+        Cache.set(written_key, {
+            'entityTag': entity_tag,
+            'data': data,
+            'links': {},
+            'fetchedAt': time.time()
+        })
+    for mutated in _mutated_urls(url):
+        for key in Cache.keys(mutated, scope):
+            if key != written_key:
+                _invalidate(key)
+
+
+@on_exception(expo, (ConnectionError, aiohttp.ClientConnectionError),
+              max_tries=8)
+@on_exception(expo,
+              RuntimeError,
+              max_tries=3,
+              giveup=is_client_error_or_unmodified)
+async def aget_response(session: aiohttp.ClientSession,
+                        method: str,
+                        url: str,
+                        auth: AuthBase,
+                        json: Optional[Dict]=frozenset(),
+                        headers: Optional[Dict]=None,
+                        params: Optional[Dict]=None,
+                        rate_limiter: Optional[RateLimiter]=None,
+                        freshness: Optional[Freshness]=None,
+                        scope: Optional[Hashable]=None):
+    """
+    Sends a request without blocking the event loop and returns the response
+    like ``get_response`` does, going through the same cache for GET requests
+    under the same keys, with the same freshness policy and paced by the same
+    rate limiter.
+
+    The request is prepared with ``requests`` so that the authentication of
+    every token, e.g. OAuth1 signatures, is applied the same way.
+    """
+    if method != 'get':
+        return await _arequest(session, method, url, auth, json, headers,
+                               params, rate_limiter, scope=scope)
+    key = Cache.key(url, params, scope)
+    missing = NegativeCache.get(key)
+    if missing:
+        CacheStats.record('hits', key)
+        raise RuntimeError(*missing)
+    immutable = ImmutableCache.key(url, params, headers, scope)
+    fresh = (ImmutableCache.get(immutable) if immutable else
+             _serve_fresh(key, freshness, lambda: _in_background(
+                 aget_response(session, method, url, auth, json, headers,
+                               params, rate_limiter, freshness.revalidation,
+                               scope))))
+    if fresh:
+        CacheStats.record('hits', key)
+        return fresh['data'], fresh['links']
+
+    # sessions are specific to the token and the event loop, so is the key
+    return await _GET_FLIGHTS.ado(
+        _flight_key(session, url, params=params, headers=headers),
+        lambda: _arequest(session, method, url, auth, json, headers, params,
+                          rate_limiter, freshness, key, immutable),
+        _copy_response)
+
+
+async def _arequest(session: aiohttp.ClientSession, method: str, url: str,
+                    auth: AuthBase, json: Optional[Dict],
+                    headers: Optional[Dict], params: Optional[Dict],
+                    rate_limiter: Optional[RateLimiter],
+                    freshness: Optional[Freshness]=None,
+                    key: Optional[str]=None,
+                    immutable: Optional[str]=None,
+                    scope: Optional[Hashable]=None):
+    """
+    Sends a request, see ``aget_response``. Responses to GET requests are
+    cached under the given key, mutations update the cache within the given
+    scope.
+    """
+    headers = dict(headers or {})
+    cached_resp = Cache.get(key) if method == 'get' else None
+    if cached_resp:
+        if cached_resp['fromWebhook']:
+            headers['If-Modified-Since'] = cached_resp.get('lastFetched')
+        else:
+            headers['If-None-Match'] = cached_resp.get('entityTag')
+    # like requests sessions do, leave out the headers without a value, e.g.
+    # a missing entity tag
+    request = requests.Request(
+        method.upper(), url, auth=auth, headers=eliminate_none(headers),
+        params=params,
+        json=None if method == 'get' else dict(json or {})).prepare()
+    attempts = 0
+    while True:
+        if rate_limiter is not None:
+            await rate_limiter.aacquire()
+        async with session.request(request.method, request.url,
+                                   headers=dict(request.headers),
+                                   data=request.body) as resp:
+            status, resp_headers = resp.status, resp.headers
+            body = await resp.text()
+        limited = (rate_limiter is not None
+                   and rate_limiter.update(status, resp_headers))
+        if not limited or attempts == rate_limiter.max_retries:
+            break
+        attempts += 1
+
+    if status == 304 and cached_resp:
+        _revalidated(key, cached_resp, freshness, immutable)
+        return cached_resp.get('data'), cached_resp.get('links')
+    elif status >= 300 and (method == 'get' or status != 304):
+        if method == 'get':
+            NegativeCache.set(key, body, status)
+        raise RuntimeError(body, status)
+
+    data, links = parse_async_response(body, resp_headers)
+    if immutable is not None:
+        ImmutableCache.set(immutable, {'data': data, 'links': links})
+    if method == 'get':
+        CacheStats.record('misses', key)
+        Cache.set(key, {
+            'entityTag': resp_headers.get('ETag'),
+            'data': data,
+            'links': links,
+            'fetchedAt': time.time()
+        })
+    elif status < 300:
+        _write_through(method, url, data, resp_headers.get('ETag'), scope)
+    return data, links
+
+
+def _page_items(resp) -> list:
+    """
+    Retrieves the list of items contained in a page of a paginated response.
+    """
+    if isinstance(resp, dict):
+        # if response is a dict with `items` key, i.e. a list of items
+        return resp['items']
+    if isinstance(resp, list):
+        # if response is a list of items
+        return resp
+    return []
+
+
+def _get_remaining_pages(method: Callable,
+                         links: dict,
+                         auth: AuthBase,
+                         headers: dict,
+                         params: dict,
+                         max_pages: Optional[int]=None,
+                         rate_limiter: Optional[RateLimiter]=None,
+                         freshness: Optional[Freshness]=None,
+                         scope: Optional[Hashable]=None
+                        ) -> Optional[List[Tuple]]:
+    """
+    Fetches all the pages from the ``next`` link up to the ``last`` link
+    concurrently. Every page still goes through the cache.
+
+    :param max_pages:
+        The maximum number of pages to fetch, all of them if None.
+    :return:
+        A list of the parsed responses and link headers in page order or None
+        if the page numbers cannot be determined from the links.
+    """
+    next_url = links['next']['url']
+    first, last = page_number(next_url), page_number(links['last']['url'])
+    if first is None or last is None:
+        return None
+    if max_pages is not None:
+        last = min(last, first + max_pages - 1)
+
+    def fetch_page(page):
+        """
+        Fetches a single page.
+        """
+        return get_response(method, page_url(next_url, page), auth,
+                            headers=headers, params=params,
+                            rate_limiter=rate_limiter, freshness=freshness,
+                            scope=scope)
+
+    pages = range(first, last + 1)
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_PAGE_WORKERS,
+                                                   len(pages)))) as executor:
+        return list(executor.map(fetch_page, pages))
+
+
+def _pages_needed(limit: Optional[int], collected: int,
+                  page_size: int) -> Optional[int]:
+    """
+    Computes how many more pages are needed to reach the limit, None meaning
+    all of them.
+
+    >>> _pages_needed(250, 100, 100)
+    2
+    >>> _pages_needed(None, 100, 100) is None
+    True
+    """
+    if limit is None:
+        return None
+    return -(-(limit - collected) // max(page_size, 1))
+
+
 def _fetch(url: str, req_type: str, token: Token, data: Optional[dict]=None,
-           query_params: Optional[dict]=None, headers: Optional[dict]=None):
+           query_params: Optional[dict]=None, headers: Optional[dict]=None,
+           limit: Optional[int]=None, freshness: Optional[Freshness]=None):
     """
     Fetch all the contents by following the ``Link`` header.
 
@@ -208,16 +1382,38 @@ def _fetch(url: str, req_type: str, token: Token, data: Optional[dict]=None,
         Any additional query parameters that should be sent with the request.
     :param headers:
         Any additional headers that should be sent with request.
+    :param limit:
+        The maximum number of items to collect. Pagination stops as soon as
+        this many items have been received.
+    :param freshness:
+        The policy for serving cached responses without any request.
     :return:
         A dictionary or a list of dictionaries if the response contains
         multiple items (usually in case of pagination) or a string in case of
         other format received (e.g. when fetching a git patch or diff) and the
         corresponding HTTP status code.
     """
+    # the members of a token pool share their cached responses
+    return _with_failover(
+        token, url, lambda member, rate_limiter: _fetch_with_token(
+            member, rate_limiter, url, req_type, data, query_params, headers,
+            limit, freshness, token.identity))
+
+
+def _fetch_with_token(token: Token, rate_limiter: RateLimiter, url: str,
+                      req_type: str, data: Optional[dict],
+                      query_params: Optional[dict], headers: Optional[dict],
+                      limit: Optional[int],
+                      freshness: Optional[Freshness]=None,
+                      scope: Optional[Hashable]=None):
+    """
+    Does what ``_fetch`` does with the given single token and its rate
+    limiter, caching the responses within the given scope.
+    """
     data_container = []
-    session = requests.Session()
-    session.headers.update({**dict(headers or {}), **HEADERS, **token.headers})
-    session.params.update({**dict(query_params or {}), **token.parameter})
+    session = SessionPool.get(token, url)
+    headers = {**dict(headers or {}), **HEADERS, **token.headers}
+    params = {**dict(query_params or {}), **token.parameter}
     req_methods = {
         'get': session.get,
         'post': session.post,
@@ -226,7 +1422,10 @@ def _fetch(url: str, req_type: str, token: Token, data: Optional[dict]=None,
         'delete': session.delete
     }
     method = req_methods[req_type.lower()]
-    resp, links = get_response(method, url, token.auth, json=data)
+    resp, links = get_response(method, url, token.auth, json=data,
+                               headers=headers, params=params,
+                               rate_limiter=rate_limiter, freshness=freshness,
+                               scope=scope)
 
     # if the response body is pure text
     if isinstance(resp, str):
@@ -236,24 +1435,50 @@ def _fetch(url: str, req_type: str, token: Token, data: Optional[dict]=None,
         return resp
 
     while True:
-        if isinstance(resp, dict):
-            if 'items' in resp:
-                # if response is a dict with `items` key, i.e. a list of items
-                data_container.extend(resp['items'])
-            else:
-                # if response is a single item
-                return resp
-        elif isinstance(resp, list):
-            # if response is a list of items
-            data_container.extend(resp)
+        if isinstance(resp, dict) and 'items' not in resp:
+            # if response is a single item
+            return resp
+        items = _page_items(resp)
+        data_container.extend(items)
+        if limit is not None and len(data_container) >= limit:
+            return data_container[:limit]
         if not links.get('next', False):
             return data_container
+        # if the last page is known, get the remaining pages at once, only as
+        # many as needed to reach the limit if there is one
+        max_pages = _pages_needed(limit, len(data_container), len(items))
+        pages = (_get_remaining_pages(method, links, token.auth, headers,
+                                      params, max_pages, rate_limiter,
+                                      freshness, scope)
+                 if req_type.lower() == 'get' and links.get('last') else None)
+        if pages:
+            *fetched, (resp, links) = pages
+            for page, _ in fetched:
+                data_container.extend(_page_items(page))
+            continue
         resp, links = get_response(
-            method, links.get('next')['url'], token.auth, json=data)
+            method, links.get('next')['url'], token.auth, json=data,
+            headers=headers, params=params, rate_limiter=rate_limiter,
+            freshness=freshness, scope=scope)
+
+
+def _per_page(limit: Optional[int]) -> int:
+    """
+    Chooses the page size for fetching at most ``limit`` items.
+
+    >>> _per_page(None)
+    100
+    >>> _per_page(20)
+    20
+    >>> _per_page(250)
+    100
+    """
+    return MAX_PER_PAGE if limit is None else max(1, min(MAX_PER_PAGE, limit))
 
 
 def get(token: Token, url: str, params: Optional[dict]=None,
-        headers: Optional[dict]=None):
+        headers: Optional[dict]=None, limit: Optional[int]=None,
+        freshness: Optional[Freshness]=None):
     """
     Queries the given URL for data.
 
@@ -261,6 +1486,14 @@ def get(token: Token, url: str, params: Optional[dict]=None,
     :param url: The URL to access.
     :param params: The query params to be sent.
     :param headers: The request headers to be sent.
+    :param limit:
+        The maximum number of items to retrieve from a paginated resource. The
+        page size is chosen accordingly and no further pages are requested
+        once enough items have been received.
+    :param freshness:
+        The policy for serving cached responses without any request, e.g.
+        ``Freshness(timedelta(seconds=30))`` to not even revalidate responses
+        fetched during the last 30 seconds.
     :return:
         A dictionary or a list of dictionary if the response contains multiple
         items (usually in case of pagination) and the HTTP status code.
@@ -268,8 +1501,187 @@ def get(token: Token, url: str, params: Optional[dict]=None,
         If the response indicates any problem.
     """
     return _fetch(url, 'get', token,
-                  query_params={**dict(params or {}), 'per_page': 100},
-                  headers=headers)
+                  query_params={**dict(params or {}),
+                                'per_page': _per_page(limit)},
+                  headers=headers, limit=limit, freshness=freshness)
+
+
+def cache_key(token: Token, url: str, params: Optional[dict]=None,
+              limit: Optional[int]=None) -> str:
+    """
+    Returns the key the response to ``get(token, url, params, limit=limit)``
+    is cached under, e.g. to update the cached data of an object when a
+    webhook tells it has changed.
+
+    :param token: A token.
+    :param url: The URL to access.
+    :param params: The query params to be sent.
+    :param limit: The maximum number of items to retrieve.
+    """
+    return Cache.key(url, {**dict(params or {}), 'per_page': _per_page(limit)},
+                     token.identity)
+
+
+def iter_get(token: Token, url: str, params: Optional[dict]=None,
+             headers: Optional[dict]=None,
+             limit: Optional[int]=None) -> Iterator:
+    """
+    Queries the given URL for data and yields the items one by one as soon as
+    the page containing them arrives, following the ``Link`` header. Only a
+    single page is held in memory at any time.
+
+    :param token: A token.
+    :param url: The URL to access.
+    :param params: The query params to be sent.
+    :param headers: The request headers to be sent.
+    :param limit:
+        The maximum number of items to yield. The page size is chosen
+        accordingly and no further pages are requested once enough items have
+        been yielded.
+    :yields:
+        The items of all pages or the single item if the response contains
+        only one.
+    :raises RunTimeError:
+        If the response indicates any problem.
+    """
+    def start(member, rate_limiter):
+        """
+        Fetches the first page with the given token.
+        """
+        items = _iter_get_with_token(member, rate_limiter, url, params,
+                                     headers, limit, token.identity)
+        return items, list(islice(items, 1))
+
+    items, first = _with_failover(token, url, start)
+    yield from first
+    yield from items
+
+
+def _iter_get_with_token(token: Token, rate_limiter: RateLimiter, url: str,
+                         params: Optional[dict], headers: Optional[dict],
+                         limit: Optional[int],
+                         scope: Optional[Hashable]=None) -> Iterator:
+    """
+    Does what ``iter_get`` does with the given single token, caching the
+    responses within the given scope. The first page is requested with the
+    given rate limiter.
+    """
+    session = SessionPool.get(token, url)
+    headers = {**dict(headers or {}), **HEADERS, **token.headers}
+    params = {**dict(params or {}), 'per_page': _per_page(limit),
+              **token.parameter}
+    resp, links = get_response(session.get, url, token.auth,
+                               headers=headers, params=params,
+                               rate_limiter=rate_limiter, scope=scope)
+    # once the first page arrived there's no failing over anymore
+    rate_limiter = RateLimiter.get(token, url)
+
+    while True:
+        if isinstance(resp, dict) and 'items' not in resp:
+            # if response is a single item
+            yield resp
+            return
+        items = _page_items(resp)
+        if limit is not None:
+            items = items[:limit]
+            limit -= len(items)
+        yield from items
+        if limit == 0 or not links.get('next', False):
+            return
+        resp, links = get_response(session.get, links['next']['url'],
+                                   token.auth, headers=headers, params=params,
+                                   rate_limiter=rate_limiter, scope=scope)
+
+
+def count(token: Token, url: str, params: Optional[dict]=None,
+          headers: Optional[dict]=None) -> int:
+    """
+    Counts the items of the paginated resource at the given URL without
+    downloading them, by requesting pages of a single item and reading the
+    number of the last page. Search results state their ``total_count``
+    instead.
+
+    :param token: A token.
+    :param url: The URL to access.
+    :param params: The query params to be sent.
+    :param headers: The request headers to be sent.
+    :return: The number of items.
+    :raises RunTimeError:
+        If the response indicates any problem.
+    """
+    resp, links = _with_failover(
+        token, url, lambda member, rate_limiter: get_response(
+            SessionPool.get(member, url).get, url, member.auth,
+            headers={**dict(headers or {}), **HEADERS, **member.headers},
+            params={**dict(params or {}), 'per_page': 1, **member.parameter},
+            rate_limiter=rate_limiter, scope=token.identity))
+
+    if isinstance(resp, dict) and 'total_count' in resp:
+        return resp['total_count']
+    if 'next' not in links:
+        return len(_page_items(resp))
+    total = page_number(links['last']['url']) if 'last' in links else None
+    if total is None:
+        # GitLab omits the totals for very large collections
+        return len(get(token, url, params, headers))
+    return total
+
+
+def iter_lines(token: Token, url: str, params: Optional[dict]=None,
+               headers: Optional[dict]=None,
+               chunk_size: int=STREAM_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Queries the given URL and yields the lines of the response body, without
+    the line breaks, as soon as they arrive, e.g. for very large diffs. Only a
+    chunk of the body is held in memory at any time, so the response isn't
+    cached.
+
+    :param token: A token.
+    :param url: The URL to access.
+    :param params: The query params to be sent.
+    :param headers: The request headers to be sent.
+    :param chunk_size: The number of bytes read at once.
+    :yields: The lines of the response body.
+    :raises RunTimeError:
+        If the response indicates any problem.
+    """
+    resp = _with_failover(token, url, lambda member, rate_limiter:
+                          _stream_with_token(member, rate_limiter, url,
+                                             params, headers))
+    with closing(resp):
+        if resp.encoding is None:
+            resp.encoding = 'utf-8'
+        # the start of the line the last chunk ended in
+        pending = []  # type: List[str]
+        for chunk in resp.iter_content(chunk_size, decode_unicode=True):
+            lines = chunk.split('\n')
+            if len(lines) > 1:
+                lines[0] = ''.join(pending) + lines[0]
+                pending = []
+                yield from lines[:-1]
+            pending.append(lines[-1])
+        rest = ''.join(pending)
+        if rest:
+            yield rest
+
+
+@on_exception(expo, ConnectionError, max_tries=8)
+def _stream_with_token(token: Token, rate_limiter: RateLimiter, url: str,
+                       params: Optional[dict],
+                       headers: Optional[dict]) -> requests.Response:
+    """
+    Sends a GET request with the given single token and its rate limiter for
+    ``iter_lines`` and returns the response, its body not being read yet.
+    """
+    resp = _send(rate_limiter, SessionPool.get(token, url).get,
+                 url, auth=token.auth,
+                 headers={**dict(headers or {}), **HEADERS, **token.headers},
+                 params={**dict(params or {}), **token.parameter},
+                 stream=True)
+    if resp.status_code >= 300:
+        with closing(resp):
+            raise RuntimeError(resp.text, resp.status_code)
+    return resp
 
 
 def post(token: Token, url: str, data: dict, headers: Optional[dict]=None):
@@ -337,6 +1749,226 @@ def delete(token:Token, url: str, data: Optional[dict]=None,
     _fetch(url, 'delete', token, data, query_params=params, headers=headers)
 
 
+async def _aget_remaining_pages(session: aiohttp.ClientSession,
+                                links: dict,
+                                auth: AuthBase,
+                                headers: dict,
+                                params: dict,
+                                max_pages: Optional[int]=None,
+                                rate_limiter: Optional[RateLimiter]=None,
+                                freshness: Optional[Freshness]=None,
+                                scope: Optional[Hashable]=None
+                               ) -> Optional[List[Tuple]]:
+    """
+    Fetches the pages from the ``next`` link up to the ``last`` link
+    concurrently on the event loop like ``_get_remaining_pages``, with at most
+    ``MAX_PAGE_WORKERS`` requests in flight.
+    """
+    next_url = links['next']['url']
+    first, last = page_number(next_url), page_number(links['last']['url'])
+    if first is None or last is None:
+        return None
+    if max_pages is not None:
+        last = min(last, first + max_pages - 1)
+    semaphore = asyncio.Semaphore(max(1, MAX_PAGE_WORKERS))
+
+    async def fetch_page(page):
+        """
+        Fetches a single page.
+        """
+        async with semaphore:
+            return await aget_response(session, 'get',
+                                       page_url(next_url, page), auth,
+                                       headers=headers, params=params,
+                                       rate_limiter=rate_limiter,
+                                       freshness=freshness, scope=scope)
+
+    return list(await asyncio.gather(*(fetch_page(page)
+                                       for page in range(first, last + 1))))
+
+
+async def _afetch(url: str, req_type: str, token: Token,
+                  data: Optional[dict]=None,
+                  query_params: Optional[dict]=None,
+                  headers: Optional[dict]=None,
+                  limit: Optional[int]=None,
+                  freshness: Optional[Freshness]=None):
+    """
+    Fetch all the contents by following the ``Link`` header without blocking
+    the event loop. See ``_fetch`` for the parameters and the return value.
+    """
+    return await _awith_failover(
+        token, url, lambda member, rate_limiter: _afetch_with_token(
+            member, rate_limiter, url, req_type, data, query_params, headers,
+            limit, freshness, token.identity))
+
+
+async def _afetch_with_token(token: Token, rate_limiter: RateLimiter,
+                             url: str, req_type: str, data: Optional[dict],
+                             query_params: Optional[dict],
+                             headers: Optional[dict], limit: Optional[int],
+                             freshness: Optional[Freshness]=None,
+                             scope: Optional[Hashable]=None):
+    """
+    Does what ``_afetch`` does with the given single token and its rate
+    limiter, caching the responses within the given scope.
+    """
+    data_container = []
+    session = AsyncSessionPool.get(token, url)
+    headers = {**dict(headers or {}), **HEADERS, **token.headers}
+    params = {**dict(query_params or {}), **token.parameter}
+    method = req_type.lower()
+    resp, links = await aget_response(session, method, url, token.auth,
+                                      json=data, headers=headers,
+                                      params=params,
+                                      rate_limiter=rate_limiter,
+                                      freshness=freshness, scope=scope)
+
+    # if the response body is pure text
+    if isinstance(resp, str):
+        # if the response body is empty, for e.g. in case of a DELETE request
+        if resp == '':
+            return []
+        return resp
+
+    while True:
+        if isinstance(resp, dict) and 'items' not in resp:
+            # if response is a single item
+            return resp
+        items = _page_items(resp)
+        data_container.extend(items)
+        if limit is not None and len(data_container) >= limit:
+            return data_container[:limit]
+        if not links.get('next', False):
+            return data_container
+        max_pages = _pages_needed(limit, len(data_container), len(items))
+        pages = (await _aget_remaining_pages(session, links, token.auth,
+                                             headers, params, max_pages,
+                                             rate_limiter, freshness, scope)
+                 if method == 'get' and links.get('last') else None)
+        if pages:
+            *fetched, (resp, links) = pages
+            for page, _ in fetched:
+                data_container.extend(_page_items(page))
+            continue
+        resp, links = await aget_response(
+            session, method, links['next']['url'], token.auth, json=data,
+            headers=headers, params=params, rate_limiter=rate_limiter,
+            freshness=freshness, scope=scope)
+
+
+async def aget(token: Token, url: str, params: Optional[dict]=None,
+               headers: Optional[dict]=None, limit: Optional[int]=None,
+               freshness: Optional[Freshness]=None):
+    """
+    Queries the given URL for data without blocking the event loop. See
+    ``get`` for the parameters and the return value.
+    """
+    return await _afetch(url, 'get', token,
+                         query_params={**dict(params or {}),
+                                       'per_page': _per_page(limit)},
+                         headers=headers, limit=limit, freshness=freshness)
+
+
+async def aiter_get(token: Token, url: str, params: Optional[dict]=None,
+                    headers: Optional[dict]=None, limit: Optional[int]=None):
+    """
+    Queries the given URL for data and yields the items one by one as soon as
+    the page containing them arrives, without blocking the event loop. See
+    ``iter_get`` for the parameters.
+    """
+    async def start(member, rate_limiter):
+        """
+        Fetches the first page with the given token.
+        """
+        items = _aiter_get_with_token(member, rate_limiter, url, params,
+                                      headers, limit, token.identity)
+        return items, [item async for item in aislice(items, 1)]
+
+    items, first = await _awith_failover(token, url, start)
+    for item in first:
+        yield item
+    async for item in items:
+        yield item
+
+
+async def _aiter_get_with_token(token: Token, rate_limiter: RateLimiter,
+                                url: str, params: Optional[dict],
+                                headers: Optional[dict],
+                                limit: Optional[int],
+                                scope: Optional[Hashable]=None):
+    """
+    Does what ``aiter_get`` does with the given single token, caching the
+    responses within the given scope. The first page is requested with the
+    given rate limiter.
+    """
+    session = AsyncSessionPool.get(token, url)
+    headers = {**dict(headers or {}), **HEADERS, **token.headers}
+    params = {**dict(params or {}), 'per_page': _per_page(limit),
+              **token.parameter}
+    resp, links = await aget_response(session, 'get', url, token.auth,
+                                      headers=headers, params=params,
+                                      rate_limiter=rate_limiter, scope=scope)
+    # once the first page arrived there's no failing over anymore
+    rate_limiter = RateLimiter.get(token, url)
+
+    while True:
+        if isinstance(resp, dict) and 'items' not in resp:
+            # if response is a single item
+            yield resp
+            return
+        items = _page_items(resp)
+        if limit is not None:
+            items = items[:limit]
+            limit -= len(items)
+        for item in items:
+            yield item
+        if limit == 0 or not links.get('next', False):
+            return
+        resp, links = await aget_response(session, 'get',
+                                          links['next']['url'], token.auth,
+                                          headers=headers, params=params,
+                                          rate_limiter=rate_limiter,
+                                          scope=scope)
+
+
+async def apost(token: Token, url: str, data: dict,
+                headers: Optional[dict]=None):
+    """
+    Posts the given data to the given URL without blocking the event loop. See
+    ``post`` for the parameters and the return value.
+    """
+    return await _afetch(url, 'post', token, data, headers=headers)
+
+
+async def aput(token: Token, url: str, data: dict,
+               headers: Optional[dict]=None):
+    """
+    Puts the given data to the given URL without blocking the event loop. See
+    ``put`` for the parameters and the return value.
+    """
+    return await _afetch(url, 'put', token, data, headers=headers)
+
+
+async def apatch(token: Token, url: str, data: dict,
+                 headers: Optional[dict]=None):
+    """
+    Patches the given data to the given URL without blocking the event loop.
+    See ``patch`` for the parameters and the return value.
+    """
+    return await _afetch(url, 'patch', token, data, headers=headers)
+
+
+async def adelete(token: Token, url: str, data: Optional[dict]=None,
+                  headers: Optional[dict]=None, params: Optional[dict]=None):
+    """
+    Sends a delete request to the given URL without blocking the event loop.
+    See ``delete`` for the parameters.
+    """
+    await _afetch(url, 'delete', token, data, query_params=params,
+                  headers=headers)
+
+
 async def lazy_get(url: str,
                    callback: Callable,
                    headers: Optional[dict]=None,
@@ -344,7 +1976,7 @@ async def lazy_get(url: str,
                    interval: Optional[timedelta]=timedelta(seconds=10)):
     """
     Queries GitHub on the given URL for data, waiting while it
-    returns HTTP 202.
+    returns HTTP 202. The event loop keeps running other tasks meanwhile.
 
     :param url: The full URL to query.
     :param callback:
@@ -355,15 +1987,20 @@ async def lazy_get(url: str,
         datetime.timedelta object with time to keep in between tries.
     :param headers: The request headers to be sent.
     """
-    response = requests.get(url, headers=headers, timeout=3000)
+    session = AsyncSessionPool.get(None, url)
+    request_timeout = aiohttp.ClientTimeout(total=3000)
 
-    # Wait and re-request to allow github to process query
-    while response.status_code == 202 and timeout.total_seconds() > 0:
-        time.sleep(interval.total_seconds())
+    while True:
+        async with session.get(url, headers=headers,
+                               timeout=request_timeout) as response:
+            # Wait and re-request to allow github to process query
+            if response.status != 202 or timeout.total_seconds() <= 0:
+                data = await response.json(content_type=None)
+                break
+        await asyncio.sleep(interval.total_seconds())
         timeout -= interval
-        response = requests.get(url, headers=headers, timeout=3000)
 
-    await callback(response.json())
+    await callback(data)
 
 
 class AccessLevel(Enum):
@@ -264,7 +264,8 @@ class JiraRepository(JiraMixin, Repository):
                       created_before: Optional[datetime]=None,
                       updated_after: Optional[datetime]=None,
                       updated_before: Optional[datetime]=None,
-                      state: Optional[IssueStates] = None):
+                      state: Optional[IssueStates] = None,
+                      limit: Optional[int]=None):
         """
         List open issues in the repository.
         """
@@ -34,7 +34,7 @@ class JiraMixin(CachedDataMixin):
     """
 
     def _get_data(self):
-        return get(self._token, self.url)
+        return get(self._token, self.url, freshness=self.freshness)
 
     @staticmethod
     def absolute_url(url):
@@ -0,0 +1,164 @@
+"""
+Provides a persistent store for the cache, see ``IGitt.Utils.Cache``.
+"""
+from datetime import timedelta
+from threading import local
+from typing import Optional
+from typing import Union
+import os
+import sqlite3
+import time
+import zlib
+
+
+_TEXT = 1
+_COMPRESSED = 2
+
+
+class SQLiteStore:
+    """
+    A dict kind of thing (supporting item getting, setting and deletion)
+    keeping the cache entries in a SQLite database file, so that they and
+    their entity tags survive restarts and are shared by all processes using
+    the same file.
+
+    >>> from IGitt.Utils import Cache, MarshalSerializer
+    >>> store = SQLiteStore('/tmp/igitt-cache.db', ttl=timedelta(days=7),
+    ...                     max_bytes=2 ** 30, compress=True)
+    >>> Cache.use(store.__getitem__, store.__setitem__, MarshalSerializer())
+
+    The database is used in WAL mode, so that readers don't block the
+    writer. Every connection is specific to a thread and a process.
+    """
+
+    def __init__(self, path: str, ttl: Optional[timedelta]=None,
+                 max_bytes: Optional[int]=None, compress: bool=False,
+                 compact_every: int=1000):
+        """
+        :param path:          The path to the database file.
+        :param ttl:           The time after which entries are dropped, never
+                              by default.
+        :param max_bytes:     The budget for the total size of the stored
+                              entries, beyond which the oldest entries are
+                              dropped, unlimited by default.
+        :param compress:      Whether to compress the entries with zlib.
+        :param compact_every: The number of writes after which expired and
+                              the oldest entries are dropped.
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.compress = compress
+        self.compact_every = compact_every
+        self._writes = 0
+        self._local = local()
+        with self._connection as connection:
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS entries ('
+                'key TEXT PRIMARY KEY, value BLOB NOT NULL, '
+                'flags INTEGER NOT NULL, size INTEGER NOT NULL, '
+                'stored REAL NOT NULL, expires REAL)')
+            connection.execute('CREATE INDEX IF NOT EXISTS entries_stored '
+                               'ON entries (stored)')
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        """
+        The connection of the current thread and process.
+        """
+        if getattr(self._local, 'pid', None) != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return self._local.connection
+
+    def __getitem__(self, key: str) -> Union[str, bytes]:
+        row = self._connection.execute(
+            'SELECT value, flags FROM entries WHERE key = ? AND '
+            '(expires IS NULL OR expires > ?)', (key, time.time())).fetchone()
+        if row is None:
+            raise KeyError(key)
+
+        value, flags = row
+        if flags & _COMPRESSED:
+            value = zlib.decompress(value)
+        return value.decode('utf-8') if flags & _TEXT else bytes(value)
+
+    def __setitem__(self, key: str, value: Union[str, bytes]):
+        flags = 0
+        if isinstance(value, str):
+            value, flags = value.encode('utf-8'), _TEXT
+        if self.compress:
+            value, flags = zlib.compress(value), flags | _COMPRESSED
+
+        now = time.time()
+        expires = now + self.ttl.total_seconds() if self.ttl else None
+        with self._connection as connection:
+            connection.execute(
+                'INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)',
+                (key, value, flags, len(value), now, expires))
+
+        self._writes += 1
+        if self._writes % self.compact_every == 0:
+            self.compact()
+
+    def __delitem__(self, key: str):
+        with self._connection as connection:
+            if not connection.execute('DELETE FROM entries WHERE key = ?',
+                                      (key, )).rowcount:
+                raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        try:
+            self[key]
+            return True
+        except KeyError:
+            return False
+
+    def __len__(self) -> int:
+        return self._connection.execute(
+            'SELECT COUNT(*) FROM entries').fetchone()[0]
+
+    @property
+    def size(self) -> int:
+        """
+        The total size of the stored entries in bytes.
+        """
+        return self._connection.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+
+    def compact(self):
+        """
+        Drops the expired entries and the oldest ones beyond the budget.
+        """
+        with self._connection as connection:
+            connection.execute('DELETE FROM entries WHERE expires <= ?',
+                               (time.time(), ))
+            if self.max_bytes is None:
+                return
+            # summed up here, since window functions need SQLite 3.25
+            total, oldest = 0, []
+            for key, size in connection.execute(
+                    'SELECT key, size FROM entries ORDER BY stored DESC, key'):
+                total += size
+                if total > self.max_bytes:
+                    oldest.append((key, ))
+            connection.executemany('DELETE FROM entries WHERE key = ?',
+                                   oldest)
+
+    def clear(self):
+        """
+        Drops all entries.
+        """
+        with self._connection as connection:
+            connection.execute('DELETE FROM entries')
+
+    def close(self):
+        """
+        Closes the connection of the current thread.
+        """
+        if getattr(self._local, 'pid', None) == os.getpid():
+            self._local.connection.close()
+            del self._local.pid
@@ -0,0 +1,272 @@
+"""
+Provides a store for the cache shared by all processes on a host, see
+``IGitt.Utils.Cache``.
+"""
+from contextlib import contextmanager
+from threading import Lock
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+from typing import Union
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import zlib
+
+
+_MAGIC = b'IGSM'
+_VERSION = 1
+# magic, version, number of index slots, size of the data ring
+_HEADER = struct.Struct('<4sIQQ')
+# the position up to which the data ring has been written
+_WRITE_POS = struct.Struct('<Q')
+_WRITE_POS_OFFSET = _HEADER.size
+_INDEX_OFFSET = 64
+# hash of the key, position and length of the record
+_SLOT = struct.Struct('<QQQ')
+# hash of the key, position, length of the key, length of the value, checksum
+# of both and flags
+_RECORD = struct.Struct('<QQIIII')
+# the number of index slots an entry may be stored in
+_PROBES = 8
+
+_TEXT = 1
+_COMPRESSED = 2
+
+
+class SharedMemoryStore:
+    """
+    A dict kind of thing (supporting item getting, setting and deletion)
+    keeping the cache entries in a memory mapped file, so that all processes
+    on a host, e.g. the workers of a web application, share a single copy of
+    every entry instead of fetching and holding their own.
+
+    >>> from IGitt.Utils import Cache, MarshalSerializer
+    >>> store = SharedMemoryStore('/dev/shm/igitt-cache',
+    ...                           max_bytes=512 * 2 ** 20)
+    >>> Cache.use(store.__getitem__, store.__setitem__, MarshalSerializer())
+
+    The entries are appended to a ring buffer, overwriting the oldest ones
+    once it is full, and found through a hash index with a few slots for
+    every key. Reading doesn't take any lock, every entry is checked to be
+    intact instead, writing takes a lock on the file. The size of the file is
+    fixed by the process creating it.
+    """
+
+    def __init__(self, path: str, max_bytes: int=256 * 2 ** 20,
+                 slots: Optional[int]=None, compress: bool=False):
+        """
+        :param path:      The path to the file, preferably on a memory backed
+                          file system like ``/dev/shm``.
+        :param max_bytes: The size of the ring buffer holding the entries.
+        :param slots:     The number of slots in the index, one for every
+                          4 KiB of entries by default.
+        :param compress:  Whether to compress the entries with zlib.
+        """
+        self.path = path
+        self.compress = compress
+        self._lock = Lock()
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        with self._file_lock():
+            header = os.pread(self._fd, _HEADER.size, 0)
+            if len(header) == _HEADER.size and header[:4] == _MAGIC:
+                _, _, self.slots, self.max_bytes = _HEADER.unpack(header)
+            else:
+                self.slots = slots or max(_PROBES, max_bytes // 4096)
+                self.max_bytes = max_bytes
+                os.ftruncate(self._fd, 0)
+                os.ftruncate(self._fd, self._data_offset + self.max_bytes)
+                os.pwrite(self._fd, _HEADER.pack(_MAGIC, _VERSION, self.slots,
+                                                 self.max_bytes), 0)
+        self._map = mmap.mmap(self._fd, self._data_offset + self.max_bytes)
+
+    @property
+    def _data_offset(self) -> int:
+        return _INDEX_OFFSET + self.slots * _SLOT.size
+
+    @contextmanager
+    def _file_lock(self):
+        """
+        Locks the file for writing, against the other threads and processes.
+        """
+        with self._lock:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _hash(key: bytes) -> int:
+        """
+        Hashes the key the same way in every process.
+        """
+        digest = hashlib.blake2b(key, digest_size=8).digest()
+        return int.from_bytes(digest, 'little') or 1
+
+    def _slots(self, key_hash: int) -> Iterator[int]:
+        """
+        Yields the offsets of the index slots the key may be stored in.
+        """
+        for probe in range(_PROBES):
+            yield (_INDEX_OFFSET +
+                   (key_hash + probe) % self.slots * _SLOT.size)
+
+    def _write_pos(self) -> int:
+        return _WRITE_POS.unpack_from(self._map, _WRITE_POS_OFFSET)[0]
+
+    def _live(self, pos: int, length: int, write_pos: int) -> bool:
+        """
+        Tells whether the record written at the position hasn't been
+        overwritten, not even partially.
+        """
+        return length > 0 and pos + self.max_bytes >= write_pos
+
+    def _read(self, slot: int, key_hash: int,
+              key: bytes) -> Optional[Tuple[bytes, int]]:
+        """
+        Reads the value and the flags of the entry referenced by the index
+        slot, if it is the one for the key and intact.
+        """
+        slot_hash, pos, length = _SLOT.unpack_from(self._map, slot)
+        if (slot_hash != key_hash or
+                not _RECORD.size <= length <= self.max_bytes):
+            return None
+        start = self._data_offset + pos % self.max_bytes
+        record = self._map[start:start + length]
+        # the record may have been overwritten while being copied
+        if (len(record) != length or
+                not self._live(pos, length, self._write_pos())):
+            return None
+        record_hash, record_pos, key_length, value_length, checksum, flags = (
+            _RECORD.unpack_from(record))
+        body = record[_RECORD.size:]
+        if (record_hash != key_hash or record_pos != pos or
+                key_length + value_length != len(body) or
+                body[:key_length] != key or zlib.crc32(body) != checksum):
+            return None
+        return body[key_length:], flags
+
+    def __getitem__(self, key: str) -> Union[str, bytes]:
+        encoded = key.encode('utf-8')
+        key_hash = self._hash(encoded)
+        for slot in self._slots(key_hash):
+            entry = self._read(slot, key_hash, encoded)
+            if entry is not None:
+                value, flags = entry
+                if flags & _COMPRESSED:
+                    value = zlib.decompress(value)
+                return value.decode('utf-8') if flags & _TEXT else value
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Union[str, bytes]):
+        flags = 0
+        if isinstance(value, str):
+            value, flags = value.encode('utf-8'), _TEXT
+        if self.compress:
+            value, flags = zlib.compress(value), flags | _COMPRESSED
+        encoded = key.encode('utf-8')
+        key_hash = self._hash(encoded)
+        body = encoded + value
+        length = _RECORD.size + len(body)
+
+        with self._file_lock():
+            # an entry taking a big part of the ring would evict too much
+            if length > self.max_bytes // 8:
+                self._unindex(encoded, key_hash)
+                return
+            write_pos = self._write_pos()
+            pos = write_pos
+            # records aren't split at the end of the ring
+            if pos % self.max_bytes + length > self.max_bytes:
+                pos += self.max_bytes - pos % self.max_bytes
+            # readers notice the records being overwritten from now on
+            _WRITE_POS.pack_into(self._map, _WRITE_POS_OFFSET, pos + length)
+            start = self._data_offset + pos % self.max_bytes
+            self._map[start:start + length] = _RECORD.pack(
+                key_hash, pos, len(encoded), len(value), zlib.crc32(body),
+                flags) + body
+            _SLOT.pack_into(self._map, self._slot_for(key_hash, write_pos),
+                            key_hash, pos, length)
+
+    def _slot_for(self, key_hash: int, write_pos: int) -> int:
+        """
+        Chooses the index slot to store an entry in: the one of the key, if
+        any, otherwise a free one or the one of the oldest entry. The lock has
+        to be held.
+        """
+        oldest, oldest_pos = None, None
+        for slot in self._slots(key_hash):
+            slot_hash, pos, length = _SLOT.unpack_from(self._map, slot)
+            if slot_hash == key_hash:
+                return slot
+            if not self._live(pos, length, write_pos):
+                pos = -1
+            if oldest is None or pos < oldest_pos:
+                oldest, oldest_pos = slot, pos
+        return oldest
+
+    def _unindex(self, key: bytes, key_hash: int) -> bool:
+        """
+        Removes the entry of the key from the index, if any. The lock has to
+        be held.
+        """
+        for slot in self._slots(key_hash):
+            if self._read(slot, key_hash, key) is not None:
+                _SLOT.pack_into(self._map, slot, 0, 0, 0)
+                return True
+        return False
+
+    def __delitem__(self, key: str):
+        encoded = key.encode('utf-8')
+        with self._file_lock():
+            if not self._unindex(encoded, self._hash(encoded)):
+                raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        try:
+            self[key]
+            return True
+        except KeyError:
+            return False
+
+    def _live_slots(self) -> Iterator[Tuple[int, int]]:
+        """
+        Yields the positions and lengths of the entries in the index.
+        """
+        write_pos = self._write_pos()
+        for slot in range(self.slots):
+            _, pos, length = _SLOT.unpack_from(
+                self._map, _INDEX_OFFSET + slot * _SLOT.size)
+            if self._live(pos, length, write_pos):
+                yield pos, length
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._live_slots())
+
+    @property
+    def size(self) -> int:
+        """
+        The total size of the stored entries in bytes.
+        """
+        return sum(length for _, length in self._live_slots())
+
+    def clear(self):
+        """
+        Drops all entries.
+        """
+        with self._file_lock():
+            self._map[_INDEX_OFFSET:self._data_offset] = bytes(
+                self._data_offset - _INDEX_OFFSET)
+            # the records still being read are overwritten now
+            _WRITE_POS.pack_into(self._map, _WRITE_POS_OFFSET,
+                                 self._write_pos() + self.max_bytes + 1)
+
+    def close(self):
+        """
+        Unmaps and closes the file, the entries stay.
+        """
+        self._map.close()
+        os.close(self._fd)
@@ -2,10 +2,31 @@
 Provides useful stuff, generally!
 """
 from datetime import datetime
+from datetime import timedelta
 from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+from threading import RLock
+from typing import Any
+from typing import AsyncIterable
+from typing import AsyncIterator
 from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import List
 from typing import Optional
+from typing import Tuple
+from urllib.parse import parse_qsl
+from urllib.parse import urlencode
+from urllib.parse import urlsplit
+from urllib.parse import urlunsplit
+import asyncio
+import hashlib
 import json
+import marshal
+import re
+import sys
+import time
 
 from pytz import timezone
 
@@ -30,13 +51,351 @@ class LimitedSizeDict(OrderedDict):
                 self.popitem(last=False)
 
 
+class LRUDict:
+    """
+    A thread safe dict kind of thing (supporting item getting, setting and
+    deletion) that evicts the least recently used items once the total size
+    of the stored values exceeds the given budget in bytes.
+
+    >>> store = LRUDict(max_bytes=10)
+    >>> store['a'], store['b'] = 'x' * 4, 'y' * 4
+    >>> store['a']
+    'xxxx'
+    >>> store['c'] = 'z' * 4
+    >>> 'b' in store, 'a' in store, store.size
+    (False, True, 8)
+    """
+
+    def __init__(self, max_bytes: int, sizeof: Callable[[Any], int]=None,
+                 on_evict: Callable[[Any, int], None]=None):
+        """
+        :param max_bytes: The budget for the total size of all values.
+        :param sizeof:    The function to compute the size of a value with,
+                          ``LRUDict.sizeof`` by default.
+        :param on_evict:  The function to call with the key and the size of
+                          every evicted item, if any.
+        """
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._sizeof = sizeof or self.sizeof
+        self._on_evict = on_evict
+        self._items = OrderedDict()  # key -> (value, size)
+        self._lock = RLock()
+
+    @staticmethod
+    def sizeof(value) -> int:
+        """
+        Computes the size of a value in bytes, the length of its UTF-8
+        encoding for strings.
+
+        >>> LRUDict.sizeof('ü'), LRUDict.sizeof(b'ab')
+        (2, 2)
+        """
+        if isinstance(value, str):
+            return len(value.encode('utf-8'))
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return len(value)
+        return sys.getsizeof(value)
+
+    def __getitem__(self, key):
+        with self._lock:
+            value, _ = self._items[key]
+            self._items.move_to_end(key)
+            return value
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def put(self, key, value, size: Optional[int]=None):
+        """
+        Stores the value under the key like setting an item does.
+
+        :param size: The size of the value if it's known already, computed
+                     with the ``sizeof`` function otherwise.
+        """
+        if size is None:
+            size = self._sizeof(value)
+        evicted = []
+        with self._lock:
+            self._pop(key)
+            # a value exceeding the whole budget would evict everything else
+            if size > self.max_bytes:
+                return
+            self._items[key] = (value, size)
+            self.size += size
+            while self.size > self.max_bytes:
+                old_key, (_, old_size) = self._items.popitem(last=False)
+                self.size -= old_size
+                evicted.append((old_key, old_size))
+        if self._on_evict is not None:
+            for old_key, old_size in evicted:
+                self._on_evict(old_key, old_size)
+
+    def __delitem__(self, key):
+        with self._lock:
+            if not self._pop(key):
+                raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _pop(self, key) -> bool:
+        """
+        Removes the item if present, the lock has to be held.
+        """
+        if key not in self._items:
+            return False
+        _, size = self._items.pop(key)
+        self.size -= size
+        return True
+
+    def clear(self):
+        """
+        Removes all items.
+        """
+        with self._lock:
+            self._items.clear()
+            self.size = 0
+
+
+def copy_json(value):
+    """
+    Copies JSON like data, i.e. dicts and lists of strings, numbers, booleans
+    and None, faster than ``copy.deepcopy`` can.
+
+    >>> data = {'labels': ['bug']}
+    >>> copy = copy_json(data)
+    >>> copy['labels'].append('feature')
+    >>> data
+    {'labels': ['bug']}
+    """
+    if isinstance(value, dict):
+        return {key: copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_json(item) for item in value]
+    return value
+
+
+def json_size(value) -> int:
+    """
+    Estimates the size of JSON like data once serialized, without serializing
+    it.
+
+    >>> json_size({'id': 1, 'labels': ['bug']})
+    34
+    """
+    if isinstance(value, str):
+        return len(value) + 2
+    if isinstance(value, dict):
+        return 2 + sum(json_size(key) + json_size(item) + 2
+                       for key, item in value.items())
+    if isinstance(value, list):
+        return 2 + sum(json_size(item) + 1 for item in value)
+    return 8  # numbers, booleans and null
+
+
+class JSONSerializer:
+    """
+    Serializes cache entries as JSON strings, which any store can hold.
+
+    The entries carry the version of their format, so that entries written
+    in another format are ignored instead of being misread.
+
+    >>> serializer = JSONSerializer()
+    >>> serializer.loads(serializer.dumps({'data': [1]}))
+    {'data': [1]}
+    """
+    version = 1
+
+    def dumps(self, item: dict):
+        """
+        Serializes a validated cache entry.
+        """
+        return json.dumps({**item, 'version': self.version})
+
+    def loads(self, raw) -> Optional[dict]:
+        """
+        Deserializes a cache entry, returns None if written in another format.
+        """
+        item = json.loads(raw)
+        # entries written before the format was versioned are the same
+        if item.pop('version', 1) != self.version:
+            return None
+        return item
+
+
+class MarshalSerializer(JSONSerializer):
+    """
+    Serializes cache entries as bytes with ``marshal``, several times faster
+    than JSON, for stores holding bytes. The first byte is the version of the
+    format.
+
+    >>> serializer = MarshalSerializer()
+    >>> serializer.loads(serializer.dumps({'data': [1]}))
+    {'data': [1]}
+    >>> serializer.loads(JSONSerializer().dumps({'data': [1]})) is None
+    True
+    """
+    version = 2
+
+    def dumps(self, item: dict) -> bytes:
+        return bytes([self.version]) + marshal.dumps(item)
+
+    def loads(self, raw) -> Optional[dict]:
+        if raw[:1] != bytes([self.version]):
+            return None
+        return marshal.loads(raw[1:])
+
+
+# the path segments naming a repository, project, user or other owner
+_OWNER_PATHS = [
+    (re.compile(r'^(.*?/repos)/[^/]+/[^/]+'), r'\1/{owner}/{repo}'),
+    (re.compile(r'/(projects|groups)/[^/]+'), r'/\1/{id}'),
+    (re.compile(r'/(users|orgs)/[^/]+'), r'/\1/{name}'),
+]
+_SEGMENTS = [
+    (re.compile(r'/[0-9a-f]{40}(?:[0-9a-f]{24})?(?=/|$)'), '/{sha}'),
+    (re.compile(r'/\d+(?=/|$)'), '/{n}'),
+]
+
+
+@lru_cache(4096)
+def url_template(url: str) -> str:
+    """
+    Normalizes the path of an API URL or a cache key into a template, which
+    is the same for all URLs of the same kind of resource.
+
+    >>> url_template('https://api.github.com/repos/a/b/pulls/12?per_page=100')
+    '/repos/{owner}/{repo}/pulls/{n}'
+    >>> url_template('https://gitlab.com/api/v4/projects/a%2Fb/repository/'
+    ...              'commits/' + '3fc4b86' * 5 + 'abcde #fingerprint')
+    '/api/v4/projects/{id}/repository/commits/{sha}'
+    """
+    path = urlsplit(url.split(' ', 1)[0]).path.rstrip('/')
+    owned = False
+    for pattern, replacement in _OWNER_PATHS:
+        if not owned and pattern.search(path):
+            path = pattern.sub(replacement, path, count=1)
+            owned = True
+    for pattern, replacement in _SEGMENTS:
+        path = pattern.sub(replacement, path)
+    return path or '/'
+
+
+class CacheStats:
+    """
+    Counts how well the caches work, broken down by URL template, see
+    ``url_template``:
+
+    - ``hits``, responses served without a request
+    - ``revalidations``, cached responses revalidated by a 304 response
+    - ``misses``, responses downloaded in full
+    - ``evictions``, entries evicted by the in-memory caches
+    - ``bytes_stored``, the size of the entries written to the caches
+    - ``serialization_seconds``, the time spent serializing, deserializing
+      and copying the entries
+
+    >>> CacheStats.snapshot()  # doctest: +SKIP
+    {'/repos/{owner}/{repo}/pulls/{n}': {'hits': 12, 'misses': 3, ...}, ...}
+
+    To export the numbers to a metrics system, add a hook, which is called
+    with the name of the counter, the URL template and the amount added for
+    every count:
+
+    >>> CacheStats.add_hook(lambda counter, template, amount: None)
+    """
+    COUNTERS = ('hits', 'revalidations', 'misses', 'evictions',
+                'bytes_stored', 'serialization_seconds')
+    _lock = Lock()
+    _counts = {}  # type: Dict[str, Dict[str, float]]
+    _hooks = []  # type: List[Callable[[str, str, float], None]]
+
+    @classmethod
+    def record(cls, counter: str, url: str, amount: float=1):
+        """
+        Adds the amount to the counter for the template of the given URL or
+        cache key.
+        """
+        template = url_template(url)
+        with cls._lock:
+            counts = cls._counts.get(template)
+            if counts is None:
+                counts = cls._counts[template] = dict.fromkeys(cls.COUNTERS,
+                                                               0)
+            counts[counter] += amount
+        for hook in cls._hooks:
+            hook(counter, template, amount)
+
+    @classmethod
+    def snapshot(cls) -> Dict[str, Dict[str, float]]:
+        """
+        Retrieves the counters of every URL template counted so far.
+        """
+        with cls._lock:
+            return {template: dict(counts)
+                    for template, counts in cls._counts.items()}
+
+    @classmethod
+    def totals(cls) -> Dict[str, float]:
+        """
+        Retrieves the counters summed up over all URL templates.
+        """
+        totals = dict.fromkeys(cls.COUNTERS, 0)
+        for counts in cls.snapshot().values():
+            for counter, amount in counts.items():
+                totals[counter] += amount
+        return totals
+
+    @classmethod
+    def add_hook(cls, hook: Callable[[str, str, float], None]):
+        """
+        Has the hook called with the counter, the URL template and the amount
+        for every count from now on.
+        """
+        cls._hooks.append(hook)
+
+    @classmethod
+    def remove_hook(cls, hook: Callable[[str, str, float], None]):
+        """
+        Stops calling the given hook.
+        """
+        cls._hooks.remove(hook)
+
+    @classmethod
+    def reset(cls):
+        """
+        Sets all counters back to zero.
+        """
+        with cls._lock:
+            cls._counts.clear()
+
+
+def _count_eviction(key, size: int):
+    """
+    Counts an entry evicted by an in-memory cache.
+    """
+    CacheStats.record('evictions', key)
+
+
+def _forget_eviction(key, size: int):
+    """
+    Counts an entry evicted by the in-memory ``Cache`` and forgets its key.
+    """
+    Cache.unindex(key)
+    _count_eviction(key, size)
+
+
 class Cache:
     """
     A class to manage cache with IGitt and any other external application.
 
     The cache mechanism should be able to process raw JSON data. The response
-    data from external requests is stored in the cache with the API URL of the
-    associated IGitt object as the key and the data is stored along with its
+    data from external requests is stored in the cache with the key built by
+    ``Cache.key`` out of the API URL of the associated IGitt object, the query
+    parameters and the token used, and the data is stored along with its
     entity tag header, which is used alongside `If-None-Match` header for
     further queries using conditional requests. When an incoming webhook is
     received, the timestamp of reception is cached and any queries later on the
@@ -50,17 +409,117 @@ class Cache:
     >>> from IGitt.Utils import Cache
     >>> Cache.use(read_from, write_to)
 
-    If not provided, IGitt uses a default in-memory cache. For further details
+    If not provided, IGitt uses a default in-memory cache, evicting the least
+    recently used entries beyond 256 MiB of stored data. It keeps the entries
+    as objects, copying them instead of serializing them. For further details
     follow the specific method documentation below.
+
+    How well the cache works is counted by ``CacheStats``.
     """
-    __mem_store = LimitedSizeDict(size_limit=10 ** 6)  # a million entries
+    __mem_store = LRUDict(max_bytes=256 * 2 ** 20, sizeof=json_size,
+                          on_evict=_forget_eviction)
     _get = __mem_store.__getitem__
-    _set = __mem_store.__setitem__
+    _set = __mem_store.put
+    # None for the in-memory cache, which doesn't serialize the entries
+    _serializer = None  # type: Optional[JSONSerializer]
+    # the query parameters holding credentials, never part of the keys
+    SECRET_PARAMS = {'access_token', 'private_token', 'client_secret'}
+    # the keys stored by their path, see ``Cache.keys``
+    _paths = {}  # type: Optional[Dict[str, set]]
+    _paths_lock = Lock()
+
+    @classmethod
+    def key(cls, url: str, params: Optional[dict]=None,
+            scope: Optional[Hashable]=None) -> str:
+        """
+        Builds the key for the response to a GET request out of the normalized
+        URL, the query parameters of the URL and the given ones in a sorted
+        order, leaving out the credentials, and a fingerprint of the given
+        scope, usually the identity of the token sending the request.
+
+        >>> Cache.key('HTTPS://GitLab.com:443/api/v4/issues?state=opened',
+        ...           {'private_token': 'secret', 'labels': ['bug', 'ui']})
+        'https://gitlab.com/api/v4/issues?labels=bug&labels=ui&state=opened'
+        >>> Cache.key('https://api.github.com/user', scope=('GitHubToken', 'x')
+        ...          ) # doctest: +ELLIPSIS
+        'https://api.github.com/user #...'
+        """
+        parts = urlsplit(url)
+        netloc = parts.netloc.lower()
+        default_port = {'http': ':80', 'https': ':443'}.get(
+            parts.scheme.lower())
+        if default_port and netloc.endswith(default_port):
+            netloc = netloc[:-len(default_port)]
+        query = parse_qsl(parts.query, keep_blank_values=True)
+        for name, value in (params or {}).items():
+            if value is None:
+                continue
+            values = value if isinstance(value, (list, tuple)) else [value]
+            query.extend((name, str(item)) for item in values)
+        query = sorted({(name, value) for name, value in query
+                        if name not in cls.SECRET_PARAMS})
+        key = urlunsplit((parts.scheme.lower(), netloc, parts.path,
+                          urlencode(query), ''))
+        if scope is None:
+            return key
+        fingerprint = hashlib.sha1(repr(scope).encode('utf-8')).hexdigest()
+        return '{} #{}'.format(key, fingerprint[:16])
+
+    @staticmethod
+    def _path(key: str) -> str:
+        """
+        Leaves the query parameters out of the key.
+        """
+        url, _, fingerprint = key.partition(' #')
+        return '{} #{}'.format(url.split('?', 1)[0], fingerprint)
+
+    @classmethod
+    def index(cls, key: str):
+        """
+        Remembers the key under its path, so that ``Cache.keys`` finds it.
+        Keys are indexed when an entry is stored under them.
+        """
+        if cls._paths is None:
+            return
+        with cls._paths_lock:
+            cls._paths.setdefault(cls._path(key), set()).add(key)
+
+    @classmethod
+    def unindex(cls, key: str):
+        """
+        Forgets the key, e.g. since its entry has been evicted.
+        """
+        if cls._paths is None:
+            return
+        path = cls._path(key)
+        with cls._paths_lock:
+            keys = cls._paths.get(path, set())
+            keys.discard(key)
+            if not keys:
+                cls._paths.pop(path, None)
 
     @classmethod
-    def use(cls, read_from: Callable, write_to: Callable):
+    def keys(cls, url: str, scope: Optional[Hashable]=None) -> List[str]:
         """
-        Connects the cache read, write functions to Cache class.
+        Lists the keys indexed for responses to the URL within the scope, with
+        any query parameters.
+
+        >>> Cache.index(Cache.key('https://x.org/a?state=open'))
+        >>> Cache.keys('https://x.org/a')
+        ['https://x.org/a?state=open']
+        """
+        if cls._paths is None:
+            return []
+        path = cls._path(cls.key(url.split('?', 1)[0], scope=scope))
+        with cls._paths_lock:
+            return sorted(cls._paths.get(path, ()))
+
+    @classmethod
+    def use(cls, read_from: Callable, write_to: Callable,
+            serializer: Optional[JSONSerializer]=None):
+        """
+        Connects the cache read, write functions to Cache class. The entries
+        are passed to them serialized, as JSON strings by default.
 
         :param read_from:
             The method to be called to fetch data from cache. It should be able
@@ -71,9 +530,16 @@ class Cache:
             to receive two parameters, key (used to identify the entry in
             cache) and the item to be stored in cache, in the specified
             respective order.
+        :param serializer:
+            The serializer for the entries, e.g. ``MarshalSerializer()`` for
+            stores holding bytes. ``JSONSerializer()`` by default.
         """
         cls._get = read_from
         cls._set = write_to
+        cls._serializer = serializer or JSONSerializer()
+        if cls._paths is not None:
+            with cls._paths_lock:
+                cls._paths.clear()
 
     @classmethod
     def validate(cls, item: dict) -> dict:
@@ -86,6 +552,7 @@ class Cache:
         :type links:        dict
         :type lastUpdated:  str (formatted as '%a, %d %m %Y %H:%M:%S %Z')
         :type entityTag:    str or None
+        :type fetchedAt:    float or None (seconds since the epoch)
 
         :return:    The item dictionary after validation without any missing
                     fields. Also removes any additional unrelated fields from
@@ -121,6 +588,13 @@ class Cache:
                 "'entityTag' field should either be a string or None, not {}"
                 ''.format(type(item['entityTag'])))
 
+        if 'fetchedAt' not in item:
+            item['fetchedAt'] = None
+        elif not isinstance(item['fetchedAt'], (int, float, type(None))):
+            raise TypeError(
+                "'fetchedAt' field should either be a number or None, not {}"
+                ''.format(type(item['fetchedAt'])))
+
         if 'fromWebhook' not in item:
             item['fromWebhook'] = False
         elif not isinstance(item['fromWebhook'], bool):
@@ -128,28 +602,70 @@ class Cache:
                             ''.format(type(item['fromWebhook'])))
 
         # drop any other extra fields in the dictionary
-        fields = {'fromWebhook', 'entityTag', 'lastFetched', 'links', 'data'}
+        fields = {'fromWebhook', 'entityTag', 'lastFetched', 'fetchedAt',
+                  'links', 'data'}
         item = {k: v for k, v in item.items() if k in fields}
 
         return item
 
     @classmethod
-    def get(cls, key) -> Optional[dict]:
+    def _load(cls, key) -> Optional[dict]:
         """
-        Retrieves the entry from cache if present, otherwise None.
+        Retrieves the entry from cache if present, otherwise None. Entries of
+        the in-memory cache are returned as they are stored.
         """
         try:
-            return cls.validate(json.loads(cls._get(key)))
-        except (KeyError, TypeError):
+            raw = cls._get(key)
+            if cls._serializer is None:
+                return raw
+            start = time.perf_counter()
+            try:
+                return cls._serializer.loads(raw)
+            finally:
+                CacheStats.record('serialization_seconds', key,
+                                  time.perf_counter() - start)
+        # unreadable entries, e.g. written with another serializer, are misses
+        except (KeyError, TypeError, ValueError):
             return None
 
+    @classmethod
+    def get(cls, key) -> Optional[dict]:
+        """
+        Retrieves the entry from cache if present, otherwise None. Entries are
+        validated when stored, not when retrieved.
+        """
+        item = cls._load(key)
+        if cls._serializer is None and item is not None:
+            # the caller must not modify the stored entry
+            start = time.perf_counter()
+            item = copy_json(item)
+            CacheStats.record('serialization_seconds', key,
+                              time.perf_counter() - start)
+        return item
+
     @classmethod
     def set(cls, key, item):
         """
         Stores the entry in cache.
         """
         item = cls.validate(item)
-        cls._set(key, json.dumps(item))
+        start = time.perf_counter()
+        if cls._serializer is None:
+            # the caller must not modify the stored entry either
+            raw = copy_json(item)
+            size = json_size(raw)
+        else:
+            raw = cls._serializer.dumps(item)
+            size = LRUDict.sizeof(raw)
+        CacheStats.record('serialization_seconds', key,
+                          time.perf_counter() - start)
+        CacheStats.record('bytes_stored', key, size)
+        if cls._serializer is None:
+            # the in-memory store takes the size along instead of computing it
+            cls._set(key, raw, size)
+        else:
+            cls._set(key, raw)
+        cls.index(key)
 
     @classmethod
     def update(cls, key, new_value):
@@ -157,7 +673,145 @@ class Cache:
         Updates the existing entry with new data, if present, otherwise creates
         a new entry in cache.
         """
-        cls.set(key, {**(cls.get(key) or {}), **new_value})
+        cls.set(key, {**(cls._load(key) or {}), **new_value})
+
+
+# a full SHA-1 or SHA-256 object name
+_SHA = r'[0-9a-f]{40}(?:[0-9a-f]{24})?'
+
+
+class ImmutableCache(Cache):
+    """
+    A separate cache for responses which never change, i.e. those for
+    resources addressed by full SHAs like commits, their diffs and compare
+    results between two commits. Its entries are served without ever being
+    revalidated. The responses are kept in ``Cache`` as well, so that they can
+    still be revalidated from a persistent store after a restart.
+
+    It's an in-memory cache evicting the least recently used entries beyond
+    64 MiB by default, and another store can be used the same way as for
+    ``Cache``:
+
+    >>> from IGitt.Utils import ImmutableCache
+    >>> ImmutableCache.use(read_from, write_to)
+    """
+    __mem_store = LRUDict(max_bytes=64 * 2 ** 20, sizeof=json_size,
+                          on_evict=_count_eviction)
+    _get = __mem_store.__getitem__
+    _set = __mem_store.put
+    _serializer = None  # type: Optional[JSONSerializer]
+    # the entries never change, so they are never looked up by their path
+    _paths = None
+
+    # the paths of the immutable resources on GitHub and GitLab
+    PATHS = [re.compile(pattern.format(sha=_SHA), re.IGNORECASE)
+             for pattern in (r'/commits/{sha}(?:/diff)?$',
+                             r'/compare/{sha}\.\.\.?{sha}$',
+                             r'/git/(?:blobs|commits|trees)/{sha}$',
+                             r'/repository/blobs/{sha}(?:/raw)?$')]
+    @classmethod
+    def key(cls, url: str, params: Optional[dict]=None,
+            headers: Optional[dict]=None,
+            scope: Optional[Hashable]=None) -> Optional[str]:
+        """
+        Builds the key for the response to a GET request like ``Cache.key``
+        does, including the ``Accept`` header as well, since e.g. commit data
+        and its diff share the same URL.
+
+        >>> sha = '3fc4b86' * 5 + 'abcde'
+        >>> ImmutableCache.key('https://api.github.com/repos/a/b/commits/' +
+        ...                    sha, {'per_page': 100},
+        ...                    {'Accept': 'application/vnd.github.v3.diff'}
+        ...                   ) # doctest: +ELLIPSIS
+        'https://...?per_page=100 application/vnd.github.v3.diff'
+
+        :return: The key or None if the resource isn't immutable.
+        """
+        path = urlsplit(url).path
+        if not any(pattern.search(path) for pattern in cls.PATHS):
+            return None
+        return ' '.join((Cache.key(url, params, scope),
+                         dict(headers or {}).get('Accept', '')))
+
+
+class NegativeCache:
+    """
+    Remembers the responses to GET requests telling that the resource doesn't
+    exist (404) or is gone (410) for a short time, so that probing a missing
+    resource over and over, e.g. a deleted branch or a user who left, doesn't
+    send a request every time. The keys are the same as for ``Cache``.
+
+    The entries expire after the ``ttl``, 30 seconds by default, and the least
+    recently used ones are evicted beyond 4 MiB of stored response bodies. To
+    change that, simply configure the cache before using IGitt, a ``ttl`` of
+    zero disables it.
+
+    >>> from datetime import timedelta
+    >>> NegativeCache.configure(ttl=timedelta(minutes=2))
+    """
+    STATUSES = {404, 410}
+    ttl = timedelta(seconds=30)
+    _store = LRUDict(max_bytes=4 * 2 ** 20,
+                     sizeof=lambda entry: LRUDict.sizeof(entry[1]) + 64)
+
+    @classmethod
+    def configure(cls, ttl: Optional[timedelta]=None,
+                  max_bytes: Optional[int]=None):
+        """
+        Configures the cache. Any existing entries are dropped.
+
+        :param ttl:       The time after which an entry expires.
+        :param max_bytes: The budget for the total size of all entries.
+        """
+        if ttl is not None:
+            cls.ttl = ttl
+        if max_bytes is not None:
+            cls._store.max_bytes = max_bytes
+        cls.clear()
+
+    @classmethod
+    def get(cls, key) -> Optional[Tuple[str, int]]:
+        """
+        Retrieves the body and status code of the response under the key if
+        present and not expired, otherwise None.
+        """
+        try:
+            expires_at, body, status = cls._store[key]
+        except KeyError:
+            return None
+        if expires_at <= time.monotonic():
+            cls.discard(key)
+            return None
+        return body, status
+
+    @classmethod
+    def set(cls, key, body: str, status: int):
+        """
+        Stores the response under the key, if its status code tells the
+        resource is missing.
+        """
+        ttl = cls.ttl.total_seconds()
+        if status in cls.STATUSES and ttl > 0:
+            cls._store[key] = (time.monotonic() + ttl, body, status)
+            Cache.index(key)
+
+    @classmethod
+    def discard(cls, key):
+        """
+        Removes the entry under the key, if any, e.g. since the resource has
+        been created.
+        """
+        try:
+            del cls._store[key]
+        except KeyError:
+            pass
+
+    @classmethod
+    def clear(cls):
+        """
+        Removes all entries.
+        """
+        cls._store.clear()
 
 
 class PossiblyIncompleteDict:
@@ -241,8 +895,13 @@ class CachedDataMixin:
 
     You can also create an IGitt instance with your own data using from_data
     classmethod.
+
+    The data is fetched according to the freshness policy of the class, e.g.
+    ``GitHubRepository.freshness = Freshness(timedelta(seconds=30))`` to not
+    revalidate repository data fetched during the last 30 seconds.
     """
     default_data = {}  # type: dict
+    freshness = None  # type: Optional[IGitt.Interfaces.Freshness]
 
     @classmethod  # Ignore PyLintBear
     def from_data(cls, data: Optional[dict]=None, *args, **kwargs):
@@ -264,6 +923,27 @@ class CachedDataMixin:
         """
         raise NotImplementedError
 
+    async def _aget_data(self):
+        """
+        Retrieves the data for the object without blocking the event loop. By
+        default ``_get_data`` is run in the executor of the loop, override it
+        to use the asynchronous HTTP functions instead.
+        """
+        return await asyncio.get_event_loop().run_in_executor(
+            None, self._get_data)
+
+    async def afetch(self):
+        """
+        Retrieves all the data from the hoster without blocking the event
+        loop, so that the properties can be accessed afterwards without
+        making any further request.
+
+        :return: The object itself, for ``mr = await mr.afetch()``.
+        """
+        self.data = await self._aget_data()
+        self._data.may_need_refresh = False
+        return self
+
     def refresh(self):  # dont cover
         """
         Refreshes all the data from the hoster!
@@ -293,6 +973,30 @@ class CachedDataMixin:
         self._data = PossiblyIncompleteDict(value, self._get_data)
 
 
+async def aislice(iterable: AsyncIterable,
+                  limit: Optional[int]=None) -> AsyncIterator:
+    """
+    Yields at most ``limit`` items of the given asynchronous iterable, all of
+    them if ``limit`` is None. It is ``itertools.islice`` for ``async for``.
+
+    >>> async def numbers():
+    ...     for number in range(5):
+    ...         yield number
+    >>> async def collect():
+    ...     return [number async for number in aislice(numbers(), 2)]
+    >>> asyncio.new_event_loop().run_until_complete(collect())
+    [0, 1]
+    """
+    if limit == 0:
+        return
+    count = 0
+    async for item in iterable:
+        yield item
+        count += 1
+        if count == limit:
+            return
+
+
 def eliminate_none(data):
     """
     Remove None values from dict
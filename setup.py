@@ -46,5 +46,6 @@ if __name__ == '__main__':
           maintainer_email='lasse@gitmate.io',
           packages=find_packages(exclude=['build.*', '*.tests.*', '*.tests']),
           install_requires=REQUIRED,
+          python_requires='>=3.6',
           package_data={'IGitt': ['VERSION']},
           license='MIT')
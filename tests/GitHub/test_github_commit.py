@@ -1,7 +1,13 @@
+from datetime import timedelta
 import os
 
+import requests_mock
+
 from IGitt.GitHub import GitHubToken
+from IGitt.GitHub import BASE_URL as GITHUB_BASE_URL
 from IGitt.GitHub.GitHubCommit import GitHubCommit, get_diff_index
+from IGitt.Interfaces import Freshness
+from IGitt.Interfaces import get
 from IGitt.Interfaces.CommitStatus import CommitStatus, Status
 
 from tests import IGittTestCase
@@ -65,6 +71,74 @@ class GitHubCommitTest(IGittTestCase):
         self.assertIn('test comment',
                       commit.comment('test comment', 'READNOT.md', 4).body)
 
+    def test_comment_many(self):
+        commit = GitHubCommit.from_data(
+            {'sha': 'deadbeef',
+             'files': [{'filename': 'setup.py',
+                        'patch': '@@ -1,2 +1,3 @@\n a\n+b\n c'}]},
+            self.token, 'some/repo', 'deadbeef')
+        url = GITHUB_BASE_URL + '/repos/some/repo'
+        with requests_mock.Mocker() as m:
+            m.post(url + '/pulls/7/reviews', json={'id': 3})
+            m.get(url + '/pulls/7/reviews/3/comments', json=[
+                {'id': 11, 'path': 'setup.py', 'position': 3, 'body': 'c'},
+                {'id': 10, 'path': 'setup.py', 'position': 2, 'body': 'b'}])
+            m.post(url + '/issues/7/comments', json={'id': 12, 'body': 'x'})
+            outcomes = commit.comment_many([('b', 'setup.py', 2),
+                                            ('c', 'setup.py', 3),
+                                            ('x', 'setup.py', 8)],
+                                           mr_number=7)
+
+        self.assertEqual([outcome.inline for outcome in outcomes],
+                         [True, True, False])
+        self.assertEqual([outcome.comment.number for outcome in outcomes],
+                         [10, 11, 12])
+        self.assertEqual(m.request_history[0].json()['body'].splitlines()[0],
+                         'Comment on deadbeef, file setup.py, line 8.')
+        review = m.request_history[1].json()
+        self.assertEqual(review['comments'], [
+            {'path': 'setup.py', 'position': 2, 'body': 'b'},
+            {'path': 'setup.py', 'position': 3, 'body': 'c'}])
+        self.assertEqual(m.call_count, 3)
+
+        with requests_mock.Mocker() as m:
+            m.post(url + '/pulls/7/reviews', status_code=422)
+            outcomes = commit.comment_many([('b', 'setup.py', 2)],
+                                           mr_number=7)
+        self.assertIsInstance(outcomes[0].error, RuntimeError)
+        self.assertIsNone(outcomes[0].comment)
+
+    def test_set_status_get_statuses(self):
+        commit = GitHubCommit(self.token, 'some/repo', 'deadbeef')
+        collection_url = GITHUB_BASE_URL + '/repos/some/repo/statuses/deadbeef'
+        failed = {'state': 'failure', 'description': 'Theres a problem',
+                  'context': 'gitmate/test', 'target_url': None}
+        with requests_mock.Mocker() as m:
+            m.get(collection_url, json=[failed], headers={'ETag': '"1"'})
+            m.get(GITHUB_BASE_URL + '/repos/some/repo/commits/deadbeef/'
+                  'statuses', json=[failed], headers={'ETag': '"1"'})
+            self.assertEqual(get(self.token, collection_url), [failed])
+            self.assertEqual(commit.get_statuses().pop().description,
+                             'Theres a problem')
+
+            # the created status states the collection as its URL
+            passed = {**failed, 'state': 'success',
+                      'description': 'Theres no problem'}
+            m.post(collection_url, json={**passed, 'url': collection_url})
+            m.get(collection_url, json=[passed, failed])
+            m.get(GITHUB_BASE_URL + '/repos/some/repo/commits/deadbeef/'
+                  'statuses', json=[passed, failed])
+            commit.set_status(CommitStatus(Status.SUCCESS,
+                                           'Theres no problem',
+                                           'gitmate/test'))
+            self.assertEqual(commit.get_statuses().pop().description,
+                             'Theres no problem')
+            self.assertNotIn('If-None-Match', m.last_request.headers)
+            # the collection isn't served the created status from the cache
+            self.assertEqual(get(self.token, collection_url,
+                                 freshness=Freshness(timedelta(minutes=1))),
+                             [passed, failed])
+
     def test_get_diff_index(self):
         patch = ('---/version/a\n'
                  '+++/version/b\n'
@@ -87,6 +161,19 @@ class GitHubCommitTest(IGittTestCase):
                          '+\n'
                          '+yeah thats it')
 
+    def test_unified_diff_cached(self):
+        sha = '645961c0841a84c1dd2a58535aa70ad45be48c46'
+        commit = GitHubCommit(self.token, 'some/repo', sha)
+        with requests_mock.Mocker() as m:
+            m.get(GITHUB_BASE_URL + '/repos/some/repo/commits/' + sha,
+                  text='diff --git a/x b/x\r\nindex 1db0477..6438c33\r\n'
+                       '--- a/x\r\n+++ b/x\r\n@@ -1 +1 @@\r\n-a\r\n+b\r\n')
+            for _ in range(2):
+                self.assertEqual(commit.unified_diff,
+                                 '--- a/x\n+++ b/x\n@@ -1 +1 @@\n-a\n+b')
+            # the diff of a commit never changes
+            self.assertEqual(m.call_count, 1)
+
     def test_closes_issues(self):
         commit = GitHubCommit(self.token, 'gitmate-test-user/test',
                               'fb37d69e72b46a52f8694cf45adb007315de3b6e')
@@ -1,7 +1,11 @@
+from unittest.mock import Mock
+from unittest.mock import PropertyMock
+from unittest.mock import patch
 import os
 import datetime
 
 from IGitt.GitHub import GitHubToken
+from IGitt.GitHub.GitHubCommit import GitHubCommit
 from IGitt.GitHub.GitHubMergeRequest import GitHubMergeRequest
 from IGitt.Interfaces.MergeRequest import MergeRequestStates
 from IGitt.GitHub.GitHubMilestone import GitHubMilestone
@@ -121,6 +125,66 @@ class GitHubMergeRequestTest(IGittTestCase):
                           for issue in mr.will_resolve_issues},
                          set())
 
+    @patch.object(GitHubMergeRequest, 'comments', new_callable=PropertyMock)
+    @patch.object(GitHubMergeRequest, 'commits', new_callable=PropertyMock)
+    def test_issue_references(self, mock_commits, mock_comments):
+        def commits(*messages):
+            return tuple(
+                GitHubCommit.from_data({'commit': {'message': message}},
+                                       self.token, 'gitmate-test-user/test',
+                                       str(sha))
+                for sha, message in enumerate(messages))
+
+        # the commits and comments are fetched one after another or at once
+        for number, workers in ((107, 1), (108, 2)):
+            mock_commits.return_value = commits('Fixes #1 and closes a/b#2',
+                                                'Resolves #3, related to #4')
+            mock_comments.return_value = [Mock(body='Duplicate of #5')]
+            mock_comments.reset_mock()
+            mr = GitHubMergeRequest(self.token, 'gitmate-test-user/test',
+                                    number)
+
+            with patch('IGitt.Interfaces.MergeRequest.MAX_REFERENCE_WORKERS',
+                       workers):
+                references = mr.issue_references()
+            self.assertEqual(mock_comments.call_count, 1)
+            self.assertEqual({int(issue.number)
+                              for issue in references.closes_issues},
+                             {1, 2, 3})
+            self.assertEqual({int(issue.number)
+                              for issue in references.will_fix_issues}, {1})
+            self.assertEqual({(issue.repository.full_name, int(issue.number))
+                              for issue in references.will_close_issues},
+                             {('a/b', 2)})
+            self.assertEqual({int(issue.number)
+                              for issue in references.will_resolve_issues},
+                             {3})
+            # the short references after a/b#2 refer to a/b
+            self.assertEqual({(issue.repository.full_name, int(issue.number))
+                              for issue in references.mentioned_issues},
+                             {('gitmate-test-user/test', 1), ('a/b', 2),
+                              ('a/b', 3), ('a/b', 4), ('a/b', 5)})
+
+            # the references are memoized for the request like its commits
+            self.assertIs(GitHubMergeRequest(self.token,
+                                             'gitmate-test-user/test',
+                                             number).issue_references(),
+                          references)
+            self.assertIs(mr.mentioned_issues, references.mentioned_issues)
+            self.assertIs(mr.will_fix_issues, references.will_fix_issues)
+            self.assertEqual(mock_comments.call_count, 1)
+
+            # as long as the commits are
+            mock_commits.return_value = commits('Fixes #1', 'Closes #6')
+            mock_comments.return_value = [Mock(body='Duplicate of #7')]
+            self.assertEqual({int(issue.number)
+                              for issue in mr.closes_issues}, {1, 6})
+            references = mr.issue_references()
+            self.assertEqual(mock_comments.call_count, 2)
+            self.assertEqual({int(issue.number)
+                              for issue in references.mentioned_issues},
+                             {1, 6, 7})
+
     def test_tests_passed(self):
         self.assertEqual(self.mr.tests_passed, True)
         mr = GitHubMergeRequest(self.token, 'gitmate-test-user/test', 6)
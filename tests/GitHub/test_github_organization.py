@@ -1,5 +1,7 @@
 import os
 
+import requests_mock
+
 from IGitt.GitHub import GitHubToken
 from IGitt.GitHub.GitHubOrganization import GitHubOrganization
 
@@ -66,3 +68,11 @@ class GitHubOrganizationTest(IGittTestCase):
     def test_create(self):
         with self.assertRaises(NotImplementedError):
             GitHubOrganization.create(self.token, 'random', 'random')
+
+    def test_iter_repositories(self):
+        with requests_mock.Mocker() as m:
+            m.get(self.org.url + '/repos',
+                  json=[{'id': 1, 'full_name': 'gitmate-test-org/test'}])
+            self.assertEqual(
+                [r.full_name for r in self.org.iter_repositories()],
+                ['gitmate-test-org/test'])
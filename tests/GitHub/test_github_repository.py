@@ -1,6 +1,10 @@
 from datetime import datetime
+from unittest.mock import patch
 import os
 
+from aiohttp import web
+import requests_mock
+
 from IGitt.GitHub import GitHubToken
 from IGitt.GitHub import GitHubJsonWebToken
 from IGitt.GitHub import GitHubInstallationToken
@@ -9,12 +13,14 @@ from IGitt.GitHub.GitHubMergeRequest import GitHubMergeRequest
 from IGitt.GitHub.GitHubRepository import GitHubRepository
 from IGitt.GitHub.GitHubUser import GitHubUser
 from IGitt.Interfaces import AccessLevel
+from IGitt.Interfaces import BasicAuthorizationToken
 from IGitt.Interfaces import IssueStates
 from IGitt.Interfaces import MergeRequestStates
 from IGitt.Interfaces.Repository import WebhookEvents
 from IGitt import ElementAlreadyExistsError, ElementDoesntExistError
 
 from tests import IGittTestCase
+from tests import serve
 
 
 class GitHubRepositoryTest(IGittTestCase):
@@ -226,3 +232,131 @@ class GitHubRepositoryTest(IGittTestCase):
         repo = GitHubRepository(self.token, 'nkprince007/test')
         self.assertEqual(repo.parent.full_name, 'gitmate-test-user/test')
         self.assertEqual(repo.parent.parent, None)
+
+    def test_iter(self):
+        with requests_mock.Mocker() as m:
+            m.get(self.repo.url + '/commits', json=[{'sha': 'abc'}])
+            m.get(self.repo.url + '/pulls?state=closed',
+                  json=[{'number': 1, 'merged_at': None},
+                        {'number': 2, 'merged_at': '2017-01-01T00:00:00Z'}])
+            m.get(self.repo.url + '/issues?state=open',
+                  json=[{'number': 3}, {'number': 4, 'pull_request': {}}])
+            self.assertEqual([c.sha for c in self.repo.iter_commits()],
+                             ['abc'])
+            self.assertEqual([mr.number for mr in
+                              self.repo.iter_merge_requests('merged')], [2])
+            self.assertEqual([i.number for i in self.repo.iter_issues()],
+                             [3])
+
+    def test_limit(self):
+        with requests_mock.Mocker() as m:
+            m.get(self.repo.url + '/pulls?state=opened&per_page=2',
+                  json=[{'number': 1}, {'number': 2}], headers={
+                      'Link': '<{}?page=2>; rel="next"'.format(
+                          self.repo.url + '/pulls')})
+            m.get(self.repo.url + '/issues?state=open&per_page=100',
+                  json=[{'number': 3, 'pull_request': {}}, {'number': 4},
+                        {'number': 5}])
+            self.assertEqual({mr.number for mr in
+                              self.repo.filter_merge_requests(limit=2)},
+                             {1, 2})
+            self.assertEqual([i.number for i in
+                              self.repo.iter_issues(limit=1)], [4])
+            self.assertEqual(m.call_count, 2)
+
+    def test_count(self):
+        search_url = 'https://api.github.com/search/issues'
+        with requests_mock.Mocker() as m:
+            m.get(search_url + '?q=repo:gitmate-test-user/test type:issue '
+                               'state:open&per_page=1',
+                  json={'total_count': 97, 'items': [{}]})
+            m.get(search_url + '?q=repo:gitmate-test-user/test type:pr '
+                               'is:merged&per_page=1',
+                  json={'total_count': 4, 'items': [{}]})
+            self.assertEqual(self.repo.count_issues(), 97)
+            self.assertEqual(self.repo.count_merge_requests('merged'), 4)
+
+
+class GitHubAsyncRepositoryTest(IGittTestCase):
+    vcr_options = {'ignore_localhost': True}
+
+    def setUp(self):
+        self.requests = []
+        self.responses = {
+            '/repos/o/r/issues': [
+                {'number': 1, 'title': 'first'},
+                {'number': 2, 'title': 'a PR', 'pull_request': {}},
+                {'number': 3, 'title': 'second'},
+            ],
+            '/repos/o/r/issues/1/comments': [{'id': 5, 'body': 'hi'}],
+            '/repos/o/r/issues/2': {'number': 2, 'title': 'a PR'},
+            '/repos/o/r/pulls': [{'number': 2, 'merged_at': None},
+                                 {'number': 4, 'merged_at': '2018-01-01'}],
+            '/repos/o/r/pulls/2': {'number': 2, 'merged_at': None,
+                                   'head': {'sha': 'abc'}},
+            '/repos/o/r/pulls/2/commits': [{'sha': 'abc'}],
+            '/repos/o/r/commits': [{'sha': 'abc'}, {'sha': 'def'}],
+            '/repos/o/r/commits/abc/statuses': [
+                {'context': 'ci', 'state': 'success', 'description': 'new',
+                 'target_url': None},
+                {'context': 'ci', 'state': 'failure', 'description': 'old',
+                 'target_url': None},
+            ],
+        }
+        app = web.Application()
+        app.router.add_get('/{path:.*}', self.respond)
+        serve(self, app)
+        base_url = patch('IGitt.GitHub.BASE_URL', self.url)
+        base_url.start()
+        self.addCleanup(base_url.stop)
+        self.repo = GitHubRepository(BasicAuthorizationToken('user', 'pass'),
+                                     'o/r')
+
+    async def respond(self, request):
+        self.requests.append(request)
+        return web.json_response(self.responses[request.path])
+
+    def collect(self, aiterable):
+        async def collect():
+            return [item async for item in aiterable]
+        return self.loop.run_until_complete(collect())
+
+    def test_aiter_issues(self):
+        issues = self.collect(self.repo.aiter_issues(label='bug'))
+        self.assertEqual([issue.title for issue in issues],
+                         ['first', 'second'])
+        self.assertEqual(self.requests[0].query['labels'], 'bug')
+        self.assertEqual(self.requests[0].query['state'], 'open')
+
+        issues = self.collect(self.repo.aiter_issues(limit=1))
+        self.assertEqual([issue.number for issue in issues], [1])
+
+        comments = self.loop.run_until_complete(issues[0].acomments())
+        self.assertEqual([comment.body for comment in comments], ['hi'])
+
+    def test_aiter_merge_requests(self):
+        mrs = self.collect(self.repo.aiter_merge_requests(state='merged'))
+        self.assertEqual([mr.number for mr in mrs], [4])
+        self.assertEqual(self.requests[0].query['state'], 'closed')
+
+        mrs = self.collect(self.repo.aiter_merge_requests(state='all',
+                                                          limit=1))
+        self.assertEqual([mr.number for mr in mrs], [2])
+
+    def test_merge_request(self):
+        mr = GitHubMergeRequest(self.repo._token, 'o/r', 2)
+        self.assertIs(self.loop.run_until_complete(mr.afetch()), mr)
+        self.assertEqual(mr.title, 'a PR')
+        self.assertEqual(mr.head.sha, 'abc')
+        self.assertEqual(len(self.requests), 2)
+
+        commits = self.loop.run_until_complete(mr.acommits())
+        self.assertEqual([commit.sha for commit in commits], ['abc'])
+        statuses = self.loop.run_until_complete(commits[0].aget_statuses())
+        self.assertEqual({status.description for status in statuses},
+                         {'new'})
+
+    def test_aiter_commits(self):
+        commits = self.collect(self.repo.aiter_commits(limit=1))
+        self.assertEqual([commit.sha for commit in commits], ['abc'])
+        self.assertEqual(self.requests[0].query['per_page'], '1')
@@ -1,5 +1,8 @@
 import os
 
+import requests_mock
+
+from IGitt.GitLab import BASE_URL as GITLAB_BASE_URL
 from IGitt.GitLab import GitLabOAuthToken
 from IGitt.GitLab.GitLabCommit import GitLabCommit
 from IGitt.Interfaces.CommitStatus import CommitStatus
@@ -85,6 +88,27 @@ class GitLabCommitTest(IGittTestCase):
                          '+\n'
                          '+a tst pr\n')
 
+    def test_iter_patches(self):
+        url = (GITLAB_BASE_URL + '/projects/some%2Frepo/repository/commits/'
+               'abc/diff')
+        commit = GitLabCommit(self.token, 'some/repo', 'abc')
+        with requests_mock.Mocker() as m:
+            m.get(url + '?per_page=100', json=[
+                {'old_path': 'setup.py', 'new_path': 'setup.py',
+                 'diff': '@@ -1 +1,2 @@\n import os\n+import re\n'},
+                {'old_path': 'README', 'new_path': 'README',
+                 'deleted_file': True, 'diff': '@@ -1 +0,0 @@\n-Hi!\n'}])
+            patches = [(patch.old_path, patch.new_path,
+                        [hunk.lines for hunk in patch.hunks])
+                       for patch in commit.iter_patches()]
+            lines = list(commit.iter_unified_diff(
+                lambda line: line.startswith('+')))
+        self.assertEqual(patches, [
+            ('setup.py', 'setup.py', [[' import os', '+import re']]),
+            ('README', None, [['-Hi!']])])
+        self.assertEqual(lines,
+                         ['+++ b/setup.py', '+import re', '+++ /dev/null'])
+
     def test_closes_issues(self):
         commit = GitLabCommit(self.token, 'gitmate-test-user/test',
                               '9ba5b704f5866e468ec2e639fa893ae4c129f2ad')
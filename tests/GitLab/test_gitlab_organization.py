@@ -1,5 +1,7 @@
 import os
 
+import requests_mock
+
 from IGitt.GitLab import GitLabOAuthToken
 from IGitt.GitLab.GitLabOrganization import GitLabOrganization
 
@@ -88,3 +90,17 @@ class GitLabOrganizationTest(IGittTestCase):
                                         'public')
         self.assertEqual(org.name, 'ya-group')
         self.assertEqual(org.description, 'yet another test organization')
+
+    def test_iter_repositories(self):
+        with requests_mock.Mocker() as m:
+            m.get(self.org.url + '/projects', json=[
+                {'id': 1, 'path_with_namespace': 'gitmate-test-org/test'}])
+            m.get(self.org.url + '/subgroups',
+                  json=[{'full_path': 'gitmate-test-org/subgroup'}])
+            m.get(self.suborg.url + '/projects', json=[
+                {'id': 2,
+                 'path_with_namespace': 'gitmate-test-org/subgroup/test'}])
+            m.get(self.suborg.url + '/subgroups', json=[])
+            self.assertEqual(
+                [r.full_name for r in self.org.iter_repositories()],
+                ['gitmate-test-org/test', 'gitmate-test-org/subgroup/test'])
@@ -1,19 +1,25 @@
 from datetime import datetime
+from unittest.mock import patch
 
 import os
 
+from aiohttp import web
+import requests_mock
+
 from IGitt.GitLab import GitLabOAuthToken, GitLabPrivateToken
 from IGitt.GitLab.GitLabContent import GitLabContent
 from IGitt.GitLab.GitLabMergeRequest import GitLabMergeRequest
 from IGitt.GitLab.GitLabRepository import GitLabRepository
 from IGitt.GitLab.GitLabUser import GitLabUser
 from IGitt.Interfaces import AccessLevel
+from IGitt.Interfaces import BasicAuthorizationToken
 from IGitt.Interfaces import IssueStates
 from IGitt.Interfaces import MergeRequestStates
 from IGitt.Interfaces.Repository import WebhookEvents
 from IGitt import ElementAlreadyExistsError, ElementDoesntExistError
 
 from tests import IGittTestCase
+from tests import serve
 
 
 class GitLabRepositoryTest(IGittTestCase):
@@ -241,3 +247,133 @@ class GitLabRepositoryTest(IGittTestCase):
         self.assertIsNone(repo.delete())
         with self.assertRaises(RuntimeError):
             repo.refresh()
+
+    def test_iter(self):
+        with requests_mock.Mocker() as m:
+            m.get(self.repo.url + '/repository/commits',
+                  json=[{'id': 'abc', 'author_name': 'Someone'},
+                        {'id': 'def', 'author_name': 'Someone Else'}])
+            m.get(self.repo.absolute_url('/users?username=nonenone'),
+                  json=[])
+            m.get(self.repo.absolute_url('/users?username=someone'),
+                  json=[{'name': 'Someone'}])
+            m.get(self.repo.url + '/merge_requests?state=opened',
+                  json=[{'iid': 1}])
+            m.get(self.repo.url + '/issues?state=opened', json=[{'iid': 2}])
+            self.assertEqual([c.sha for c in self.repo.iter_commits()],
+                             ['abc', 'def'])
+            self.assertEqual(
+                [c.sha for c in self.repo.iter_commits(author='someone')],
+                ['abc'])
+            self.assertEqual(list(self.repo.iter_commits(author='nonenone')),
+                             [])
+            self.assertEqual(
+                [mr.number for mr in self.repo.iter_merge_requests()], [1])
+            self.assertEqual([i.number for i in self.repo.iter_issues()],
+                             [2])
+
+    def test_limit(self):
+        with requests_mock.Mocker() as m:
+            m.get(self.repo.url + '/issues?state=opened&per_page=1',
+                  json=[{'iid': 1}], headers={
+                      'Link': '<{}?page=2>; rel="next"'.format(
+                          self.repo.url + '/issues')})
+            m.get(self.repo.url + '/repository/commits?per_page=100',
+                  json=[{'id': 'abc', 'author_name': 'Someone Else'},
+                        {'id': 'def', 'author_name': 'Someone'},
+                        {'id': 'ghi', 'author_name': 'Someone'}])
+            m.get(self.repo.absolute_url('/users?username=someone'),
+                  json=[{'name': 'Someone'}])
+            self.assertEqual({i.number for i in
+                              self.repo.filter_issues(limit=1)}, {1})
+            self.assertEqual(
+                {c.sha for c in self.repo.filter_commits('someone', 1)},
+                {'def'})
+
+    def test_count(self):
+        with requests_mock.Mocker() as m:
+            m.get(self.repo.url + '/issues?state=all&per_page=1',
+                  json=[{}], headers={
+                      'Link': '<{}?page=2>; rel="next"'.format(self.repo.url),
+                      'X-Total-Pages': '22'})
+            m.get(self.repo.url + '/merge_requests?state=merged&per_page=1',
+                  json=[{}], headers={
+                      'Link': '<{}?page=2>; rel="next"'.format(self.repo.url),
+                      'X-Total-Pages': '4'})
+            self.assertEqual(self.repo.count_issues('all'), 22)
+            self.assertEqual(self.repo.count_merge_requests('merged'), 4)
+
+
+class GitLabAsyncRepositoryTest(IGittTestCase):
+    vcr_options = {'ignore_localhost': True}
+
+    def setUp(self):
+        self.requests = []
+        self.responses = {
+            '/projects/o%2Fr/issues': [{'iid': 1, 'title': 'first'},
+                                       {'iid': 3, 'title': 'second'}],
+            '/projects/o%2Fr/issues/1/notes': [{'id': 5, 'body': 'hi'}],
+            '/users': [{'id': 7, 'name': 'Some One', 'username': 'someone'}],
+            '/projects/o%2Fr/repository/commits': [
+                {'id': 'abc', 'author_name': 'Someone Else'},
+                {'id': 'def', 'author_name': 'Some One'},
+            ],
+            '/projects/o%2Fr/merge_requests': [{'iid': 2}],
+            '/projects/o%2Fr/merge_requests/2': {'iid': 2, 'title': 'MR'},
+            '/projects/o%2Fr/merge_requests/2/commits': [{'id': 'abc'}],
+            '/projects/o%2Fr/repository/commits/abc/statuses': [
+                {'name': 'ci', 'status': 'success', 'description': 'new',
+                 'target_url': None},
+                {'name': 'ci', 'status': 'failed', 'description': 'old',
+                 'target_url': None},
+            ],
+        }
+        app = web.Application()
+        app.router.add_get('/{path:.*}', self.respond)
+        serve(self, app)
+        base_url = patch('IGitt.GitLab.BASE_URL', self.url)
+        base_url.start()
+        self.addCleanup(base_url.stop)
+        self.repo = GitLabRepository(BasicAuthorizationToken('user', 'pass'),
+                                     'o/r')
+
+    async def respond(self, request):
+        self.requests.append(request)
+        return web.json_response(self.responses[request.rel_url.raw_path])
+
+    def collect(self, aiterable):
+        async def collect():
+            return [item async for item in aiterable]
+        return self.loop.run_until_complete(collect())
+
+    def test_aiter_issues(self):
+        issues = self.collect(self.repo.aiter_issues(assignee='someone',
+                                                     limit=1))
+        self.assertEqual([issue.title for issue in issues], ['first'])
+        self.assertEqual(self.requests[-1].query['assignee_id'], '7')
+        self.assertEqual(self.requests[-1].query['per_page'], '1')
+
+        comments = self.loop.run_until_complete(issues[0].acomments())
+        self.assertEqual([comment.body for comment in comments], ['hi'])
+
+    def test_aiter_commits(self):
+        commits = self.collect(self.repo.aiter_commits(author='someone'))
+        self.assertEqual([commit.sha for commit in commits], ['def'])
+
+        self.responses['/users'] = []
+        self.assertEqual(self.collect(self.repo.aiter_commits('nobody')), [])
+
+    def test_merge_request(self):
+        mrs = self.collect(self.repo.aiter_merge_requests(state='all'))
+        self.assertEqual([mr.number for mr in mrs], [2])
+        self.assertEqual(self.requests[0].query['state'], 'all')
+
+        mr = GitLabMergeRequest(self.repo._token, 'o/r', 2)
+        self.loop.run_until_complete(mr.afetch())
+        self.assertEqual(mr.title, 'MR')
+
+        commits = self.loop.run_until_complete(mr.acommits())
+        self.assertEqual([commit.sha for commit in commits], ['abc'])
+        statuses = self.loop.run_until_complete(commits[0].aget_statuses())
+        self.assertEqual({status.description for status in statuses},
+                         {'new'})
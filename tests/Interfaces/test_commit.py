@@ -1,9 +1,12 @@
 from unittest.mock import PropertyMock
 from unittest.mock import patch
 
+from IGitt import ElementDoesntExistError
 from IGitt.Interfaces.Repository import Repository
 from IGitt.Interfaces.CommitStatus import Status
 from IGitt.Interfaces.Commit import Commit
+from IGitt.Interfaces.Commit import IssueReferenceScanner
+from IGitt.Interfaces.Commit import PatchIndex
 
 from tests import IGittTestCase
 
@@ -68,3 +71,80 @@ class TestCommit(IGittTestCase):
 
         for body in bad:
             self.assertEqual(self.commit.get_keywords_issues(r'', body), set())
+
+    def test_issue_reference_scanner(self):
+        keywords = (('close', r'[Cc]lose[sd]?'), ('fix', r'[Ff]ix(?:e[sd])?'))
+        scanner = IssueReferenceScanner.get('github', keywords)
+        # the patterns are compiled once
+        self.assertIs(IssueReferenceScanner.get('github', keywords), scanner)
+
+        references = scanner.scan(
+            ['Fixes #1 and closes a/b#2, #3\r\n\nRelated to #4',
+             'Fix https://github.com/c/d/issues/5'], 'o/r')
+        self.assertEqual(references.keywords['fix'],
+                         {('1', 'o/r'), ('5', 'c/d')})
+        self.assertEqual(references.keywords['close'],
+                         {('2', 'a/b'), ('3', 'a/b')})
+        self.assertEqual(references.closes,
+                         {('1', 'o/r'), ('2', 'a/b'), ('3', 'a/b'),
+                          ('5', 'c/d')})
+        self.assertEqual(references.mentions,
+                         references.closes | {('4', 'a/b')})
+
+        references = scanner.scan(['no references here'], 'o/r')
+        self.assertEqual((references.keywords, references.mentions),
+                         ({'close': set(), 'fix': set()}, set()))
+
+    def test_patch_index(self):
+        index = PatchIndex('@@ -1,3 +1,3 @@ def main():\n'
+                           ' line 1\n'
+                           '-line 2\n'
+                           '+line 2\n'
+                           ' line 3\n'
+                           '\\ No newline at end of file\n'
+                           '@@ -20,0 +21,2 @@\n'
+                           '+line 21\n'
+                           '+line 22\n')
+        self.assertEqual(index.lines, (1, 2, 3, 21, 22))
+        self.assertEqual([index.position(line) for line in index.lines],
+                         [1, 3, 4, 7, 8])
+        self.assertIsNone(index.position(4))
+        self.assertNotIn(20, index)
+        self.assertEqual(len(PatchIndex('')), 0)
+
+    @patch.object(Commit, 'get_patch_for_file')
+    def test_get_patch_index(self, mock_get_patch_for_file):
+        mock_get_patch_for_file.return_value = '@@ -1 +1 @@\n-a\n+b\n'
+        index = self.commit.get_patch_index('README.md')
+        self.assertEqual(index.position(1), 2)
+        self.assertIs(self.commit.get_patch_index('README.md'), index)
+
+        mock_get_patch_for_file.side_effect = ElementDoesntExistError
+        with self.assertRaises(ElementDoesntExistError):
+            self.commit.get_patch_index('missing.md')
+        with self.assertRaises(ElementDoesntExistError):
+            self.commit.get_patch_index('missing.md')
+        self.assertEqual(mock_get_patch_for_file.call_count, 2)
+
+    @patch.object(Commit, 'comment')
+    @patch.object(Commit, 'get_patch_for_file')
+    def test_comment_many(self, mock_get_patch_for_file, mock_comment):
+        mock_get_patch_for_file.return_value = '@@ -1 +1,2 @@\n a\n+b\n'
+
+        def comment(message, file, line, mr_number):
+            if message == 'fails':
+                raise RuntimeError('Not Found', 404)
+            return message
+        mock_comment.side_effect = comment
+
+        outcomes = self.commit.comment_many([('inline', 'a.py', 2),
+                                             ('below', 'a.py', 3),
+                                             ('fails', None, None)],
+                                            mr_number=1)
+        self.assertEqual([(outcome.inline, outcome.comment)
+                          for outcome in outcomes],
+                         [(True, 'inline'), (False, 'below'),
+                          (False, None)])
+        self.assertEqual(outcomes[2].error.args, ('Not Found', 404))
+        self.assertEqual(mock_get_patch_for_file.call_count, 1)
+        self.assertEqual(self.commit.comment_many([]), [])
@@ -1,4 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from threading import Event
+from threading import Timer
+from unittest.mock import patch
 import os
+import time
+
+from aiohttp import web
+import asyncio
+import requests_mock
 
 from IGitt.GitHub import BASE_URL as GITHUB_BASE_URL
 from IGitt.GitHub import GitHubMixin
@@ -8,12 +18,53 @@ from IGitt.GitHub import GitHubInstallationToken
 from IGitt.GitHub.GitHubRepository import GitHubRepository
 from IGitt.GitLab import BASE_URL as GITLAB_BASE_URL
 from IGitt.GitLab import GitLabOAuthToken
+from IGitt.Interfaces import _BACKGROUND_TASKS
+from IGitt.Interfaces import _copy_response
 from IGitt.Interfaces import _fetch
+from IGitt.Interfaces import adelete
+from IGitt.Interfaces import aget
+from IGitt.Interfaces import aiter_get
+from IGitt.Interfaces import apatch
+from IGitt.Interfaces import apost
+from IGitt.Interfaces import aput
+from IGitt.Interfaces import cache_key
+from IGitt.Interfaces import count
 from IGitt.Interfaces import get
+from IGitt.Interfaces import iter_get
+from IGitt.Interfaces import iter_lines
+from IGitt.Interfaces import lazy_get
+from IGitt.Interfaces import patch as patch_request
+from IGitt.Interfaces import post
 from IGitt.Interfaces import BasicAuthorizationToken
+from IGitt.Interfaces import Freshness
+from IGitt.Interfaces import SessionPool
+from IGitt.Interfaces import SingleFlight
+from IGitt.Interfaces import RateLimiter
+from IGitt.Interfaces import Token
+from IGitt.Interfaces import TokenPool
 from IGitt.Utils import Cache
+from IGitt.Utils import CacheStats
 
 from tests import IGittTestCase
+from tests import serve
+
+
+class FakeClock:
+    """
+    Stands in for the time module, sleeping merely advances the clock.
+    """
+    monotonic = staticmethod(time.monotonic)
+
+    def __init__(self):
+        self.now = time.time()
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
 
 
 class TestInterfacesInit(IGittTestCase):
@@ -98,3 +149,779 @@ class TestInterfacesInit(IGittTestCase):
         )
         repo = GitHubRepository(token, 'coala/coala')
         self.assertEqual(repo.identifier, 19816973)
+
+    def test_session_pool(self):
+        token = GitHubToken('some token')
+        session = SessionPool.get(token, GITHUB_BASE_URL + '/user')
+
+        # same credentials and host share the session
+        self.assertIs(session, SessionPool.get(GitHubToken('some token'),
+                                               GITHUB_BASE_URL + '/repos'))
+        # other credentials or hosts do not
+        self.assertIsNot(session, SessionPool.get(GitHubToken('other token'),
+                                                  GITHUB_BASE_URL + '/user'))
+        self.assertIsNot(session, SessionPool.get(token,
+                                                  GITLAB_BASE_URL + '/user'))
+
+        SessionPool.close()
+        self.assertIsNot(session, SessionPool.get(token,
+                                                  GITHUB_BASE_URL + '/user'))
+
+    def test_token_identity(self):
+        self.assertEqual(BasicAuthorizationToken('user', 'pass').identity,
+                         BasicAuthorizationToken('user', 'pass').identity)
+        self.assertNotEqual(BasicAuthorizationToken('user', 'pass').identity,
+                            BasicAuthorizationToken('user', 'word').identity)
+        # tokens without a value are only identical to themselves
+        token = Token()
+        self.assertEqual(token.identity, token.identity)
+        self.assertNotEqual(token.identity, Token().identity)
+
+    def test_session_pool_idle_eviction(self):
+        token = GitHubToken('some token')
+        session = SessionPool.get(token, GITHUB_BASE_URL + '/user')
+        try:
+            SessionPool.configure(pool_connections=10, pool_maxsize=10,
+                                  idle_timeout=timedelta(seconds=-1))
+            self.assertIsNot(session,
+                             SessionPool.get(token, GITHUB_BASE_URL + '/user'))
+        finally:
+            SessionPool.configure(idle_timeout=timedelta(minutes=5))
+
+    @patch('IGitt.Interfaces.MAX_PAGE_WORKERS', 4)
+    def test_concurrent_pagination(self):
+        url = GITHUB_BASE_URL + '/repos/some/repo/issues'
+        with requests_mock.Mocker() as m:
+            m.get(url + '?per_page=100', json=[1, 2], headers={
+                'Link': '<{0}?per_page=100&page=2>; rel="next", '
+                        '<{0}?per_page=100&page=4>; rel="last"'.format(url)})
+            for page in range(2, 5):
+                m.get(url + '?per_page=100&page={}'.format(page),
+                      json=[page * 10])
+            data = get(GitHubToken('token'), url)
+        self.assertEqual(data, [1, 2, 20, 30, 40])
+        self.assertEqual(m.call_count, 4)
+
+    @patch('IGitt.Interfaces.MAX_PAGE_WORKERS', 4)
+    def test_concurrent_pagination_gitlab(self):
+        url = GITLAB_BASE_URL + '/projects/1/issues'
+        with requests_mock.Mocker() as m:
+            m.get(url + '?per_page=100', json=[1], headers={
+                'Link': '<{}?page=2&per_page=100>; rel="next"'.format(url),
+                'X-Total-Pages': '3'})
+            m.get(url + '?page=2&per_page=100', json=[2])
+            m.get(url + '?page=3&per_page=100', json=[3])
+            data = get(GitLabOAuthToken('token'), url)
+        self.assertEqual(data, [1, 2, 3])
+
+    def test_iter_get(self):
+        url = GITHUB_BASE_URL + '/repos/some/repo/issues'
+        with requests_mock.Mocker() as m:
+            m.get(url + '?per_page=100', json=[1, 2], headers={
+                'Link': '<{}?per_page=100&page=2>; rel="next"'.format(url)})
+            m.get(url + '?per_page=100&page=2', json=[3])
+            items = iter_get(GitHubToken('token'), url)
+            self.assertEqual(m.call_count, 0)
+            self.assertEqual(next(items), 1)
+            self.assertEqual(next(items), 2)
+            self.assertEqual(m.call_count, 1)
+            self.assertEqual(list(items), [3])
+            self.assertEqual(m.call_count, 2)
+
+            m.get(url + '/1?per_page=100', json={'number': 1})
+            self.assertEqual(list(iter_get(GitHubToken('token'), url + '/1')),
+                             [{'number': 1}])
+
+    def test_iter_lines(self):
+        url = GITHUB_BASE_URL + '/repos/some/repo/commits/abc'
+        with requests_mock.Mocker() as m:
+            m.get(url, text='diff --git a/ä b/ä\n+ab\n\n-cde\n')
+            lines = iter_lines(GitHubToken('token'), url, chunk_size=3)
+            self.assertEqual(m.call_count, 0)
+            self.assertEqual(list(lines),
+                             ['diff --git a/ä b/ä', '+ab', '', '-cde'])
+            # the body isn't cached
+            self.assertEqual(len(list(iter_lines(GitHubToken('token'), url))),
+                             4)
+            self.assertEqual(m.call_count, 2)
+
+            m.get(url, text='Not Found', status_code=404)
+            with self.assertRaises(RuntimeError):
+                list(iter_lines(GitHubToken('token'), url))
+
+    @patch('IGitt.Interfaces.MAX_PAGE_WORKERS', 4)
+    def test_get_limit(self):
+        url = GITHUB_BASE_URL + '/repos/some/repo/issues'
+        with requests_mock.Mocker() as m:
+            m.get(url + '?per_page=20', json=list(range(20)), headers={
+                'Link': '<{0}?per_page=20&page=2>; rel="next", '
+                        '<{0}?per_page=20&page=50>; rel="last"'.format(url)})
+            self.assertEqual(get(GitHubToken('token'), url, limit=20),
+                             list(range(20)))
+            self.assertEqual(m.call_count, 1)
+
+            m.get(url + '?per_page=100', json=list(range(100)), headers={
+                'Link': '<{0}?per_page=100&page=2>; rel="next", '
+                        '<{0}?per_page=100&page=50>; rel="last"'.format(url)})
+            for page in range(2, 51):
+                m.get(url + '?per_page=100&page={}'.format(page),
+                      json=list(range(page * 100, page * 100 + 100)))
+            data = get(GitHubToken('token'), url, limit=250)
+        self.assertEqual(data, list(range(100)) + list(range(200, 350)))
+        # only the first three pages are needed
+        self.assertEqual(m.call_count, 4)
+
+    def test_iter_get_limit(self):
+        url = GITHUB_BASE_URL + '/repos/some/repo/issues'
+        with requests_mock.Mocker() as m:
+            m.get(url + '?per_page=3', json=[1, 2], headers={
+                'Link': '<{}?per_page=3&page=2>; rel="next"'.format(url)})
+            m.get(url + '?per_page=3&page=2', json=[3, 4])
+            self.assertEqual(list(iter_get(GitHubToken('token'), url,
+                                           limit=3)), [1, 2, 3])
+            self.assertEqual(m.call_count, 2)
+
+    def test_count(self):
+        url = GITHUB_BASE_URL + '/orgs/some-org/members'
+        with requests_mock.Mocker() as m:
+            m.get(url + '?per_page=1', json=[{}], headers={
+                'Link': '<{0}?per_page=1&page=2>; rel="next", '
+                        '<{0}?per_page=1&page=42>; rel="last"'.format(url)})
+            self.assertEqual(count(GitHubToken('token'), url), 42)
+            self.assertEqual(m.call_count, 1)
+
+            m.get(url + '?per_page=1&role=admin', json=[{}])
+            self.assertEqual(count(GitHubToken('token'), url,
+                                   {'role': 'admin'}), 1)
+
+            m.get(GITHUB_BASE_URL + '/search/issues?per_page=1',
+                  json={'total_count': 7, 'items': [{}]})
+            self.assertEqual(count(GitHubToken('token'),
+                                   GITHUB_BASE_URL + '/search/issues',
+                                   {'q': 'repo:some/repo'}), 7)
+
+    def test_count_gitlab(self):
+        url = GITLAB_BASE_URL + '/projects/1/issues'
+        with requests_mock.Mocker() as m:
+            m.get(url + '?per_page=1', json=[{}], headers={
+                'Link': '<{}?page=2&per_page=1>; rel="next"'.format(url),
+                'X-Total': '13', 'X-Total-Pages': '13'})
+            self.assertEqual(count(GitLabOAuthToken('token'), url), 13)
+
+            # the totals are left out for very large collections
+            m.get(url + '?per_page=1&state=closed', json=[{}], headers={
+                'Link': '<{}?page=2&per_page=1>; rel="next"'.format(url)})
+            m.get(url + '?per_page=100&state=closed', json=[{}, {}])
+            self.assertEqual(count(GitLabOAuthToken('token'), url,
+                                   {'state': 'closed'}), 2)
+
+    def test_rate_limit_retry(self):
+        url = GITHUB_BASE_URL + '/repos/some/repo'
+        token = GitHubToken('token')
+        clock = FakeClock()
+        reset = str(int(clock.now) + 60)
+        with patch('IGitt.Interfaces.time', clock), \
+                requests_mock.Mocker() as m:
+            m.get(url, [
+                {'status_code': 429, 'headers': {'Retry-After': '30'}},
+                {'status_code': 403, 'headers': {
+                    'X-RateLimit-Limit': '5000', 'X-RateLimit-Remaining': '0',
+                    'X-RateLimit-Reset': reset}},
+                {'json': {'id': 1}, 'headers': {
+                    'X-RateLimit-Limit': '5000',
+                    'X-RateLimit-Remaining': '4999',
+                    'X-RateLimit-Reset': str(int(reset) + 3600)}},
+            ])
+            self.assertEqual(get(token, url), {'id': 1})
+            self.assertEqual(m.call_count, 3)
+
+            # other errors aren't retried
+            m.get(url + '/hooks', status_code=403, text='Forbidden')
+            with self.assertRaises(RuntimeError):
+                get(token, url + '/hooks')
+            self.assertEqual(m.call_count, 4)
+        # the secondary limit is waited out, then the reset of the quota
+        self.assertEqual(len(clock.sleeps), 2)
+        self.assertAlmostEqual(clock.sleeps[0], 30, delta=1)
+        self.assertAlmostEqual(sum(clock.sleeps), 60, delta=1)
+        self.assertEqual(RateLimiter.get(token, url).remaining, 4998)
+
+    def test_rate_limit_exhausted(self):
+        url = GITHUB_BASE_URL + '/repos/some/repo'
+        token = GitHubToken('token')
+        clock = FakeClock()
+        exhausted = {'X-RateLimit-Limit': '5000',
+                     'X-RateLimit-Remaining': '0',
+                     'X-RateLimit-Reset': str(int(clock.now) + 60)}
+        limiter = RateLimiter.get(token, url)
+        with patch('IGitt.Interfaces.time', clock):
+            limiter.update(200, exhausted)
+            # a request waiting for the reset doesn't make the quota negative
+            self.assertAlmostEqual(limiter._reserve(), 60, delta=1)
+            self.assertEqual(limiter.remaining, 0)
+            # so a request rejected meanwhile is still retried after it
+            self.assertTrue(limiter.update(403, exhausted))
+
+            # the connection of a rejected response is released for the retry
+            with requests_mock.Mocker() as m, \
+                    patch('requests.Response.close') as close:
+                m.get(url, [{'status_code': 429,
+                             'headers': {'Retry-After': '1'}},
+                            {'json': {'id': 1}}])
+                self.assertEqual(get(token, url), {'id': 1})
+            self.assertEqual(m.call_count, 2)
+            self.assertEqual(close.call_count, 1)
+
+    def test_rate_limit_pacing(self):
+        clock = FakeClock()
+        limiter = RateLimiter.get(GitLabOAuthToken('token'), GITLAB_BASE_URL)
+        with patch('IGitt.Interfaces.time', clock):
+            # GitLab sends the same headers without the X- prefix
+            self.assertFalse(limiter.update(200, {
+                'RateLimit-Limit': '600', 'RateLimit-Remaining': '300',
+                'RateLimit-Reset': str(int(clock.now) + 50)}))
+            limiter.acquire()
+            self.assertEqual(clock.sleeps, [])
+            self.assertEqual(limiter.remaining, 299)
+
+            # once the quota runs low, the requests are spread evenly until
+            # the reset, given in seconds here
+            limiter.update(200, {
+                'RateLimit-Limit': '600', 'RateLimit-Remaining': '5',
+                'RateLimit-Reset': '50'})
+            for _ in range(3):
+                limiter.acquire()
+            self.assertEqual([round(delay) for delay in clock.sleeps],
+                             [10, 10, 10])
+
+            with patch.object(RateLimiter, 'max_wait', timedelta(seconds=1)):
+                with self.assertRaises(RuntimeError) as ex:
+                    limiter.acquire()
+            self.assertEqual(ex.exception.args[1], 429)
+
+
+    def test_token_pool(self):
+        url = GITHUB_BASE_URL + '/repos/some/repo'
+        first, second = GitHubToken('first'), GitHubToken('second')
+        pool = TokenPool([first, second])
+        reset = str(int(time.time()) + 3600)
+
+        def respond(request, context):
+            context.headers = {'X-RateLimit-Limit': '5000',
+                               'X-RateLimit-Reset': reset}
+            if request.headers['Authorization'] == 'Bearer first':
+                context.headers['X-RateLimit-Remaining'] = '1000'
+                return [1]
+            context.headers['X-RateLimit-Remaining'] = '4000'
+            return [2]
+
+        with requests_mock.Mocker() as m:
+            m.get(url, json=respond)
+            # nothing is known about the quotas yet
+            self.assertEqual(get(pool, url), [1])
+            # the second token has the most quota left then
+            self.assertEqual(get(pool, url), [2])
+            self.assertEqual(get(pool, url), [2])
+            self.assertEqual(list(iter_get(pool, url)), [2])
+
+            # exhausted tokens are avoided
+            RateLimiter.get(second, url).update(200, {
+                'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': reset})
+            self.assertEqual(get(pool, url), [1])
+        self.assertEqual(pool.members(url), [first, second])
+        # used as a single token, the pool stands for its preferred member
+        self.assertEqual(pool.value, 'first')
+        self.assertEqual(pool.headers, first.headers)
+        self.assertEqual(pool.parameter, first.parameter)
+        self.assertIsInstance(pool.auth, type(first.auth))
+        self.assertEqual(pool.identity[1:], (first.identity, second.identity))
+
+    def test_token_pool_failover(self):
+        url = GITHUB_BASE_URL + '/repos/some/repo'
+        pool = TokenPool([GitHubToken('revoked'), GitHubToken('valid')])
+
+        def respond(request, context):
+            if request.headers['Authorization'] == 'Bearer revoked':
+                context.status_code = 401
+                return {'message': 'Bad credentials'}
+            return [{}]
+
+        with requests_mock.Mocker() as m:
+            m.get(url, json=respond)
+            m.post(url, json=respond)
+            self.assertEqual(get(pool, url), [{}])
+            self.assertEqual(m.call_count, 2)
+            # the rejected token is passed over from now on
+            self.assertEqual(post(pool, url, {}), [{}])
+            self.assertEqual(list(iter_get(pool, url)), [{}])
+            self.assertEqual(count(pool, url), 1)
+            self.assertEqual(m.call_count, 5)
+
+            # other errors don't fail over
+            m.get(url, status_code=404, json={'message': 'Not Found'})
+            with self.assertRaises(RuntimeError):
+                get(pool, url)
+            self.assertEqual(m.call_count, 6)
+
+        pool = TokenPool([GitHubToken('limited'), GitHubToken('other')])
+        clock = FakeClock()
+
+        def respond_forbidden(request, context):
+            context.status_code = 403
+            if request.headers['Authorization'] == 'Bearer limited':
+                context.headers.update({
+                    'X-RateLimit-Remaining': '0',
+                    'X-RateLimit-Reset': str(int(clock.now) + 3600)})
+                return {'message': 'API rate limit exceeded'}
+            return {'message': 'Resource not accessible by integration'}
+
+        with requests_mock.Mocker() as m, \
+                patch('IGitt.Interfaces.time', clock):
+            m.get(url, json=respond_forbidden)
+            # a rate limit fails over without waiting for the reset, a lack
+            # of permissions doesn't fail over
+            with self.assertRaises(RuntimeError) as context:
+                get(pool, url)
+            self.assertEqual(context.exception.args[1], 403)
+            self.assertEqual([request.headers['Authorization']
+                              for request in m.request_history],
+                             ['Bearer limited', 'Bearer other'])
+            self.assertEqual(clock.sleeps, [])
+
+            # a member known to be limited isn't even tried
+            with self.assertRaises(RuntimeError):
+                get(TokenPool([GitHubToken('limited'), GitHubToken('other')]),
+                    url, {'state': 'open'})
+            self.assertEqual(m.last_request.headers['Authorization'],
+                             'Bearer other')
+            self.assertEqual(m.call_count, 3)
+
+            m.get(url + '/private', status_code=403,
+                  json={'message': 'Must have admin rights'})
+            with self.assertRaises(RuntimeError):
+                get(TokenPool([GitHubToken('first'), GitHubToken('second')]),
+                    url + '/private')
+            self.assertEqual(m.call_count, 4)
+            self.assertEqual(clock.sleeps, [])
+
+        with self.assertRaises(ValueError):
+            TokenPool([])
+
+    def test_freshness(self):
+        url = GITHUB_BASE_URL + '/repos/some/fresh'
+        token = GitHubToken('token')
+        policy = Freshness(timedelta(seconds=30), timedelta(minutes=5))
+        clock = FakeClock()
+        revalidator = ThreadPoolExecutor(1)
+        with patch('IGitt.Interfaces.time', clock), \
+                patch('IGitt.Interfaces._REVALIDATOR', revalidator), \
+                requests_mock.Mocker() as m:
+            m.get(url, [{'json': {'id': 1}, 'headers': {'ETag': '"1"'}},
+                        {'status_code': 304},
+                        {'json': {'id': 2}, 'headers': {'ETag': '"2"'}},
+                        {'status_code': 304}])
+            self.assertEqual(get(token, url, freshness=policy), {'id': 1})
+            # fresh responses are served without any request
+            clock.now += 30
+            self.assertEqual(get(token, url, freshness=policy), {'id': 1})
+            self.assertEqual(m.call_count, 1)
+            self.assertEqual(get(token, url), {'id': 1})
+            self.assertEqual(m.call_count, 2)
+
+            # stale ones are served while being revalidated
+            clock.now += 60
+            self.assertEqual(get(token, url, freshness=policy), {'id': 1})
+            revalidator.shutdown(wait=True)
+            self.assertEqual(m.call_count, 3)
+            self.assertEqual(get(token, url, freshness=policy), {'id': 2})
+            self.assertEqual(m.call_count, 3)
+
+            # responses changed according to a webhook are never fresh
+            Cache.update(cache_key(token, url), {'fromWebhook': True})
+            self.assertEqual(get(token, url, freshness=policy), {'id': 2})
+            self.assertEqual(m.call_count, 4)
+            self.assertIn('If-Modified-Since', m.last_request.headers)
+
+    def test_immutable_cache(self):
+        url = (GITHUB_BASE_URL + '/repos/some/repo/commits/'
+               'c0fd4facd43c471b5600e49076089a81522a23f8')
+        token = GitHubToken('token')
+        diff = {'Accept': 'application/vnd.github.v3.diff'}
+
+        def respond(request, context):
+            context.headers['ETag'] = '"etag"'
+            if request.headers.get('Accept') == diff['Accept']:
+                return '+diff'
+            return '{"sha": "c0fd4fa"}'
+
+        with requests_mock.Mocker() as m:
+            m.get(url, text=respond)
+            m.get(url + '/statuses', json=[], headers={'ETag': '"etag"'})
+            for _ in range(2):
+                self.assertEqual(get(token, url), {'sha': 'c0fd4fa'})
+                self.assertEqual(get(token, url, headers=diff), '+diff')
+                self.assertEqual(get(token, url + '/statuses'), [])
+            # statuses of a commit aren't immutable, it and its diff are
+            self.assertEqual(m.call_count, 4)
+            self.assertNotIn('If-None-Match', m.request_history[0].headers)
+            self.assertEqual(m.last_request.headers['If-None-Match'], '"etag"')
+
+    def test_cache_keys(self):
+        url = GITLAB_BASE_URL + '/projects/some%2Frepo/issues'
+        token = GitLabOAuthToken('token')
+
+        def respond(request, context):
+            state = request.qs['state'][0]
+            context.headers['ETag'] = '"{}"'.format(state)
+            return [{'state': state}]
+
+        with requests_mock.Mocker() as m:
+            m.get(url, json=respond)
+            for _ in range(2):
+                self.assertEqual(get(token, url, {'state': 'opened'}),
+                                 [{'state': 'opened'}])
+                self.assertEqual(get(token, url, {'state': 'closed'}),
+                                 [{'state': 'closed'}])
+            # different filters don't overwrite each other's entity tags
+            self.assertEqual([request.headers.get('If-None-Match')
+                              for request in m.request_history],
+                             [None, None, '"opened"', '"closed"'])
+
+            # nor do different tokens share entries
+            get(GitLabOAuthToken('other'), url, {'state': 'opened'})
+            self.assertNotIn('If-None-Match', m.last_request.headers)
+        self.assertIsNotNone(Cache.get(cache_key(token, url,
+                                                 {'state': 'opened'})))
+
+    def test_write_through(self):
+        url = GITHUB_BASE_URL + '/repos/some/repo/issues/1'
+        token = GitHubToken('token')
+        policy = Freshness(timedelta(minutes=1))
+
+        with requests_mock.Mocker() as m:
+            m.get(url, json={'url': url, 'state': 'open'},
+                  headers={'ETag': '"open"'})
+            m.get(url + '/comments', json=[], headers={'ETag': '"none"'})
+            m.patch(url, json={'url': url, 'state': 'closed'},
+                    headers={'ETag': '"closed"'})
+            m.post(url + '/comments', json={'id': 1})
+            get(token, url)
+            get(token, url + '/comments')
+
+            # the response to a mutation is cached as if just fetched
+            patch_request(token, url, {'state': 'closed'})
+            self.assertEqual(get(token, url, freshness=policy),
+                             {'url': url, 'state': 'closed'})
+            self.assertEqual(m.call_count, 3)
+            get(token, url)
+            self.assertEqual(m.last_request.headers['If-None-Match'],
+                             '"closed"')
+
+            # the resources depending on the mutated one are fetched again
+            post(token, url + '/comments', {'body': 'hi'})
+            get(token, url + '/comments')
+            self.assertNotIn('If-None-Match', m.last_request.headers)
+            get(token, url)
+            self.assertNotIn('If-None-Match', m.last_request.headers)
+
+            # so are the ones queried with any parameters
+            issues = GITHUB_BASE_URL + '/repos/some/repo/issues'
+            m.get(issues, json=[{'url': url, 'state': 'open'}])
+            m.get(issues + '/2', status_code=404, json={})
+            self.assertEqual(len(get(token, issues, {'state': 'open'},
+                                     freshness=policy)), 1)
+            with self.assertRaises(RuntimeError):
+                get(token, issues + '/2', {'unused': 'param'})
+            m.get(issues, json=[])
+            m.get(issues + '/2', json={'url': issues + '/2'})
+            m.patch(issues + '/2/comments', json={})
+            patch_request(token, url, {'state': 'closed'})
+            patch_request(token, issues + '/2/comments', {})
+            self.assertEqual(get(token, issues, {'state': 'open'},
+                                 freshness=policy), [])
+            self.assertEqual(get(token, issues + '/2', {'unused': 'param'}),
+                             {'url': issues + '/2'})
+
+    def test_negative_cache(self):
+        url = GITHUB_BASE_URL + '/repos/some/repo/branches/deleted'
+        token = GitHubToken('token')
+
+        with requests_mock.Mocker() as m:
+            m.get(url, status_code=404, json={'message': 'Not Found'})
+            for _ in range(3):
+                with self.assertRaises(RuntimeError) as context:
+                    get(token, url)
+                self.assertEqual(context.exception.args[1], 404)
+            self.assertEqual(m.call_count, 1)
+
+            # creating the resource makes it fetched again
+            m.patch(url, json={'name': 'deleted'})
+            m.get(url, json={'name': 'deleted'})
+            patch_request(token, url, {'name': 'deleted'})
+            self.assertEqual(get(token, url), {'name': 'deleted'})
+
+    def test_cache_stats(self):
+        url = GITHUB_BASE_URL + '/repos/some/counted/pulls/1'
+        token = GitHubToken('token')
+        policy = Freshness(timedelta(minutes=1))
+        CacheStats.reset()
+
+        with requests_mock.Mocker() as m:
+            m.get(url, [{'json': {'id': 1}, 'headers': {'ETag': '"1"'}},
+                        {'status_code': 304}])
+            get(token, url)
+            get(token, url)
+            get(token, url, freshness=policy)
+        counts = CacheStats.snapshot()['/repos/{owner}/{repo}/pulls/{n}']
+        self.assertEqual(
+            (counts['misses'], counts['revalidations'], counts['hits']),
+            (1, 1, 1))
+
+    def test_single_flight(self):
+        url = GITHUB_BASE_URL + '/repos/some/repo'
+        token = GitHubToken('token')
+
+        def respond(request, context):
+            # keeps the request in flight while the others come in
+            time.sleep(0.2)
+            return {'id': 1}
+
+        with requests_mock.Mocker() as m, \
+                patch.object(Cache, 'set', wraps=Cache.set) as cache_set:
+            m.get(url, json=respond)
+            with ThreadPoolExecutor(4) as executor:
+                results = list(executor.map(lambda _: get(token, url),
+                                            range(4)))
+            self.assertEqual(results, [{'id': 1}] * 4)
+            self.assertEqual(m.call_count, 1)
+            self.assertEqual(cache_set.call_count, 1)
+            # every caller can modify its response on its own
+            self.assertEqual(len({id(result) for result in results}), 4)
+
+            # different parameters or tokens aren't shared
+            with ThreadPoolExecutor(2) as executor:
+                list(executor.map(lambda args: get(*args), [
+                    (token, url, {'state': 'open'}),
+                    (GitHubToken('other'), url)]))
+            self.assertEqual(m.call_count, 3)
+
+
+class TestAsyncInterfacesInit(IGittTestCase):
+    vcr_options = {'ignore_localhost': True}
+
+    def setUp(self):
+        self.token = BasicAuthorizationToken('user', 'pass')
+        self.requests = []
+        self.pending_stats = 2
+
+        app = web.Application()
+        app.router.add_get('/items', self.items)
+        app.router.add_route('*', '/echo', self.echo)
+        app.router.add_get('/stats', self.stats)
+        app.router.add_get('/limited', self.limited)
+        app.router.add_get('/private', self.private)
+        app.router.add_get('/slow', self.slow)
+        app.router.add_get('/counter', self.counter)
+        serve(self, app)
+
+    async def items(self, request):
+        self.requests.append(request)
+        if request.headers.get('If-None-Match') == '"etag"':
+            return web.Response(status=304)
+        page = int(request.query.get('page', 1))
+        headers = {'ETag': '"etag"'}
+        if page < 3:
+            headers['Link'] = (
+                '<{0}/items?page={1}>; rel="next", '
+                '<{0}/items?page=3>; rel="last"'.format(self.url, page + 1))
+        return web.json_response([page * 10, page * 10 + 1], headers=headers)
+
+    async def echo(self, request):
+        if request.method == 'DELETE':
+            return web.Response(status=204)
+        return web.json_response({'method': request.method,
+                                  'data': await request.json()})
+
+    async def stats(self, request):
+        if self.pending_stats:
+            self.pending_stats -= 1
+            return web.json_response({}, status=202)
+        return web.json_response([{'total': 1}])
+
+    async def limited(self, request):
+        self.requests.append(request)
+        if len(self.requests) == 1:
+            return web.json_response({}, status=429,
+                                     headers={'Retry-After': '0'})
+        return web.json_response({'id': 1}, headers={
+            'RateLimit-Limit': '600', 'RateLimit-Remaining': '598',
+            'RateLimit-Reset': '60'})
+
+    async def private(self, request):
+        self.requests.append(request)
+        if request.headers['Authorization'] != 'Basic Z29vZDpwYXNz':
+            return web.json_response({}, status=401)
+        return web.json_response([{'private': True}])
+
+    async def slow(self, request):
+        self.requests.append(request)
+        await asyncio.sleep(0.1)
+        return web.json_response({'id': 1})
+
+    async def counter(self, request):
+        self.requests.append(request)
+        return web.json_response({'count': len(self.requests)})
+
+    def await_(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def test_aget(self):
+        self.assertEqual(self.await_(aget(self.token, self.url + '/items')),
+                         [10, 11, 20, 21, 30, 31])
+        self.assertEqual(self.requests[0].query['per_page'], '100')
+        self.assertEqual(self.requests[0].headers['Authorization'],
+                         'Basic dXNlcjpwYXNz')
+
+        # the cached pages are only revalidated
+        self.requests.clear()
+        self.assertEqual(self.await_(aget(self.token, self.url + '/items')),
+                         [10, 11, 20, 21, 30, 31])
+        self.assertEqual(len(self.requests), 3)
+
+        self.assertEqual(self.await_(aget(self.token, self.url + '/items',
+                                          {'state': 'all'}, limit=3)),
+                         [10, 11, 20])
+
+        with self.assertRaises(RuntimeError) as ex:
+            self.await_(aget(self.token, self.url + '/missing'))
+        self.assertEqual(ex.exception.args[1], 404)
+
+    def test_aiter_get(self):
+        async def collect():
+            return [item async for item in aiter_get(
+                self.token, self.url + '/items', {'sort': 'asc'}, limit=3)]
+
+        self.assertEqual(self.await_(collect()), [10, 11, 20])
+        self.assertEqual(len(self.requests), 2)
+
+    def test_rate_limit(self):
+        url = self.url + '/limited'
+        self.assertEqual(self.await_(aget(self.token, url)), {'id': 1})
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(RateLimiter.get(self.token, url).remaining, 598)
+
+    def test_token_pool(self):
+        url = self.url + '/private'
+        pool = TokenPool([BasicAuthorizationToken('bad', 'pass'),
+                          BasicAuthorizationToken('good', 'pass')])
+        self.assertEqual(self.await_(aget(pool, url)), [{'private': True}])
+        self.assertEqual(len(self.requests), 2)
+
+        async def collect():
+            return [item async for item in aiter_get(pool, url)]
+
+        self.assertEqual(self.await_(collect()), [{'private': True}])
+        self.assertEqual(len(self.requests), 3)
+
+    def test_single_flight(self):
+        url = self.url + '/slow'
+
+        async def gather():
+            return await asyncio.gather(*(aget(self.token, url)
+                                          for _ in range(4)))
+
+        results = self.await_(gather())
+        self.assertEqual(results, [{'id': 1}] * 4)
+        self.assertEqual(len({id(result) for result in results}), 4)
+        self.assertEqual(len(self.requests), 1)
+
+    def test_single_flight_copies(self):
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return {'labels': ['bug']}, {}
+
+        async def leader():
+            data, _ = await flight.ado('key', fetch, _copy_response)
+            data['labels'].append('mutated')
+            return data
+
+        async def follower():
+            return (await flight.ado('key', fetch, _copy_response))[0]
+
+        async def gather():
+            return await asyncio.gather(leader(), follower())
+
+        # the leader's caller modifies its response before the follower's
+        # gets its own
+        self.assertEqual(self.await_(gather()),
+                         [{'labels': ['bug', 'mutated']}, {'labels': ['bug']}])
+
+        started, following = Event(), Event()
+
+        def slow_fetch():
+            started.set()
+            following.wait()
+            return {'labels': ['bug']}, {}
+
+        def lead():
+            data, _ = flight.do('key', slow_fetch, _copy_response)
+            data['labels'].append('mutated')
+            return data
+
+        def follow():
+            started.wait()
+            # let the leader finish while this caller waits
+            Timer(0.05, following.set).start()
+            return flight.do('key', slow_fetch, _copy_response)[0]
+
+        with ThreadPoolExecutor(2) as executor:
+            lead_result = executor.submit(lead)
+            follow_result = executor.submit(follow)
+            self.assertEqual(lead_result.result(),
+                             {'labels': ['bug', 'mutated']})
+            self.assertEqual(follow_result.result(), {'labels': ['bug']})
+
+    def test_freshness(self):
+        url = self.url + '/counter'
+        policy = Freshness(timedelta(seconds=30), timedelta(minutes=5))
+        clock = FakeClock()
+        with patch('IGitt.Interfaces.time', clock):
+            self.assertEqual(self.await_(aget(self.token, url,
+                                              freshness=policy)),
+                             {'count': 1})
+            self.assertEqual(self.await_(aget(self.token, url,
+                                              freshness=policy)),
+                             {'count': 1})
+            self.assertEqual(len(self.requests), 1)
+
+            clock.now += 60
+            self.assertEqual(self.await_(aget(self.token, url,
+                                              freshness=policy)),
+                             {'count': 1})
+            self.await_(asyncio.gather(*_BACKGROUND_TASKS))
+            self.assertEqual(self.await_(aget(self.token, url,
+                                              freshness=policy)),
+                             {'count': 2})
+            self.assertEqual(len(self.requests), 2)
+
+    def test_modifying_requests(self):
+        url = self.url + '/echo'
+        self.assertEqual(self.await_(apost(self.token, url, {'a': 1})),
+                         {'method': 'POST', 'data': {'a': 1}})
+        self.assertEqual(self.await_(aput(self.token, url, {'b': 2})),
+                         {'method': 'PUT', 'data': {'b': 2}})
+        self.assertEqual(self.await_(apatch(self.token, url, {'c': 3})),
+                         {'method': 'PATCH', 'data': {'c': 3}})
+        self.assertIsNone(self.await_(adelete(self.token, url)))
+
+    def test_lazy_get(self):
+        results = []
+
+        async def callback(data):
+            results.append(data)
+
+        self.await_(lazy_get(self.url + '/stats', callback,
+                             interval=timedelta(milliseconds=1)))
+        self.assertEqual(results, [[{'total': 1}]])
@@ -1,7 +1,18 @@
+from datetime import timedelta
+from unittest.mock import Mock
+from unittest.mock import patch
+import time
 
 from tests import IGittTestCase
 from IGitt.Utils import Cache
+from IGitt.Utils import CacheStats
+from IGitt.Utils import ImmutableCache
+from IGitt.Utils import JSONSerializer
 from IGitt.Utils import LimitedSizeDict
+from IGitt.Utils import LRUDict
+from IGitt.Utils import MarshalSerializer
+from IGitt.Utils import NegativeCache
+from IGitt.Utils import url_template
 
 
 class CacheTestCase(IGittTestCase):
@@ -15,6 +26,48 @@ class CacheTestCase(IGittTestCase):
         # latest 10 entries
         self.assertEqual(len(store), 10)
 
+    def test_LRUDict(self):
+        store = LRUDict(max_bytes=100)
+        for i in range(10):
+            store[i] = str(i) * 10
+        self.assertEqual((len(store), store.size), (10, 100))
+
+        # reading an entry makes it the most recently used one
+        self.assertEqual(store[0], '0' * 10)
+        store[10] = 'a' * 20
+        self.assertNotIn(1, store)
+        self.assertNotIn(2, store)
+        self.assertIn(0, store)
+        self.assertEqual(store.size, 100)
+
+        # replacing an entry accounts for its new size
+        store[0] = 'ü'
+        self.assertEqual(store.size, 92)
+
+        # an entry beyond the budget isn't stored at all
+        store[11] = 'b' * 101
+        self.assertNotIn(11, store)
+        self.assertEqual(len(store), 9)
+
+        del store[0]
+        self.assertEqual(store.size, 90)
+        with self.assertRaises(KeyError):
+            del store[0]
+        with self.assertRaises(KeyError):
+            store[0]
+        store.clear()
+        self.assertEqual((len(store), store.size), (0, 0))
+
+        evicted = []
+        store = LRUDict(max_bytes=10, on_evict=lambda *item:
+                        evicted.append(item))
+        store['a'], store['b'] = 'x' * 6, 'y' * 6
+        self.assertEqual(evicted, [('a', 6)])
+
+        # a known size isn't computed again
+        store.put('c', 'z', size=4)
+        self.assertEqual(store.size, 10)
+
     def test_cache_validation_entityTag(self):
         with self.assertRaises(TypeError):
             Cache.validate({'entityTag': 10})
@@ -30,6 +83,151 @@ class CacheTestCase(IGittTestCase):
         with self.assertRaises(TypeError):
             Cache.validate({'lastFetched': None})
 
+    def test_cache_validation_fetchedAt(self):
+        with self.assertRaises(TypeError):
+            Cache.validate({'fetchedAt': 'yesterday'})
+
     def test_cache_validation_fromWebhook(self):
         with self.assertRaises(TypeError):
             Cache.validate({'fromWebhook': None})
+
+    def test_in_memory_cache(self):
+        data = {'labels': ['bug']}
+        Cache.set('in-memory', {'data': data, 'entityTag': '"tag"'})
+        # neither the stored nor the retrieved data is shared
+        data['labels'].append('feature')
+        entry = Cache.get('in-memory')
+        entry['data']['labels'].append('question')
+        self.assertEqual(Cache.get('in-memory')['data'], {'labels': ['bug']})
+
+        Cache.update('in-memory', {'fromWebhook': True})
+        entry = Cache.get('in-memory')
+        self.assertEqual((entry['fromWebhook'], entry['entityTag']),
+                         (True, '"tag"'))
+        self.assertIsNone(Cache.get('missing'))
+
+        # the size of an entry is computed once for both the budget and the
+        # statistics
+        store = LRUDict(max_bytes=2 ** 20, sizeof=Mock(return_value=0))
+        with patch.object(Cache, '_get', store.__getitem__), \
+                patch.object(Cache, '_set', store.put), \
+                patch.object(Cache, '_serializer', None):
+            Cache.set('in-memory', {'data': data})
+            self.assertEqual(Cache.get('in-memory')['data'], data)
+        store._sizeof.assert_not_called()
+        self.assertGreater(store.size, 0)
+
+    def test_external_cache(self):
+        for serializer, kind in ((None, str), (JSONSerializer(), str),
+                                 (MarshalSerializer(), bytes)):
+            store = {}
+            with patch.object(Cache, '_get'), patch.object(Cache, '_set'), \
+                    patch.object(Cache, '_serializer'):
+                Cache.use(store.__getitem__, store.__setitem__, serializer)
+                Cache.set('external', {'data': [1], 'links': {}})
+                self.assertIsInstance(store['external'], kind)
+                entry = Cache.get('external')
+                self.assertEqual(entry['data'], [1])
+                self.assertFalse(entry['fromWebhook'])
+                self.assertIsNone(Cache.get('missing'))
+
+                # entries written in another format are ignored
+                Cache.use(store.__getitem__, store.__setitem__,
+                          MarshalSerializer() if kind is str else None)
+                self.assertIsNone(Cache.get('external'))
+
+    def test_cache_key(self):
+        url = 'https://gitlab.com/api/v4/projects/a%2Fb/issues'
+        self.assertEqual(
+            Cache.key(url + '?state=opened', {'labels': 'bug', 'page': 2}),
+            Cache.key('HTTPS://GitLab.com:443/api/v4/projects/a%2Fb/issues',
+                      {'page': '2', 'state': 'opened', 'labels': ['bug'],
+                       'private_token': 'secret', 'sort': None}))
+        self.assertNotEqual(Cache.key(url, {'state': 'opened'}),
+                            Cache.key(url, {'state': 'closed'}))
+        self.assertEqual(Cache.key(url, scope=('GitLabToken', 'a')),
+                         Cache.key(url, scope=('GitLabToken', 'a')))
+        self.assertNotEqual(Cache.key(url, scope=('GitLabToken', 'a')),
+                            Cache.key(url, scope=('GitLabToken', 'b')))
+        # the fingerprint doesn't give the scope away
+        self.assertNotIn('secret', Cache.key(url, scope=('Token', 'secret')))
+
+    def test_immutable_cache_key(self):
+        sha = 'c0fd4facd43c471b5600e49076089a81522a23f8'
+        github = 'https://api.github.com/repos/a/b'
+        gitlab = 'https://gitlab.com/api/v4/projects/a%2Fb/repository'
+        for url in (github + '/commits/' + sha,
+                    github + '/compare/{0}...{0}'.format(sha),
+                    github + '/git/trees/' + sha,
+                    gitlab + '/commits/' + sha,
+                    gitlab + '/commits/{}/diff?page=2'.format(sha),
+                    gitlab + '/blobs/{}/raw'.format(sha)):
+            self.assertIsNotNone(ImmutableCache.key(url), url)
+        for url in (github + '/commits/' + sha[:7],
+                    github + '/commits/{}/statuses'.format(sha),
+                    github + '/compare/master...' + sha,
+                    gitlab + '/commits/{}/comments'.format(sha)):
+            self.assertIsNone(ImmutableCache.key(url), url)
+
+        url = github + '/commits/' + sha
+        # the representation is part of the key, the token isn't
+        self.assertNotEqual(
+            ImmutableCache.key(url),
+            ImmutableCache.key(url, headers={
+                'Accept': 'application/vnd.github.v3.diff'}))
+        self.assertEqual(
+            ImmutableCache.key(url, {'per_page': 100, 'page': 2}),
+            ImmutableCache.key(url, {'page': 2, 'per_page': 100,
+                                     'private_token': 'secret'}))
+
+    def test_negative_cache(self):
+        NegativeCache.set('missing', 'Not Found', 404)
+        NegativeCache.set('forbidden', 'Forbidden', 403)
+        self.assertEqual(NegativeCache.get('missing'), ('Not Found', 404))
+        self.assertIsNone(NegativeCache.get('forbidden'))
+        NegativeCache.discard('missing')
+        self.assertIsNone(NegativeCache.get('missing'))
+
+        NegativeCache.set('gone', 'Gone', 410)
+        with patch.object(time, 'monotonic', lambda: float('inf')):
+            self.assertIsNone(NegativeCache.get('gone'))
+
+        with patch.object(NegativeCache, 'ttl', timedelta(0)):
+            NegativeCache.set('missing', 'Not Found', 404)
+            self.assertIsNone(NegativeCache.get('missing'))
+
+    def test_url_template(self):
+        sha = 'c0fd4facd43c471b5600e49076089a81522a23f8'
+        self.assertEqual(
+            url_template('https://api.github.com/repos/a/b/commits/' + sha +
+                         '/comments?per_page=100 #fingerprint'),
+            '/repos/{owner}/{repo}/commits/{sha}/comments')
+        self.assertEqual(
+            url_template('https://gitlab.com/api/v4/projects/a%2Fb/issues/3'),
+            '/api/v4/projects/{id}/issues/{n}')
+        self.assertEqual(url_template('https://api.github.com/users/a'),
+                         '/users/{name}')
+
+    def test_cache_stats(self):
+        exported = []
+        hook = lambda *count: exported.append(count)
+        CacheStats.reset()
+        CacheStats.add_hook(hook)
+        try:
+            Cache.set('https://api.github.com/repos/a/b/pulls/1',
+                      {'data': {'id': 1}})
+            Cache.get('https://api.github.com/repos/a/b/pulls/1')
+            CacheStats.record('hits',
+                              'https://api.github.com/repos/c/d/pulls/2')
+        finally:
+            CacheStats.remove_hook(hook)
+        CacheStats.record('misses', 'https://api.github.com/repos/a/b/pulls/1')
+
+        counts = CacheStats.snapshot()['/repos/{owner}/{repo}/pulls/{n}']
+        self.assertEqual((counts['hits'], counts['misses']), (1, 1))
+        self.assertGreater(counts['bytes_stored'], 0)
+        self.assertGreater(counts['serialization_seconds'], 0)
+        self.assertEqual(CacheStats.totals()['hits'], 1)
+        self.assertIn(('hits', '/repos/{owner}/{repo}/pulls/{n}', 1),
+                      exported)
+        self.assertNotIn('misses', [counter for counter, _, _ in exported])
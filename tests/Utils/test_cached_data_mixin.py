@@ -1,7 +1,9 @@
+import asyncio
 import os
 
 from IGitt.GitHub import GitHubToken
 from IGitt.GitHub.GitHubRepository import GitHubRepository
+from IGitt.Utils import CachedDataMixin
 
 from tests import IGittTestCase
 
@@ -17,3 +19,16 @@ class CachedDataMixinTest(IGittTestCase):
             repository.clone_url,
             'https://{}@github.com/gitmate-test-user/test.git'.format(
                 token.value))
+
+    def test_afetch(self):
+        class Answer(CachedDataMixin):
+            def _get_data(self):
+                return {'answer': 42}
+
+        # without a native _aget_data, _get_data runs in the executor
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        answer = Answer()
+        self.assertIs(loop.run_until_complete(answer.afetch()), answer)
+        self.assertFalse(answer.data.may_need_refresh)
+        self.assertEqual(answer.data['answer'], 42)
@@ -0,0 +1,161 @@
+from multiprocessing import get_context
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from tests import IGittTestCase
+from IGitt.Utils import Cache
+from IGitt.Utils import MarshalSerializer
+from IGitt.Utils.SharedMemoryStore import _RECORD
+from IGitt.Utils.SharedMemoryStore import SharedMemoryStore
+
+
+def write_entry(path):
+    SharedMemoryStore(path)['from another process'] = 'value'
+
+
+def value_of(key, version=0):
+    return '{}:{}:{}'.format(key, version, key * (version % 97))
+
+
+def read_entries(path, ready, done, results):
+    store = SharedMemoryStore(path)
+    hits, wrong = 0, []
+    ready.set()
+    while not done.is_set():
+        for key in map(str, range(30)):
+            try:
+                value = store[key]
+            except KeyError:
+                continue
+            hits += 1
+            version = value.split(':')[1]
+            if not version.isdigit() or value != value_of(key, int(version)):
+                wrong.append((key, value))
+    store.close()
+    results.put((hits, wrong))
+
+
+class SharedMemoryStoreTestCase(IGittTestCase):
+
+    def setUp(self):
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = join(directory.name, 'cache')
+
+    def test_store(self):
+        store = SharedMemoryStore(self.path, max_bytes=2 ** 16,
+                                  compress=True)
+        self.addCleanup(store.close)
+        store['text'] = 'ü' * 1000
+        store['bytes'] = b'\x00' * 1000
+        self.assertEqual(store['text'], 'ü' * 1000)
+        self.assertEqual(store['bytes'], b'\x00' * 1000)
+        self.assertIn('text', store)
+        self.assertEqual(len(store), 2)
+        # the entries are compressed
+        self.assertLess(store.size, 200)
+
+        del store['text']
+        self.assertNotIn('text', store)
+        with self.assertRaises(KeyError):
+            store['text']
+        with self.assertRaises(KeyError):
+            del store['text']
+        store.clear()
+        self.assertEqual(len(store), 0)
+
+    def test_shared_file(self):
+        store = SharedMemoryStore(self.path, max_bytes=2 ** 16)
+        self.addCleanup(store.close)
+        store['key'] = 'value'
+        # the entries are shared between processes, the size of the file is
+        # fixed by the first one
+        other = SharedMemoryStore(self.path, max_bytes=2 ** 20)
+        self.addCleanup(other.close)
+        self.assertEqual((other['key'], other.max_bytes), ('value', 2 ** 16))
+        process = get_context('spawn').Process(target=write_entry,
+                                               args=(self.path, ))
+        process.start()
+        process.join()
+        self.assertEqual(store['from another process'], 'value')
+
+    def test_eviction(self):
+        store = SharedMemoryStore(self.path, max_bytes=4096, slots=64)
+        self.addCleanup(store.close)
+        for i in range(100):
+            store[str(i)] = str(i) * 100
+        # the oldest entries are overwritten
+        self.assertNotIn('0', store)
+        self.assertEqual(store['99'], '99' * 100)
+        self.assertLessEqual(store.size, 4096)
+
+        # so would all of them by an entry too big for the ring
+        store['big'] = 'x' * 1000
+        self.assertNotIn('big', store)
+        self.assertIn('99', store)
+
+    def test_concurrent_reader(self):
+        store = SharedMemoryStore(self.path, max_bytes=4096, slots=64)
+        self.addCleanup(store.close)
+        context = get_context('spawn')
+        ready, done = context.Event(), context.Event()
+        results = context.Queue()
+        process = context.Process(target=read_entries,
+                                  args=(self.path, ready, done, results))
+        process.start()
+        self.assertTrue(ready.wait(30))
+        # the ring is wrapped many times while the other process reads it
+        for i in range(3000):
+            key = str(i % 30)
+            store[key] = value_of(key, i)
+        done.set()
+        hits, wrong = results.get(timeout=30)
+        process.join()
+        self.assertGreater(hits, 0)
+        self.assertEqual(wrong, [])
+
+    def test_torn_record(self):
+        store = SharedMemoryStore(self.path, max_bytes=2 ** 16)
+        self.addCleanup(store.close)
+        store['key'] = 'value'
+        store['other'] = 'value'
+        # a record only partially written is rejected by its checksum, even
+        # though its header and key are intact
+        end = store._data_offset + _RECORD.size + len('keyvalue')
+        store._map[end - 2:end] = b'\x00\x00'
+        self.assertNotIn('key', store)
+        self.assertEqual(store['other'], 'value')
+        store['key'] = 'value'
+        self.assertEqual(store['key'], 'value')
+
+    def test_probe_collisions(self):
+        store = SharedMemoryStore(self.path, max_bytes=2 ** 16, slots=16)
+        self.addCleanup(store.close)
+        # keys starting to probe at the same slot take the following ones
+        keys = [key for key in map(str, range(1000))
+                if store._hash(key.encode()) % 16 == 0][:9]
+        for key in keys[:8]:
+            store[key] = value_of(key)
+        self.assertEqual([store[key] for key in keys[:8]],
+                         [value_of(key) for key in keys[:8]])
+        store[keys[0]] = 'new value'
+        self.assertEqual(len(store), 8)
+
+        # beyond the probed slots the oldest entry is dropped
+        store[keys[8]] = value_of(keys[8])
+        self.assertEqual([key in store for key in keys],
+                         [True, False] + [True] * 7)
+        self.assertEqual(store[keys[0]], 'new value')
+
+    def test_cache(self):
+        store = SharedMemoryStore(self.path, max_bytes=2 ** 16)
+        self.addCleanup(store.close)
+        with patch.object(Cache, '_get'), patch.object(Cache, '_set'), \
+                patch.object(Cache, '_serializer'):
+            Cache.use(store.__getitem__, store.__setitem__,
+                      MarshalSerializer())
+            Cache.set('url', {'data': {'id': 1}, 'entityTag': '"tag"'})
+            entry = Cache.get('url')
+        self.assertEqual((entry['data'], entry['entityTag']),
+                         ({'id': 1}, '"tag"'))
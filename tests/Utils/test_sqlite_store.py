@@ -0,0 +1,120 @@
+from datetime import timedelta
+from multiprocessing import get_context
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+import sqlite3
+import time
+
+from tests import IGittTestCase
+from IGitt.Utils import Cache
+from IGitt.Utils import MarshalSerializer
+from IGitt.Utils.SQLiteStore import SQLiteStore
+
+
+def write_entry(path):
+    SQLiteStore(path)['from another process'] = 'value'
+
+
+class WindowlessConnection:
+    """
+    Rejects window functions like SQLite before 3.25 does.
+    """
+
+    def __init__(self, connection):
+        self._connection = connection
+
+    def execute(self, sql, *args):
+        if ' OVER ' in sql.upper():
+            raise sqlite3.OperationalError('near "(": syntax error')
+        return self._connection.execute(sql, *args)
+
+    def executemany(self, sql, *args):
+        return self._connection.executemany(sql, *args)
+
+    def __enter__(self):
+        self._connection.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        return self._connection.__exit__(*exc_info)
+
+
+class SQLiteStoreTestCase(IGittTestCase):
+
+    def setUp(self):
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = join(directory.name, 'cache.db')
+
+    def test_store(self):
+        store = SQLiteStore(self.path, compress=True)
+        self.addCleanup(store.close)
+        store['text'] = 'ü' * 1000
+        store['bytes'] = b'\x00' * 1000
+        self.assertEqual(store['text'], 'ü' * 1000)
+        self.assertEqual(store['bytes'], b'\x00' * 1000)
+        self.assertIn('text', store)
+        self.assertEqual(len(store), 2)
+        # the entries are compressed
+        self.assertLess(store.size, 200)
+
+        del store['text']
+        self.assertNotIn('text', store)
+        with self.assertRaises(KeyError):
+            store['text']
+        with self.assertRaises(KeyError):
+            del store['text']
+        store.clear()
+        self.assertEqual(len(store), 0)
+
+    def test_shared_file(self):
+        store = SQLiteStore(self.path)
+        self.addCleanup(store.close)
+        store['key'] = 'value'
+        # the entries survive restarts and are shared between processes
+        self.assertEqual(SQLiteStore(self.path)['key'], 'value')
+        process = get_context('spawn').Process(target=write_entry,
+                                               args=(self.path, ))
+        process.start()
+        process.join()
+        self.assertEqual(store['from another process'], 'value')
+
+    def test_compaction(self):
+        now = time.time()
+        store = SQLiteStore(self.path, ttl=timedelta(minutes=1), max_bytes=10,
+                            compact_every=3)
+        self.addCleanup(store.close)
+        with patch('IGitt.Utils.SQLiteStore.time.time', lambda: now - 120):
+            store['expired'] = 'abc'
+        self.assertNotIn('expired', store)
+        self.assertEqual(len(store), 1)
+
+        # the oldest entries beyond the budget are dropped as well
+        with patch('IGitt.Utils.SQLiteStore.time.time', lambda: now - 1):
+            store['old'] = 'abcd'
+        store['new'] = 'abcdefg'
+        self.assertEqual(len(store), 1)
+        self.assertIn('new', store)
+
+        # older SQLite versions compact the same way
+        with patch.object(SQLiteStore, '_connection', property(
+                lambda store: WindowlessConnection(store._local.connection))):
+            store['newer'] = 'abc'
+            store['newest'] = 'abcdefg'
+            store.compact()
+        self.assertEqual(len(store), 2)
+        self.assertNotIn('new', store)
+        self.assertEqual(store['newest'], 'abcdefg')
+
+    def test_cache(self):
+        store = SQLiteStore(self.path)
+        self.addCleanup(store.close)
+        with patch.object(Cache, '_get'), patch.object(Cache, '_set'), \
+                patch.object(Cache, '_serializer'):
+            Cache.use(store.__getitem__, store.__setitem__,
+                      MarshalSerializer())
+            Cache.set('url', {'data': {'id': 1}, 'entityTag': '"tag"'})
+            entry = Cache.get('url')
+        self.assertEqual((entry['data'], entry['entityTag']),
+                         ({'id': 1}, '"tag"'))
@@ -7,11 +7,21 @@ import os
 from os.path import dirname
 from os.path import join
 from unittest import TestCase
+from unittest.mock import patch
+import asyncio
 import re
 
+from aiohttp.test_utils import TestServer
 from vcr import VCR
 import pytest
 
+from IGitt.Interfaces import AsyncSessionPool
+from IGitt.Interfaces import RateLimiter
+from IGitt.Interfaces import SessionPool
+from IGitt.Utils import ImmutableCache
+from IGitt.Utils import LRUDict
+from IGitt.Utils import NegativeCache
+
 
 FILTER_QUERY_PARAMS = ['access_token', 'private_token']
 FILTER_PARAMS_REGEX = re.compile(r'(\??)((?:{})=\w+&?)'.format(
@@ -55,6 +65,24 @@ for key, value in ENV_DEFAULTS.items():
     os.environ.setdefault(key, value)
 
 
+def serve(testcase: TestCase, app):
+    """
+    Serves the given aiohttp application locally for the duration of the
+    testcase, so that the asynchronous API can be tested without a cassette.
+    The testcase gets an event loop of its own as ``testcase.loop`` and the
+    URL of the server as ``testcase.url``; use ``vcr_options = {
+    'ignore_localhost': True}`` for it.
+    """
+    loop = testcase.loop = asyncio.new_event_loop()
+    testcase.addCleanup(loop.close)
+    server = TestServer(app, loop=loop)
+    loop.run_until_complete(server.start_server())
+    testcase.addCleanup(lambda: loop.run_until_complete(server.close()))
+    testcase.addCleanup(
+        lambda: loop.run_until_complete(AsyncSessionPool.close()))
+    testcase.url = str(server.make_url('')).rstrip('/')
+
+
 @pytest.mark.usefixtures('vcrpy_record_mode')
 class IGittTestCase(TestCase, metaclass=ABCMeta):
     """
@@ -125,6 +153,25 @@ class IGittTestCase(TestCase, metaclass=ABCMeta):
         """
         Common setup method for all inherited classes.
         """
+        # pooled connections must not outlive the cassette they were opened in
+        SessionPool.close()
+        # neither may the quotas of the recorded tokens
+        RateLimiter.clear()
+        # nor may the missing resources
+        NegativeCache.clear()
+        # nor may the immutable responses recorded in other cassettes
+        store = LRUDict(max_bytes=2 ** 20)
+        for name, function in (('_get', store.__getitem__),
+                               ('_set', store.put)):
+            store_patch = patch.object(ImmutableCache, name, function)
+            store_patch.start()
+            self.addCleanup(store_patch.stop)
+        # cassette playback isn't thread safe, send the requests one by one
+        for workers in ('IGitt.Interfaces.MAX_PAGE_WORKERS',
+                        'IGitt.Interfaces.MergeRequest.MAX_REFERENCE_WORKERS'):
+            workers_patch = patch(workers, 1)
+            workers_patch.start()
+            self.addCleanup(workers_patch.stop)
         context_manager = self.vcr.use_cassette(self.cassette_name)
         self.cassette = context_manager.__enter__()
         self.addCleanup(context_manager.__exit__, None, None, None)